@@ -0,0 +1,29 @@
+# helpers.py
+# Fábricas de jogadores e jogos compartilhadas pelos testes
+
+from war.enums import COLORS
+from war.game import Game
+from war.player import Player
+
+NAMES = ("Alice", "Bob", "Carol", "Dave", "Eve", "Frank")
+
+
+def make_players(count=3, bots=None):
+    """`count` jogadores humanos ou, com `bots`, um jogador por bot."""
+    if bots is None:
+        bots = [None] * count
+    return [Player(NAMES[i] if i < len(NAMES) else f"P{i}",
+                   COLORS[i % len(COLORS)], bot=bot)
+            for i, bot in enumerate(bots)]
+
+
+def new_game(seed=1, players=3, bots=None, turns=0):
+    """
+    Jogo headless com semente fixa; o primeiro jogador é o entregador.
+    Com `turns`, a partida é jogada por esse número de turnos antes.
+    """
+    seats = make_players(players, bots)
+    game = Game(seats, seats[0], seed=seed, headless=True)
+    if turns:
+        game.play_game(max_turns=turns)
+    return game
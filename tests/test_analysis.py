@@ -0,0 +1,107 @@
+# test_analysis.py
+# Testes para a análise estática do grafo do mapa
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from war import analysis as analysis_module
+from war.analysis import (MapAnalysis, UNREACHABLE, bfs_distances,
+                          cut_structure, map_analysis, topology_fingerprint)
+from war.topology import MapTopology
+from war.utils_data import load_map_data
+
+
+def line_topology():
+    # A - B - C - D, com D e E formando um triângulo com C
+    names = ['A', 'B', 'C', 'D', 'E', 'F']
+    borders = [['B'], ['A', 'C'], ['B', 'D', 'E'], ['C', 'E'], ['C', 'D'], []]
+    continents = ['X', 'X', 'X', 'Y', 'Y', 'Z']
+    return MapTopology(names, continents, borders)
+
+
+class TestGraphAlgorithms(unittest.TestCase):
+
+    def setUp(self):
+        self.topology = line_topology()
+        self.analysis = MapAnalysis(self.topology)
+
+    def test_distances(self):
+        self.assertEqual(self.analysis.distance(0, 0), 0)
+        self.assertEqual(self.analysis.distance(0, 3), 3)
+        self.assertEqual(self.analysis.distance(3, 4), 1)
+        self.assertEqual(self.analysis.distance(0, 5), UNREACHABLE)
+        self.assertEqual(list(self.analysis.distances_from(1)),
+                         [1, 0, 1, 2, 2, UNREACHABLE])
+
+    def test_articulation_points_and_bridges(self):
+        articulation, bridges = cut_structure(self.topology)
+        self.assertEqual(articulation, (1, 2))
+        self.assertEqual(bridges, ((0, 1), (1, 2)))
+        self.assertTrue(self.analysis.is_articulation_point(2))
+
+    def test_entry_points_and_depth(self):
+        self.assertEqual(self.analysis.entry_points[0], (2,))
+        self.assertEqual(self.analysis.entry_points[1], (3, 4))
+        self.assertEqual(list(self.analysis.border_distance[:3]), [2, 1, 0])
+
+    def test_frontier_depth(self):
+        owner = [0, 0, 0, 1, 1, 1]
+        depth = self.analysis.frontier_depth(owner, 0)
+        self.assertEqual(list(depth[:3]), [3, 2, 1])
+        self.assertEqual(list(bfs_distances(self.topology, [])),
+                         [UNREACHABLE] * 6)
+
+
+class TestRealMap(unittest.TestCase):
+
+    def setUp(self):
+        self.topology = MapTopology.from_map_data(load_map_data())
+
+    def test_symmetric_distances(self):
+        analysis = MapAnalysis(self.topology)
+        size = len(self.topology)
+        for a in range(size):
+            for b in self.topology.neighbors_of(a):
+                self.assertEqual(analysis.distance(a, b), 1)
+        brasil = self.topology.id_of('Brasil')
+        south_america = self.topology.continent_index['América do Sul']
+        self.assertIn(brasil, analysis.entry_points[south_america])
+
+    def test_persistence(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'map.analysis.json')
+            built = MapAnalysis.load_or_build(self.topology, path)
+            self.assertTrue(os.path.exists(path))
+            loaded = MapAnalysis.load(path, self.topology)
+            self.assertEqual(loaded.distances, built.distances)
+            self.assertEqual(loaded.entry_points, built.entry_points)
+            self.assertEqual(loaded.border_distance, built.border_distance)
+
+            # Outro mapa não aceita a análise gravada
+            with self.assertRaises(ValueError):
+                MapAnalysis.load(path, line_topology())
+            rebuilt = MapAnalysis.load_or_build(line_topology(), path)
+            self.assertEqual(rebuilt.size, 6)
+
+    def test_only_default_map_is_persisted(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'map.analysis.json')
+            with patch.object(analysis_module, 'DEFAULT_ANALYSIS_PATH', path):
+                topology = line_topology()
+                self.assertEqual(map_analysis(topology).size, 6)
+                self.assertFalse(os.path.exists(path))
+                self.assertIs(map_analysis(topology), map_analysis(topology))
+
+    def test_fingerprint(self):
+        self.assertEqual(topology_fingerprint(self.topology),
+                         topology_fingerprint(MapTopology.from_map_data(load_map_data())))
+        self.assertNotEqual(topology_fingerprint(self.topology),
+                            topology_fingerprint(line_topology()))
+        # Guardada na topologia depois do primeiro cálculo
+        self.assertEqual(self.topology._fingerprint,
+                         topology_fingerprint(self.topology))
+
+
+if __name__ == '__main__':
+    unittest.main()
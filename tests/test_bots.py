@@ -0,0 +1,173 @@
+# test_bots.py
+# Testes para a API de bots e os bots de referência
+
+import unittest
+from war.bots import GameView, Bot, RandomBot, GreedyBot, BorderDefenceBot
+from tests.helpers import new_game
+
+
+class TestGameView(unittest.TestCase):
+
+    def setUp(self):
+        self.game = new_game(seed=3, bots=(Bot(), Bot()))
+        self.players = self.game.players
+        self.view = GameView(self.game, self.players[0])
+
+    def test_view_is_read_only(self):
+        with self.assertRaises(TypeError):
+            self.view.troops[0] = 99
+        with self.assertRaises(TypeError):
+            self.view.owner[0] = 1
+
+    def test_view_reflects_state(self):
+        territory = self.players[0].territories[0]
+        territory.troops = 7
+        self.assertEqual(self.view.troops[territory.id], 7)
+        self.assertEqual(set(self.view.my_territories()),
+                         {t.id for t in self.players[0].territories})
+        self.assertEqual(self.view.territory_count(), len(self.players[0].territories))
+
+    def test_attack_options_are_legal(self):
+        for source, target in self.view.attack_options():
+            self.assertEqual(self.view.owner[source], self.view.player_index)
+            self.assertNotEqual(self.view.owner[target], self.view.player_index)
+            self.assertGreater(self.view.troops[source], 1)
+            self.assertTrue(self.game.topology.are_adjacent(source, target))
+
+
+class TestBots(unittest.TestCase):
+
+    def test_turn_with_bots(self):
+        for bot_class in (RandomBot, GreedyBot, BorderDefenceBot):
+            game = new_game(seed=3, bots=(bot_class(), bot_class()))
+            players = game.players
+            player = players[1]
+            troops_before = player.get_total_troops()
+            result = game.play_turn(player)
+            self.assertEqual(player.bot.decision_stats['place'][0], 1)
+            self.assertIn('attack', player.bot.decision_stats)
+            if result['territories_conquered'] == 0:
+                # Sem conquistas, só exércitos recebidos e perdas em combate
+                self.assertLessEqual(player.get_total_troops(),
+                                     troops_before + result['armies_placed'])
+
+    def test_full_game_is_reproducible(self):
+        results = []
+        for _ in range(2):
+            game = new_game(seed=11, bots=(GreedyBot(), RandomBot(),
+                                           BorderDefenceBot()))
+            players = game.players
+            result = game.play_game(max_turns=200)
+            results.append((result['turns'], result['territory_counts'],
+                            players.index(result['winner']) if result['winner'] else None))
+        self.assertEqual(results[0], results[1])
+
+    def test_invalid_placement_raises(self):
+        class CheatingBot(Bot):
+            def place(self, view, armies):
+                return [(view.my_territories()[0], armies + 5)]
+
+        game = new_game(seed=3, bots=(CheatingBot(), Bot()))
+        players = game.players
+        with self.assertRaises(ValueError):
+            game.phase_1_distribute_armies(players[0])
+
+    def test_actions_from_enemy_territory_raise(self):
+        def enemy_pair(view):
+            for source in range(len(view.owner)):
+                if view.owner[source] != view.player_index:
+                    return source, view.topology.neighbors_of(source)[0]
+
+        class HijackingBot(Bot):
+            def attack(self, view):
+                source, target = enemy_pair(view)
+                return source, target, 1
+
+            def fortify(self, view):
+                source, target = enemy_pair(view)
+                return source, target, 1
+
+        game = new_game(seed=3, bots=(HijackingBot(), Bot()))
+        players = game.players
+        troops = list(game.state.troops)
+        with self.assertRaises(ValueError):
+            game.phase_2_attack(players[0])
+        with self.assertRaises(ValueError):
+            game.phase_3_troop_movement(players[0])
+        self.assertEqual(list(game.state.troops), troops)
+
+    def test_negative_placement_count_raises(self):
+        class NegativeBot(Bot):
+            def place(self, view, armies):
+                first, second = view.my_territories()[:2]
+                return [(first, armies + 2), (second, -2)]
+
+        game = new_game(seed=3, bots=(NegativeBot(), Bot()))
+        troops = list(game.state.troops)
+        with self.assertRaises(ValueError):
+            game.phase_1_distribute_armies(game.players[0])
+        self.assertEqual(list(game.state.troops), troops)
+
+    def test_out_of_range_territory_ids_raise(self):
+        size = len(new_game(seed=3).territories)
+        for bad_id in (-1, size):
+            class OutOfRangeBot(Bot):
+                def place(self, view, armies):
+                    return [(bad_id, armies)]
+
+                def attack(self, view):
+                    return view.my_territories()[0], bad_id, 1
+
+                def fortify(self, view):
+                    return bad_id, view.my_territories()[0], 1
+
+            game = new_game(seed=3, bots=(OutOfRangeBot(), Bot()))
+            player = game.players[0]
+            with self.assertRaises(ValueError):
+                game.place_bot_armies(player, 3)
+            with self.assertRaises(ValueError):
+                game.phase_2_attack(player)
+            with self.assertRaises(ValueError):
+                game.phase_3_troop_movement(player)
+
+    def test_attacking_armies_out_of_range_raise(self):
+        game = new_game(seed=3)
+        for territory in game.territories:
+            territory.troops = 10
+        player_index = game.state.player_index(game.players[0])
+        _, source, target = next(game.move_generator().attacks(player_index))
+        for armies in (0, -1, 4):
+            class BadArmiesBot(Bot):
+                def attack(self, view):
+                    return source, target, armies
+
+            game.players[0].bot = BadArmiesBot()
+            with self.assertRaises(ValueError):
+                game.phase_2_attack(game.players[0])
+        with self.assertRaises(ValueError):
+            game.attack_territory(game.territories[source],
+                                  game.territories[target], 0)
+
+    def test_fortify_count_below_one_raises(self):
+        game = new_game(seed=3)
+        player = game.players[0]
+        source = player.territories[0]
+        source.troops = 5
+        with self.assertRaises(ValueError):
+            game.fortify(source, player.territories[1], 0)
+        with self.assertRaises(ValueError):
+            game.fortify(source, player.territories[1], -3)
+
+    def test_latency_and_budget(self):
+        bot = GreedyBot(time_budget_ms=0)
+        game = new_game(seed=3, bots=(bot, Bot()))
+        players = game.players
+        game.play_turn(players[0])
+        self.assertGreater(bot.mean_latency_ms('attack'), 0.0)
+        self.assertGreater(bot.budget_overruns, 0)
+        calls, total, slowest = bot.decision_stats['attack']
+        self.assertLessEqual(slowest, total)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+# test_dice.py
+# Testes para os dados em lote e o combate
+
+import random
+import unittest
+from war.dice import DiceSource, compare_rolls, battle_round
+
+
+class TestDiceSource(unittest.TestCase):
+
+    def test_roll_values_and_size(self):
+        dice = DiceSource(buffer_size=8)
+        for quantity in (0, 1, 3, 5, 20):
+            rolls = dice.roll(quantity)
+            self.assertEqual(len(rolls), quantity)
+            for value in rolls:
+                self.assertIn(value, range(1, 7))
+
+    def test_negative_quantity(self):
+        self.assertEqual(DiceSource().roll(-2), [])
+
+    def test_roll_one(self):
+        dice = DiceSource(buffer_size=2)
+        values = [dice.roll_one() for _ in range(10)]
+        self.assertTrue(all(1 <= v <= 6 for v in values))
+
+    def test_same_seed_same_rolls(self):
+        a = DiceSource(random.Random(42))
+        b = DiceSource(random.Random(42))
+        self.assertEqual(a.roll(50), b.roll(50))
+
+    def test_buffer_draws_in_bulk(self):
+        class CountingRandom(random.Random):
+            calls = 0
+
+            def choices(self, *args, **kwargs):
+                CountingRandom.calls += 1
+                return super().choices(*args, **kwargs)
+
+        dice = DiceSource(CountingRandom(1), buffer_size=100)
+        for _ in range(30):
+            dice.roll(3)
+        self.assertEqual(CountingRandom.calls, 1)
+
+
+class TestCombat(unittest.TestCase):
+
+    def test_compare_rolls_sorted_pairs(self):
+        # [6, 4, 1] contra [5, 4]: 6>5 e 4=4 (empate favorece a defesa)
+        self.assertEqual(compare_rolls([1, 4, 6], [4, 5]), (1, 1))
+
+    def test_compare_rolls_uses_fewest_dice(self):
+        self.assertEqual(compare_rolls([2, 2, 2], [1]), (0, 1))
+        self.assertEqual(compare_rolls([1], [6, 6]), (1, 0))
+
+    def test_battle_round_dice_limits(self):
+        class FixedDice:
+            def roll(self, quantity):
+                self.quantity = quantity
+                return [6] * quantity
+
+        dice = FixedDice()
+        battle_round(dice, 10, 10)
+        self.assertEqual(dice.quantity, 5)
+        battle_round(dice, 1, 1)
+        self.assertEqual(dice.quantity, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+# test_events.py
+# Testes para o barramento de eventos do motor
+
+import unittest
+from war.events import (EventBus, OWNERSHIP_CHANGED, TROOPS_CHANGED,
+                        PLAYER_ELIMINATED, PHASE_CHANGED)
+from war.enums import PHASE_ATTACK, PHASE_PLACE_ARMIES
+from war.game import Game
+from war.player import Player
+
+
+class TestEventBus(unittest.TestCase):
+
+    def test_inactive_without_subscribers(self):
+        bus = EventBus()
+        self.assertFalse(bus.active)
+        self.assertFalse(bus.ownership_changed)
+
+    def test_subscribe_emit_unsubscribe(self):
+        bus = EventBus()
+        received = []
+        handler = bus.subscribe(TROOPS_CHANGED, lambda *args: received.append(args))
+        self.assertTrue(bus.active)
+        self.assertTrue(bus.troops_changed)
+        self.assertFalse(bus.ownership_changed)
+
+        bus.emit(TROOPS_CHANGED, 0, 1, 2)
+        self.assertEqual(received, [(0, 1, 2)])
+
+        bus.unsubscribe(TROOPS_CHANGED, handler)
+        self.assertFalse(bus.active)
+
+    def test_unknown_event(self):
+        with self.assertRaises(ValueError):
+            EventBus().subscribe('inexistente', print)
+
+
+class TestGameEvents(unittest.TestCase):
+
+    def setUp(self):
+        self.alice = Player("Alice", "Azul")
+        self.bob = Player("Bob", "Vermelho")
+        self.game = Game([self.alice, self.bob], self.alice)
+        self.received = []
+
+    def record(self, event_type):
+        self.game.events.subscribe(
+            event_type, lambda *args: self.received.append((event_type,) + args))
+
+    def test_troops_and_ownership_events(self):
+        self.record(TROOPS_CHANGED)
+        self.record(OWNERSHIP_CHANGED)
+        territory = self.alice.territories[0]
+
+        self.game.place_armies(self.alice, territory.name, 2)
+        territory.owner = self.bob
+
+        self.assertEqual(self.received, [
+            (TROOPS_CHANGED, territory.id, 1, 3),
+            (OWNERSHIP_CHANGED, territory.id, self.alice.index, self.bob.index),
+        ])
+
+    def test_phase_changed(self):
+        self.record(PHASE_CHANGED)
+        self.game.set_phase(self.alice, PHASE_ATTACK)
+        self.assertEqual(self.received,
+                         [(PHASE_CHANGED, self.alice, PHASE_PLACE_ARMIES, PHASE_ATTACK)])
+        self.assertEqual(self.game.phase, PHASE_ATTACK)
+
+    def test_player_eliminated(self):
+        self.record(PLAYER_ELIMINATED)
+        # Deixa Bob com um único território vizinho a um território de Alice
+        target = None
+        for territory in list(self.bob.territories):
+            if target is None and any(
+                    t.is_adjacent_to(territory) for t in self.alice.territories):
+                target = territory
+                continue
+            self.bob.territories.remove(territory)
+            territory.owner = self.alice
+            self.alice.territories.append(territory)
+        attacker = next(t for t in self.alice.territories if t.is_adjacent_to(target))
+        attacker.troops = 10
+        target.troops = 1
+        self.game.dice.roll = lambda quantity: [6] * (quantity - 1) + [1]
+
+        self.game.attack_territory(attacker, target, 5)
+
+        self.assertEqual(self.received, [(PLAYER_ELIMINATED, self.bob, self.alice)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+# test_fork.py
+# Testes para snapshots, desfazer e bifurcação de jogos
+
+import unittest
+from war.bots import GreedyBot
+from tests.helpers import new_game
+
+
+def board(game):
+    return (list(game.state.owner), list(game.state.troops),
+            [sorted(t.id for t in p.territories) for p in game.players],
+            [list(p.cards) for p in game.players], list(game.deck.cards))
+
+
+def enemy_pair(game):
+    return next((t, n) for t in game.territories for n in game.territories
+                if t.is_adjacent_to(n) and t.owner is not n.owner)
+
+
+class BotGameCase(unittest.TestCase):
+    """Partida de três bots gulosos, já com alguns turnos jogados."""
+
+    def setUp(self):
+        self.game = new_game(bots=[GreedyBot() for _ in range(3)], turns=5)
+
+
+class TestSnapshot(BotGameCase):
+
+    def test_restore_returns_to_snapshot(self):
+        game = self.game
+        before = board(game)
+        snapshot = game.snapshot()
+        game.play_game(max_turns=10)
+        self.assertNotEqual(board(game), before)
+        game.restore(snapshot)
+        self.assertEqual(board(game), before)
+
+    def test_restore_replays_exactly(self):
+        game = self.game
+        snapshot = game.snapshot()
+        first = game.play_game(max_turns=20)['territory_counts']
+        game.restore(snapshot)
+        self.assertEqual(game.play_game(max_turns=20)['territory_counts'], first)
+
+
+class TestUndo(BotGameCase):
+
+    def test_undo_conquest(self):
+        game = self.game
+        attacker, defender = enemy_pair(game)
+        attacker.troops = 30
+        defender.troops = 1
+        before = board(game)
+        old_owner = defender.owner
+
+        mark = game.mark()
+        while defender.owner is old_owner:
+            game.attack_territory(attacker, defender, 3)
+        self.assertIn(defender, attacker.owner.territories)
+        game.undo(mark)
+
+        self.assertEqual(board(game), before)
+        self.assertIs(defender.owner, old_owner)
+        self.assertIn(defender, old_owner.territories)
+        self.assertIsNone(game.state.journal)
+
+
+class TestFork(BotGameCase):
+
+    def test_fork_is_independent(self):
+        game = self.game
+        before = board(game)
+        fork = game.fork()
+        self.assertEqual(board(fork), before)
+        fork.play_game(max_turns=10)
+        self.assertEqual(board(game), before)
+        self.assertIsNot(fork.players[0], game.players[0])
+        self.assertIs(fork.topology, game.topology)
+        self.assertIs(fork.map_data, game.map_data)
+
+    def test_fork_territories_are_views_of_fork(self):
+        game = self.game
+        fork = game.fork()
+        territory = fork.territories[0]
+        self.assertIs(territory.owner, fork.players[game.territories[0].owner.index])
+        territory.troops = 50
+        self.assertNotEqual(game.territories[0].troops, 50)
+        self.assertIn(territory, territory.owner.territories)
+
+    def test_fork_replays_original(self):
+        game = self.game
+        fork = game.fork()
+        self.assertEqual(fork.play_game(max_turns=20)['territory_counts'],
+                         game.play_game(max_turns=20)['territory_counts'])
+
+
+if __name__ == '__main__':
+    unittest.main()
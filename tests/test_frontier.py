@@ -0,0 +1,78 @@
+# test_frontier.py
+# Testes para as fronteiras mantidas incrementalmente
+
+import unittest
+from war.frontier import FrontierIndex
+from war.bots import GameView
+from war.rng import GameRandom
+from tests.helpers import new_game
+
+
+def scan(game, player):
+    frontier, interior = [], []
+    for territory in game.territories:
+        if territory.owner is player:
+            if any(n.owner is not player for n in game.territories
+                   if n.name in territory.borders):
+                frontier.append(territory.id)
+            else:
+                interior.append(territory.id)
+    return sorted(frontier), sorted(interior)
+
+
+class TestFrontierIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.game = new_game(seed=9)
+        self.index = self.game.frontier_index()
+
+    def assert_matches_scan(self):
+        for player in self.game.players:
+            player_index = self.game.state.player_index(player)
+            self.assertEqual(
+                (self.index.frontier(player_index),
+                 self.index.interior(player_index)),
+                scan(self.game, player))
+
+    def test_initial_state(self):
+        self.assert_matches_scan()
+
+    def test_incremental_updates(self):
+        rng = GameRandom(4)
+        for step in range(300):
+            territory = rng.choice(self.game.territories)
+            territory.owner.territories.remove(territory)
+            territory.owner = rng.choice(self.game.players)
+            territory.owner.territories.append(territory)
+            if step % 50 == 0:
+                self.assert_matches_scan()
+        self.assert_matches_scan()
+
+    def test_conquest_updates_frontier(self):
+        game = self.game
+        attacker, defender = next(
+            (t, n) for t in game.territories for n in game.territories
+            if t.is_adjacent_to(n) and t.owner is not n.owner)
+        attacker.troops = 40
+        while not game.attack_territory(attacker, defender, 3):
+            pass
+        self.assert_matches_scan()
+
+    def test_everything_owned_is_interior(self):
+        alice = self.game.players[0]
+        for territory in self.game.territories:
+            territory.owner = alice
+        self.assertEqual(self.index.frontier(0), [])
+        self.assertEqual(len(self.index.interior(0)), len(self.game.territories))
+        self.assertEqual(self.index.frontier_size(1), 0)
+
+    def test_shared_and_used_by_views(self):
+        self.assertIs(self.game.frontier_index(), self.index)
+        view = GameView(self.game, self.game.players[0])
+        self.assertEqual(view.frontier(), self.index.frontier(0))
+        self.assertEqual(view.interior(), self.index.interior(0))
+        FrontierIndex(self.game.state).close()
+
+
+if __name__ == '__main__':
+    unittest.main()
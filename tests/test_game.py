@@ -49,6 +49,9 @@ class TestGame(unittest.TestCase):
             'territories': [
                 {'name': 'Brasil', 'continent': 'América do Sul', 'borders': ['Argentina'], 'symbol': 'quadrado'},
                 {'name': 'Argentina', 'continent': 'América do Sul', 'borders': ['Brasil'], 'symbol': 'círculo'}
+            ],
+            'continents': [
+                {'name': 'América do Sul', 'territories': ['Brasil', 'Argentina']}
             ]
         }
         mock_missions.return_value = [
@@ -72,6 +75,10 @@ class TestGame(unittest.TestCase):
                 {'name': 'Brasil', 'continent': 'América do Sul', 'symbol': 'quadrado'},
                 {'name': 'Argentina', 'continent': 'América do Sul', 'symbol': 'círculo'},
                 {'name': 'França', 'continent': 'Europa', 'symbol': 'triângulo'}
+            ],
+            'continents': [
+                {'name': 'América do Sul', 'territories': ['Brasil', 'Argentina']},
+                {'name': 'Europa', 'territories': ['França']}
             ]
         }
         mock_missions.return_value = [
@@ -105,6 +112,9 @@ class TestGame(unittest.TestCase):
         mock_map.return_value = {
             'territories': [
                 {'name': 'Brasil', 'continent': 'América do Sul', 'borders': [], 'symbol': 'quadrado'}
+            ],
+            'continents': [
+                {'name': 'América do Sul', 'territories': ['Brasil']}
             ]
         }
         mock_missions.return_value = [
@@ -129,6 +139,9 @@ class TestGame(unittest.TestCase):
             'territories': [
                 {'name': f'T{i}', 'continent': 'C', 'borders': [], 'symbol': 'quadrado'}
                 for i in range(10)
+            ],
+            'continents': [
+                {'name': 'C', 'territories': [f'T{i}' for i in range(10)]}
             ]
         }
         mock_missions.return_value = [{'id': 1, 'description': 'M1'}, {'id': 2, 'description': 'M2'}]
@@ -173,6 +186,9 @@ class TestGame(unittest.TestCase):
         mock_map.return_value = {
             'territories': [
                 {'name': 'Brasil', 'continent': 'América do Sul', 'borders': [], 'symbol': 'quadrado'}
+            ],
+            'continents': [
+                {'name': 'América do Sul', 'territories': ['Brasil']}
             ]
         }
         mock_missions.return_value = [{'id': 1, 'description': 'M1'}, {'id': 2, 'description': 'M2'}]
@@ -191,6 +207,9 @@ class TestGame(unittest.TestCase):
             'territories': [
                 {'name': 'Brasil', 'continent': 'América do Sul', 'borders': ['Argentina'], 'symbol': 'quadrado'},
                 {'name': 'Argentina', 'continent': 'América do Sul', 'borders': ['Brasil'], 'symbol': 'círculo'}
+            ],
+            'continents': [
+                {'name': 'América do Sul', 'territories': ['Brasil', 'Argentina']}
             ]
         }
         mock_missions.return_value = [{'id': 1, 'description': 'M1'}, {'id': 2, 'description': 'M2'}]
@@ -208,12 +227,54 @@ class TestGame(unittest.TestCase):
         argentina.troops = 1
         self.player2.territories.append(argentina)
         
-        # Realiza ataque (com tropas suficientes, deve conquistar)
+        # Dados fixos: 3 dados de ataque contra 1 de defesa
+        game.dice = MagicMock()
+        game.dice.roll.return_value = [6, 5, 4, 3]
+
+        # Realiza ataque (atacante vence a única comparação e conquista)
         result = game.attack_territory(brasil, argentina, 5)
         
         # Verifica se foi bem-sucedido
+        game.dice.roll.assert_called_once_with(4)
         self.assertTrue(result)
         self.assertEqual(argentina.owner, self.player1)
+        self.assertEqual(argentina.troops, 5)
+        self.assertEqual(brasil.troops, 5)
+
+    @patch('war.game.load_map_data')
+    @patch('war.game.load_missions')
+    def test_attack_territory_defense_wins_ties(self, mock_missions, mock_map):
+        """Testa que empates favorecem a defesa e as perdas valem para os dois lados."""
+        mock_map.return_value = {
+            'territories': [
+                {'name': 'Brasil', 'continent': 'América do Sul', 'borders': ['Argentina'], 'symbol': 'quadrado'},
+                {'name': 'Argentina', 'continent': 'América do Sul', 'borders': ['Brasil'], 'symbol': 'círculo'}
+            ],
+            'continents': [
+                {'name': 'América do Sul', 'territories': ['Brasil', 'Argentina']}
+            ]
+        }
+        mock_missions.return_value = [{'id': 1, 'description': 'M1'}, {'id': 2, 'description': 'M2'}]
+
+        game = Game(self.players, self.dealer)
+
+        brasil = Territory('Brasil', 'América do Sul', ['Argentina'])
+        brasil.owner = self.player1
+        brasil.troops = 10
+        argentina = Territory('Argentina', 'América do Sul', ['Brasil'])
+        argentina.owner = self.player2
+        argentina.troops = 4
+
+        # Ataque [6, 3, 1] contra defesa [5, 3]: 6>5 ganha, 3=3 perde
+        game.dice = MagicMock()
+        game.dice.roll.return_value = [3, 6, 1, 3, 5]
+
+        result = game.attack_territory(brasil, argentina, 3)
+
+        self.assertFalse(result)
+        self.assertEqual(brasil.troops, 9)
+        self.assertEqual(argentina.troops, 3)
+        self.assertEqual(argentina.owner, self.player2)
 
     @patch('war.game.load_map_data')
     @patch('war.game.load_missions')
@@ -223,6 +284,9 @@ class TestGame(unittest.TestCase):
             'territories': [
                 {'name': 'Brasil', 'continent': 'América do Sul', 'borders': ['Argentina'], 'symbol': 'quadrado'},
                 {'name': 'Argentina', 'continent': 'América do Sul', 'borders': ['Brasil'], 'symbol': 'círculo'}
+            ],
+            'continents': [
+                {'name': 'América do Sul', 'territories': ['Brasil', 'Argentina']}
             ]
         }
         mock_missions.return_value = [{'id': 1, 'description': 'M1'}, {'id': 2, 'description': 'M2'}]
@@ -248,8 +312,12 @@ class TestGame(unittest.TestCase):
         """Testa que não é possível atacar território não adjacente."""
         mock_map.return_value = {
             'territories': [
-                {'name': 'Brasil', 'continent': 'América do Sul', 'borders': ['Argentina'], 'symbol': 'quadrado'},
+                {'name': 'Brasil', 'continent': 'América do Sul', 'borders': [], 'symbol': 'quadrado'},
                 {'name': 'Japão', 'continent': 'Ásia', 'borders': [], 'symbol': 'círculo'}
+            ],
+            'continents': [
+                {'name': 'América do Sul', 'territories': ['Brasil']},
+                {'name': 'Ásia', 'territories': ['Japão']}
             ]
         }
         mock_missions.return_value = [{'id': 1, 'description': 'M1'}, {'id': 2, 'description': 'M2'}]
@@ -277,6 +345,9 @@ class TestGame(unittest.TestCase):
             'territories': [
                 {'name': 'Brasil', 'continent': 'América do Sul', 'borders': ['Argentina'], 'symbol': 'quadrado'},
                 {'name': 'Argentina', 'continent': 'América do Sul', 'borders': ['Brasil'], 'symbol': 'círculo'}
+            ],
+            'continents': [
+                {'name': 'América do Sul', 'territories': ['Brasil', 'Argentina']}
             ]
         }
         mock_missions.return_value = [{'id': 1, 'description': 'M1'}, {'id': 2, 'description': 'M2'}]
@@ -305,6 +376,9 @@ class TestGame(unittest.TestCase):
             'territories': [
                 {'name': 'Brasil', 'continent': 'América do Sul', 'borders': ['Argentina'], 'symbol': 'quadrado'},
                 {'name': 'Argentina', 'continent': 'América do Sul', 'borders': ['Brasil'], 'symbol': 'círculo'}
+            ],
+            'continents': [
+                {'name': 'América do Sul', 'territories': ['Brasil', 'Argentina']}
             ]
         }
         mock_missions.return_value = [{'id': 1, 'description': 'M1'}, {'id': 2, 'description': 'M2'}]
@@ -331,6 +405,9 @@ class TestGame(unittest.TestCase):
         mock_map.return_value = {
             'territories': [
                 {'name': 'Brasil', 'continent': 'América do Sul', 'borders': [], 'symbol': 'quadrado'}
+            ],
+            'continents': [
+                {'name': 'América do Sul', 'territories': ['Brasil']}
             ]
         }
         mock_missions.return_value = [{'id': 1, 'description': 'M1'}, {'id': 2, 'description': 'M2'}]
@@ -354,6 +431,9 @@ class TestGame(unittest.TestCase):
             'territories': [
                 {'name': 'Brasil', 'continent': 'América do Sul', 'borders': [], 'symbol': 'quadrado'},
                 {'name': 'Argentina', 'continent': 'América do Sul', 'borders': [], 'symbol': 'círculo'}
+            ],
+            'continents': [
+                {'name': 'América do Sul', 'territories': ['Brasil', 'Argentina']}
             ]
         }
         mock_missions.return_value = [{'id': 1, 'description': 'M1'}, {'id': 2, 'description': 'M2'}]
@@ -0,0 +1,82 @@
+# test_headless.py
+# Testes para o modo headless (sem saída no console)
+
+import logging
+import unittest
+from unittest.mock import patch
+from war.game import Game
+from war.player import Player
+from war.events import PHASE_CHANGED
+from war.enums import PHASE_PLACE_ARMIES, PHASE_ATTACK, PHASE_MOVE, PHASE_DRAW_CARD
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class TestHeadless(unittest.TestCase):
+
+    def setUp(self):
+        self.players = [Player("Alice", "Azul"), Player("Bob", "Vermelho")]
+
+    @patch('builtins.print')
+    def test_headless_turn_does_not_print(self, mock_print):
+        game = Game(self.players, self.players[0], seed=1, headless=True)
+        result = game.play_turn(self.players[1])
+        mock_print.assert_not_called()
+        self.assertIn('armies_placed', result)
+
+    @patch('builtins.print')
+    def test_console_mode_still_prints(self, mock_print):
+        game = Game(self.players, self.players[0], seed=1)
+        game.play_turn(self.players[1])
+        mock_print.assert_called()
+
+    @patch('builtins.print')
+    def test_logger_respects_level(self, mock_print):
+        logger = logging.getLogger('war.test_headless')
+        logger.propagate = False
+        handler = ListHandler()
+        logger.addHandler(handler)
+        try:
+            logger.setLevel(logging.INFO)
+            game = Game(self.players, self.players[0], seed=1,
+                        headless=True, logger=logger)
+            game.play_turn(self.players[1])
+            self.assertTrue(any('Bob recebe' in m for m in handler.messages))
+            self.assertFalse(any('Etapa 2' in m for m in handler.messages))
+
+            handler.messages.clear()
+            logger.setLevel(logging.WARNING)
+            game.play_turn(self.players[1])
+            self.assertEqual(handler.messages, [])
+        finally:
+            logger.removeHandler(handler)
+        mock_print.assert_not_called()
+
+    def test_play_turn_emits_phases(self):
+        game = Game(self.players, self.players[0], seed=1, headless=True)
+        phases = []
+        game.events.subscribe(PHASE_CHANGED, lambda player, old, new: phases.append(new))
+        game.play_turn(self.players[1])
+        self.assertEqual(phases, [PHASE_PLACE_ARMIES, PHASE_ATTACK,
+                                  PHASE_MOVE, PHASE_DRAW_CARD])
+
+    @patch('builtins.print')
+    def test_play_game_structured_result(self, mock_print):
+        game = Game(self.players, self.players[0], seed=1, headless=True)
+        result = game.play_game(max_turns=6)
+        mock_print.assert_not_called()
+        self.assertEqual(result['turns'], 6)
+        self.assertFalse(result['finished'])
+        self.assertIsNone(result['winner'])
+        self.assertEqual(sum(result['territory_counts']), len(game.territories))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,222 @@
+# test_mapfile.py
+# Testes para o formato binário compilado do mapa
+
+import copy
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from war.game import Game, GameTemplate
+from war.mapfile import (CompiledMap, compile_map, load_or_compile, main,
+                         validate_map_data)
+from war.player import Player
+from war.topology import MapTopology
+from war.utils_data import load_compiled_map, load_map_data, load_topology
+
+
+def small_map():
+    return {
+        'continents': [
+            {'name': 'América do Sul', 'territories': ['Brasil', 'Argentina']},
+            {'name': 'África', 'territories': ['Argélia']},
+        ],
+        'territories': [
+            {'name': 'Brasil', 'continent': 'América do Sul',
+             'borders': ['Argentina', 'Argélia'], 'symbol': 'quadrado'},
+            {'name': 'Argentina', 'continent': 'América do Sul',
+             'borders': ['Brasil'], 'symbol': 'círculo'},
+            {'name': 'Argélia', 'continent': 'África',
+             'borders': ['Brasil'], 'symbol': 'quadrado'},
+        ],
+    }
+
+
+MISSIONS = [{'id': 1, 'description': "Conquistar 3 territórios"},
+            {'id': 2, 'description': "Conquistar 3 territórios"}]
+
+
+class TestValidation(unittest.TestCase):
+
+    def test_real_map_is_valid(self):
+        self.assertEqual(validate_map_data(load_map_data()), [])
+
+    def test_asymmetric_border(self):
+        data = small_map()
+        data['territories'][1]['borders'] = []
+        problems = validate_map_data(data)
+        self.assertEqual(len(problems), 1)
+        self.assertIn('Brasil -> Argentina', problems[0])
+
+    def test_unknown_border_and_duplicate_name(self):
+        data = small_map()
+        data['territories'][0]['borders'].append('Atlântida')
+        data['territories'].append(dict(data['territories'][2]))
+        problems = validate_map_data(data)
+        self.assertTrue(any('Atlântida' in p for p in problems))
+        self.assertTrue(any('repetido' in p for p in problems))
+
+    def test_continent_coverage(self):
+        data = small_map()
+        data['continents'][1]['territories'] = []
+        data['continents'][0]['territories'].append('Argélia')
+        problems = validate_map_data(data)
+        self.assertEqual(len(problems), 1)
+        self.assertIn('diverge', problems[0])
+
+        data['continents'][0]['territories'].remove('Argélia')
+        self.assertIn('Argélia: não pertence a nenhum continente',
+                      validate_map_data(data))
+
+    def test_compile_rejects_invalid_map(self):
+        data = small_map()
+        del data['continents']
+        with self.assertRaises(ValueError):
+            compile_map(data)
+        # Sem validação o mapa ainda compila (usado para mapas de teste)
+        self.assertEqual(len(CompiledMap.from_map_data(data, validate=False)), 3)
+
+
+class TestCompiledMap(unittest.TestCase):
+
+    def setUp(self):
+        self.map_data = load_map_data()
+        self.compiled = CompiledMap.from_map_data(self.map_data)
+
+    def test_round_trip_matches_json(self):
+        territories = self.map_data['territories']
+        self.assertEqual(list(self.compiled.names),
+                         [t['name'] for t in territories])
+        for territory_id, territory in enumerate(territories):
+            self.assertEqual(self.compiled.borders[territory_id],
+                             territory['borders'])
+            self.assertEqual(self.compiled.symbol(territory_id),
+                             territory['symbol'])
+            continent = self.compiled.continent_of[territory_id]
+            self.assertEqual(self.compiled.continent_names[continent],
+                             territory['continent'])
+
+    def test_topology_matches_json_topology(self):
+        expected = MapTopology.from_map_data(self.map_data)
+        topology = self.compiled.topology
+        self.assertEqual(topology.names, expected.names)
+        self.assertEqual(topology.continent_names, expected.continent_names)
+        self.assertEqual(topology.offsets, expected.offsets)
+        self.assertEqual(topology.neighbors, expected.neighbors)
+        self.assertEqual(topology.continent_of, expected.continent_of)
+        for a in range(len(expected)):
+            self.assertEqual(topology.neighbors_of(a), expected.neighbors_of(a))
+            for b in range(len(expected)):
+                self.assertEqual(topology.are_adjacent(a, b),
+                                 expected.are_adjacent(a, b))
+
+    def test_continent_index(self):
+        for continent in self.map_data['continents']:
+            continent_id = self.compiled.topology.continent_index[continent['name']]
+            names = [self.compiled.names[t] for t
+                     in self.compiled.territories_in_continent(continent_id)]
+            self.assertEqual(sorted(names), sorted(continent['territories']))
+
+    def test_borders_are_read_only(self):
+        with self.assertRaises(TypeError):
+            self.compiled.borders[0].append('Atlântida')
+
+    def test_corrupted_artifacts_are_rejected(self):
+        data = compile_map(small_map())
+        self.assertEqual(len(CompiledMap.from_bytes(data)), 3)
+        for broken in (data[:-1], b'XXXXXXXX' + data[8:],
+                       data[:-1] + bytes([data[-1] ^ 1]),
+                       data[:8] + b'\x63\x00' + data[10:]):
+            with self.assertRaises(ValueError):
+                CompiledMap.from_bytes(broken)
+
+
+class TestLoadOrCompile(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.source = Path(self.tmp.name) / 'map.json'
+        self.target = Path(self.tmp.name) / 'map.bin'
+        self.source.write_text(json.dumps(small_map()), encoding='utf-8')
+
+    def test_compiles_once_and_reuses_artifact(self):
+        first = load_or_compile(self.source, self.target)
+        self.assertTrue(self.target.exists())
+        stat = os.stat(self.source)
+        self.assertEqual(first.source_stamp, (stat.st_mtime_ns, stat.st_size))
+        written = os.stat(self.target).st_mtime_ns
+        load_or_compile(self.source, self.target)
+        self.assertEqual(os.stat(self.target).st_mtime_ns, written)
+
+    def test_recompiles_when_source_changes(self):
+        load_or_compile(self.source, self.target)
+        data = small_map()
+        data['territories'][2]['symbol'] = 'triângulo'
+        self.source.write_text(json.dumps(data), encoding='utf-8')
+        stat = os.stat(self.source)
+        os.utime(self.source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertEqual(load_or_compile(self.source, self.target).symbol(2),
+                         'triângulo')
+
+    def test_artifact_without_source(self):
+        load_or_compile(self.source, self.target)
+        self.source.unlink()
+        self.assertEqual(len(load_or_compile(self.source, self.target)), 3)
+
+    def test_invalid_source_fails_at_compile_time(self):
+        data = small_map()
+        data['territories'][1]['borders'] = []
+        self.source.write_text(json.dumps(data), encoding='utf-8')
+        with self.assertRaises(ValueError):
+            load_or_compile(self.source, self.target)
+        self.assertFalse(self.target.exists())
+
+    def test_command_line(self):
+        with redirect_stdout(io.StringIO()) as output:
+            main([str(self.source), str(self.target)])
+        self.assertIn('3 territórios', output.getvalue())
+        self.assertEqual(CompiledMap.load(self.target).names,
+                         ('Brasil', 'Argentina', 'Argélia'))
+
+
+class TestGameUsesCompiledMap(unittest.TestCase):
+
+    def test_game_shares_compiled_map(self):
+        players = [Player("A", "Azul"), Player("B", "Vermelho")]
+        game = Game(players, players[0], seed=1)
+        self.assertIs(game.map, load_compiled_map())
+        self.assertIs(game.topology, load_topology())
+        self.assertIs(copy.deepcopy(game.territories[0].borders),
+                      game.map.borders[0])
+        self.assertEqual([c.symbol for c in game.cards],
+                         [t['symbol'] for t in load_map_data()['territories']])
+
+    def test_template_from_compiled_map(self):
+        game_map = CompiledMap.from_map_data(small_map())
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'custom.bin'
+            path.write_bytes(compile_map(small_map()))
+            from_path = GameTemplate.from_compiled(path, MISSIONS)
+        template = GameTemplate.from_compiled(game_map, MISSIONS)
+        self.assertIs(template.map, game_map)
+        self.assertEqual(from_path.map.names, game_map.names)
+        self.assertEqual(template.map_data['territories'][0]['borders'],
+                         ['Argentina', 'Argélia'])
+        self.assertEqual(validate_map_data(template.map_data), [])
+        players = [Player("A", "Azul"), Player("B", "Vermelho")]
+        game = from_path.new_game(players, players[0], seed=1, headless=True)
+        self.assertEqual(sorted(t.name for t in game.territories),
+                         sorted(game_map.names))
+
+    def test_custom_map_is_validated(self):
+        data = small_map()
+        data['territories'][1]['borders'] = []
+        with self.assertRaises(ValueError):
+            GameTemplate(data, MISSIONS)
+
+
+if __name__ == '__main__':
+    unittest.main()
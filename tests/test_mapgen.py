@@ -0,0 +1,120 @@
+# test_mapgen.py
+# Testes para o gerador de mapas sintéticos e o benchmark de escala
+
+import json
+import os
+import tempfile
+import unittest
+from collections import Counter, deque
+from war.benchmark import benchmark_missions, format_row, run_benchmark
+from war.game import GameTemplate
+from war.mapfile import validate_map_data
+from war.mapgen import generate_map, main
+from war.player import Player
+
+
+def connected(names, borders):
+    """Os territórios `names` formam uma região conexa pelas fronteiras?"""
+    names = set(names)
+    start = next(iter(names))
+    seen = {start}
+    queue = deque([start])
+    while queue:
+        for neighbor in borders[queue.popleft()]:
+            if neighbor in names and neighbor not in seen:
+                seen.add(neighbor)
+                queue.append(neighbor)
+    return seen == names
+
+
+class TestGenerateMap(unittest.TestCase):
+
+    def test_generated_maps_are_valid(self):
+        for size, degree in ((2, 1.0), (42, 4.0), (300, 2.5), (1000, 6.0)):
+            map_data = generate_map(size, average_degree=degree, seed=size)
+            self.assertEqual(validate_map_data(map_data), [])
+            self.assertEqual(len(map_data['territories']), size)
+
+    def test_average_degree_and_connectivity(self):
+        map_data = generate_map(500, average_degree=4.5, seed=1)
+        borders = {t['name']: t['borders'] for t in map_data['territories']}
+        degree = sum(len(b) for b in borders.values()) / len(borders)
+        self.assertAlmostEqual(degree, 4.5, delta=0.01)
+        self.assertTrue(connected(borders, borders))
+
+    def test_continents_are_contiguous(self):
+        map_data = generate_map(400, continents=9, seed=2)
+        borders = {t['name']: t['borders'] for t in map_data['territories']}
+        self.assertEqual(len(map_data['continents']), 9)
+        for continent in map_data['continents']:
+            self.assertTrue(continent['territories'])
+            self.assertTrue(connected(continent['territories'], borders))
+
+    def test_symbol_distribution(self):
+        map_data = generate_map(100, symbols={'quadrado': 3, 'círculo': 1},
+                                seed=3)
+        counts = Counter(t['symbol'] for t in map_data['territories'])
+        self.assertEqual(counts, {'quadrado': 75, 'círculo': 25})
+
+    def test_same_seed_same_map(self):
+        self.assertEqual(generate_map(200, seed=5), generate_map(200, seed=5))
+        self.assertNotEqual(generate_map(200, seed=5), generate_map(200, seed=6))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            generate_map(1)
+        with self.assertRaises(ValueError):
+            generate_map(50, continents=51)
+        with self.assertRaises(ValueError):
+            generate_map(50, average_degree=9.0)
+        with self.assertRaises(ValueError):
+            generate_map(50, average_degree=1.0)
+
+    def test_playable(self):
+        map_data = generate_map(300, seed=4)
+        template = GameTemplate(map_data, benchmark_missions(300, 3))
+        players = [Player(f"P{i}", "Azul") for i in range(3)]
+        game = template.new_game(players, players[0], seed=1, headless=True)
+        self.assertEqual(sum(game.state.territory_counts()), 300)
+        self.assertEqual(len(game.cards), 300)
+
+    def test_command_line(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'grande.json')
+            main(['120', '--continents', '5', '--degree', '3',
+                  '--symbol', 'quadrado=1', '--symbol', 'estrela=1',
+                  '-o', path])
+            with open(path, encoding='utf-8') as f:
+                map_data = json.load(f)
+        self.assertEqual(validate_map_data(map_data), [])
+        self.assertEqual(len(map_data['continents']), 5)
+        self.assertEqual({t['symbol'] for t in map_data['territories']},
+                         {'quadrado', 'estrela'})
+
+
+class TestBenchmark(unittest.TestCase):
+
+    def test_missions_scale_with_map(self):
+        missions = benchmark_missions(420, 3)
+        self.assertEqual([m['description'] for m in missions],
+                         ["Conquistar 240 territórios",
+                          "Conquistar 180 territórios",
+                          "Conquistar 240 territórios"])
+
+    def test_small_run(self):
+        results = run_benchmark([30], turns=5, repeat=1, minimum_time=0.001)
+        self.assertEqual(len(results), 1)
+        result = results[0]
+        self.assertEqual(result['territories'], 30)
+        self.assertEqual(result['edges'], 60)
+        # Os ataques listados existem de fato (o gerador é consumido)
+        self.assertGreater(result['attack_moves'], 0)
+        self.assertGreater(result['turns_per_second'], 0)
+        for key in ('setup_us', 'movegen_us', 'attacks_us', 'combat_us',
+                    'conquest_us'):
+            self.assertGreater(result[key], 0)
+        self.assertIn('30', format_row(result))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,177 @@
+# test_mcts.py
+# Testes para a busca Monte Carlo e o MCTSBot
+
+import unittest
+from war.mcts import (MCTS, MCTSBot, TurnSimulator, ChanceNode, END_PHASE,
+                      random_policy, greedy_policy, sample_outcome)
+from war.moves import ACTION_PLACE, ACTION_ATTACK
+from war.enums import PHASE_PLACE_ARMIES, PHASE_ATTACK, PHASE_MOVE
+from war.odds import round_outcomes
+from war.rng import GameRandom
+from tests.helpers import new_game
+
+
+class TestTurnSimulator(unittest.TestCase):
+
+    def setUp(self):
+        self.game = new_game(seed=4, players=2)
+        self.sim = TurnSimulator(self.game.state.copy(), 0,
+                                 PHASE_PLACE_ARMIES, 5)
+
+    def test_simulation_does_not_touch_game(self):
+        before = list(self.game.state.troops)
+        target = self.sim.legal_actions()[0][1]
+        self.sim.apply((ACTION_PLACE, target, target))
+        self.assertEqual(list(self.game.state.troops), before)
+        self.assertEqual(self.sim.state.troops[target], before[target] + 5)
+        self.assertEqual(self.sim.phase, PHASE_ATTACK)
+
+    def test_phases_and_next_turn(self):
+        target = self.sim.legal_actions()[0][1]
+        self.sim.apply((ACTION_PLACE, target, target))
+        self.assertIn(END_PHASE, self.sim.legal_actions())
+        self.sim.apply(END_PHASE)
+        self.assertEqual(self.sim.phase, PHASE_MOVE)
+        self.sim.apply(END_PHASE)
+        self.assertEqual((self.sim.player, self.sim.phase, self.sim.turns),
+                         (1, PHASE_PLACE_ARMIES, 1))
+        self.assertEqual(self.sim.armies,
+                         max(self.sim.state.owned_count[1] // 2, 1))
+
+    def test_attack_conquers(self):
+        source, target = next(
+            (s, t) for s in range(len(self.game.territories))
+            for t in self.game.topology.neighbors_of(s)
+            if self.sim.state.owner[s] == 0 and self.sim.state.owner[t] == 1)
+        self.sim.state.troops[source] = 4
+        self.sim.state.troops[target] = 1
+        self.sim.phase = PHASE_ATTACK
+        self.sim.apply_attack(source, target, 0, 1)
+        self.assertEqual(self.sim.state.owner[target], 0)
+        self.assertEqual(self.sim.state.troops[target], 3)
+        self.assertEqual(self.sim.state.troops[source], 1)
+
+    def test_indexes_follow_playouts(self):
+        rng = GameRandom(2)
+        sim = self.sim.copy()
+        for _ in range(200):
+            sim.step(random_policy(sim, rng), rng)
+            owner, troops = sim.state.owner, sim.state.troops
+            player = sim.player
+            owned = [t for t, o in enumerate(owner) if o == player]
+            self.assertEqual(sim.owned(), owned)
+            self.assertEqual(sim.attack_options(), [
+                (s, t) for s in owned if troops[s] > 1
+                for t in self.game.topology.neighbors_of(s)
+                if owner[t] != player])
+        # O simulador original não é afetado pelas cópias
+        self.assertEqual(self.sim.owned(),
+                         [t for t, o in enumerate(self.game.state.owner)
+                          if o == 0])
+
+    def test_key_changes_with_position(self):
+        key = self.sim.key()
+        self.assertEqual(self.sim.copy().key(), key)
+        self.sim.state.set_troops(0, self.sim.state.troops[0] + 1)
+        self.assertNotEqual(self.sim.key(), key)
+
+    def test_key_buckets_large_troop_counts(self):
+        self.sim.state.set_troops(0, 40)
+        key = self.sim.key()
+        self.sim.state.set_troops(0, 41)
+        self.assertEqual(self.sim.key(), key)
+
+    def test_policies_return_legal_actions(self):
+        rng = GameRandom(1)
+        for policy in (random_policy, greedy_policy):
+            sim = self.sim.copy()
+            for _ in range(200):
+                action = policy(sim, rng)
+                if action is not END_PHASE and sim.phase != PHASE_PLACE_ARMIES:
+                    self.assertIn(action, sim.legal_actions())
+                sim.step(action, rng)
+
+
+class TestChance(unittest.TestCase):
+
+    def test_sample_outcome_follows_distribution(self):
+        outcomes = round_outcomes(3, 2)
+        self.assertEqual(sample_outcome(outcomes, 0.0), outcomes[0][0])
+        self.assertEqual(sample_outcome(outcomes, 0.9999999), outcomes[-1][0])
+
+    def test_chance_node_counts_visits(self):
+        node = ChanceNode(round_outcomes(1, 1))
+        rng = GameRandom(2)
+        for _ in range(100):
+            node.sample(rng)
+        self.assertEqual(sum(node.visits), 100)
+
+
+class TestMCTS(unittest.TestCase):
+
+    def test_search_returns_legal_action_and_counts_playouts(self):
+        game = new_game(seed=4, players=2)
+        sim = TurnSimulator(game.state.copy(), 0, PHASE_ATTACK)
+        mcts = MCTS(rng=GameRandom(3))
+        root = mcts.search(sim, iterations=50)
+        self.assertEqual(sum(root.counts), 50)
+        self.assertIn(root.best_action(), sim.legal_actions())
+        self.assertEqual(mcts.playouts, 50)
+        self.assertGreater(mcts.playouts_per_second(), 0)
+        self.assertEqual(sum(v for _, v in MCTS.visit_distribution(root)), 50)
+
+    def test_transposition_table_is_reused(self):
+        game = new_game(seed=4, players=2)
+        sim = TurnSimulator(game.state.copy(), 0, PHASE_MOVE)
+        mcts = MCTS(rng=GameRandom(3))
+        root = mcts.search(sim, iterations=20)
+        self.assertIs(mcts.search(sim.copy(), iterations=20), root)
+        self.assertEqual(sum(root.counts), 40)
+        self.assertGreater(len(mcts.table), 1)
+
+    def test_time_budget(self):
+        game = new_game(seed=4, players=2)
+        sim = TurnSimulator(game.state.copy(), 0, PHASE_ATTACK)
+        mcts = MCTS(rng=GameRandom(3))
+        mcts.search(sim, time_budget_ms=20)
+        self.assertGreater(mcts.playouts, 0)
+
+    def test_prefers_winning_attack(self):
+        game = new_game(seed=4, players=2)
+        state = game.state.copy()
+        # P1 fica com um único território, vizinho de um território forte de P0
+        target = 0
+        source = game.topology.neighbors_of(target)[0]
+        for territory_id in range(len(state.owner)):
+            state.set_owner(territory_id, 0)
+            state.troops[territory_id] = 1
+        state.set_owner(target, 1)
+        state.troops[source] = 30
+        sim = TurnSimulator(state, 0, PHASE_ATTACK)
+        root = MCTS(rng=GameRandom(5)).search(sim, iterations=100)
+        self.assertEqual(root.best_action(), (ACTION_ATTACK, source, target))
+
+
+class TestMCTSBot(unittest.TestCase):
+
+    def test_bot_plays_turns(self):
+        bot = MCTSBot(iterations=20)
+        game = new_game(seed=4, bots=(bot, MCTSBot(iterations=20)))
+        player = game.players[0]
+        for _ in range(2):
+            game.play_turn(player)
+        self.assertGreater(bot.playouts_per_second(), 0)
+        self.assertIn('attack', bot.decision_stats)
+
+    def test_bot_is_reproducible(self):
+        results = []
+        for _ in range(2):
+            game = new_game(seed=8, bots=(MCTSBot(iterations=10),
+                                          MCTSBot(iterations=10)))
+            game.play_game(max_turns=4)
+            results.append(list(game.state.troops))
+        self.assertEqual(results[0], results[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+# test_missions.py
+# Testes para o avaliador compilado de missões
+
+import unittest
+from war.missions import (compile_mission, ContinentsMission,
+                          TerritoryCountMission, DestroyPlayerMission)
+from war.game import Game, GameTemplate
+from war.mapgen import generate_map
+from war.player import Player
+from war.state import NO_OWNER
+from war.topology import MapTopology
+from war.utils_data import load_map_data, load_missions
+
+
+class TestCompileMission(unittest.TestCase):
+
+    def setUp(self):
+        self.topology = MapTopology.from_map_data(load_map_data())
+        self.missions = {m['id']: m for m in load_missions()}
+
+    def continent(self, name):
+        return self.topology.continent_index[name]
+
+    def test_all_bundled_missions_compile(self):
+        for mission in self.missions.values():
+            self.assertIsNotNone(compile_mission(mission, self.topology),
+                                 mission['description'])
+
+    def test_two_continents(self):
+        predicate = compile_mission(self.missions[1], self.topology)
+        self.assertIsInstance(predicate, ContinentsMission)
+        self.assertEqual(set(predicate.continent_ids),
+                         {self.continent('América do Sul'), self.continent('África')})
+        self.assertEqual(predicate.extra, 0)
+
+    def test_extra_continent(self):
+        predicate = compile_mission(self.missions[8], self.topology)
+        self.assertEqual(set(predicate.continent_ids),
+                         {self.continent('Europa'), self.continent('Oceania')})
+        self.assertEqual(predicate.extra, 1)
+
+    def test_territory_count(self):
+        predicate = compile_mission(self.missions[9], self.topology)
+        self.assertIsInstance(predicate, TerritoryCountMission)
+        self.assertEqual(predicate.count, 24)
+
+    def test_destroy_player(self):
+        predicate = compile_mission(self.missions[10], self.topology)
+        self.assertIsInstance(predicate, DestroyPlayerMission)
+        self.assertEqual(predicate.fallback.count, 24)
+
+    def test_unknown_description(self):
+        self.assertIsNone(compile_mission({'id': 1, 'description': 'M1'}, self.topology))
+        self.assertIsNone(compile_mission(None, self.topology))
+
+    def test_unknown_continent(self):
+        for description in ("Conquistar a Atlântida.",
+                            "Conquistar a Europa e a Atlântida.",
+                            "Conquistar a Lemúria, a Oceania e mais um "
+                            "continente à sua escolha."):
+            self.assertIsNone(
+                compile_mission({'id': 1, 'description': description},
+                                self.topology), description)
+        predicate = compile_mission(
+            {'id': 1, 'description': "Conquistar na totalidade a Europa."},
+            self.topology)
+        self.assertEqual(predicate.continent_ids, (self.continent('Europa'),))
+
+
+class TestMissionTracker(unittest.TestCase):
+
+    def setUp(self):
+        self.alice = Player("Alice", "Azul")
+        self.bob = Player("Bob", "Vermelho")
+        self.game = Game([self.alice, self.bob], self.alice)
+        self.tracker = self.game.mission_tracker
+
+    def give_all(self, player, continent_name):
+        for territory in self.game.territories:
+            if territory.continent == continent_name and territory.owner is not player:
+                territory.owner.territories.remove(territory)
+                territory.owner = player
+                player.territories.append(territory)
+
+    def test_continent_mission_completes_on_conquest(self):
+        self.give_all(self.bob, 'Oceania')
+        self.tracker.predicates[self.alice.index] = ContinentsMission(
+            [self.game.topology.continent_index['Oceania']])
+        self.tracker.winner = None
+        self.assertEqual(self.game.is_game_over(), (False, None))
+
+        self.give_all(self.alice, 'Oceania')
+
+        self.assertEqual(self.game.is_game_over(), (True, self.alice))
+
+    def test_territory_count_mission(self):
+        self.tracker.predicates[self.bob.index] = TerritoryCountMission(
+            len(self.bob.territories) + 1)
+        self.tracker.winner = None
+        territory = self.alice.territories[0]
+        self.alice.territories.remove(territory)
+        territory.owner = self.bob
+        self.bob.territories.append(territory)
+        self.assertIs(self.tracker.winner, self.bob)
+
+    def test_mission_complete_at_deal(self):
+        map_data = generate_map(20, seed=1)
+        missions = [{'id': 1, 'description': "Conquistar 5 territórios"},
+                    {'id': 2, 'description': "Conquistar 5 territórios"}]
+        players = [Player("Alice", "Azul"), Player("Bob", "Vermelho")]
+        game = GameTemplate(map_data, missions).new_game(
+            players, players[0], seed=1, headless=True)
+        self.assertIsNotNone(game.mission_tracker.winner)
+        self.assertTrue(game.is_game_over()[0])
+
+    def test_destroy_player_by_someone_else_falls_back(self):
+        carol = Player("Carol", "Verde")
+        game = Game([self.alice, self.bob, carol], self.alice)
+        tracker = game.mission_tracker
+        predicate = DestroyPlayerMission(TerritoryCountMission(99))
+        predicate.target = self.bob.index
+        tracker.predicates = [None, None, predicate]
+        tracker.winner = None
+
+        tracker.on_player_eliminated(self.bob, self.alice)
+
+        self.assertTrue(predicate.failed)
+        self.assertIsNone(tracker.winner)
+
+    def test_destroy_player_achieved(self):
+        predicate = DestroyPlayerMission(TerritoryCountMission(99))
+        predicate.target = self.bob.index
+        self.tracker.predicates[self.alice.index] = predicate
+        self.tracker.winner = None
+
+        self.tracker.on_player_eliminated(self.bob, self.alice)
+
+        self.assertIs(self.tracker.winner, self.alice)
+
+    def test_destroy_player_without_target_uses_fallback(self):
+        predicate = DestroyPlayerMission(TerritoryCountMission(1))
+        self.assertEqual(predicate.target, NO_OWNER)
+        self.assertTrue(predicate.is_complete(self.game.state, self.alice.index))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+# test_moves.py
+# Testes para o gerador incremental de jogadas
+
+import unittest
+from war.moves import (MoveGenerator, ACTION_PLACE, ACTION_ATTACK,
+                       ACTION_FORTIFY, np)
+from war.game import Game
+from war.player import Player
+from war.rng import GameRandom
+
+
+def brute_force(game, player_index):
+    state, topology = game.state, game.topology
+    attacks, fortifies = set(), set()
+    for source in range(len(topology)):
+        if state.owner[source] != player_index or state.troops[source] <= 1:
+            continue
+        for target in topology.neighbors_of(source):
+            if state.owner[target] == player_index:
+                fortifies.add((ACTION_FORTIFY, source, target))
+            else:
+                attacks.add((ACTION_ATTACK, source, target))
+    return attacks, fortifies
+
+
+class TestMoveGenerator(unittest.TestCase):
+
+    def setUp(self):
+        self.players = [Player("Alice", "Azul"), Player("Bob", "Vermelho"),
+                        Player("Carol", "Verde")]
+        self.game = Game(self.players, self.players[0], seed=5, headless=True)
+        self.moves = self.game.move_generator()
+
+    def assert_matches_brute_force(self):
+        for index in range(len(self.players)):
+            attacks, fortifies = brute_force(self.game, index)
+            self.assertEqual(set(self.moves.attacks(index)), attacks)
+            self.assertEqual(set(self.moves.fortifies(index)), fortifies)
+            self.assertEqual(self.moves.attack_count(index), len(attacks))
+
+    def test_initial_state_has_no_attacks(self):
+        # Todos começam com 1 tropa por território
+        for index in range(len(self.players)):
+            self.assertEqual(list(self.moves.attacks(index)), [])
+        self.assert_matches_brute_force()
+
+    def test_placements(self):
+        placements = set(self.moves.placements(0))
+        self.assertEqual(placements, {(ACTION_PLACE, t.id, t.id)
+                                      for t in self.players[0].territories})
+
+    def test_incremental_updates_match_brute_force(self):
+        rng = GameRandom(1)
+        for _ in range(300):
+            territory = rng.choice(self.game.territories)
+            if rng.random() < 0.7:
+                territory.troops = rng.randint(1, 5)
+            else:
+                territory.owner = rng.choice(self.players)
+        self.assert_matches_brute_force()
+
+    def test_generator_is_shared_and_closable(self):
+        self.assertIs(self.game.move_generator(), self.moves)
+        other = MoveGenerator(self.game.state)
+        other.close()
+        self.game.territories[0].troops = 9
+        self.assertEqual(other.attack_count(0) + other.attack_count(1)
+                         + other.attack_count(2), 0)
+
+    @unittest.skipIf(np is None, "NumPy não instalado")
+    def test_masks(self):
+        for territory in self.game.territories:
+            territory.troops = 3
+        masks = self.moves.attack_masks()
+        self.assertEqual(masks.shape, (len(self.players), self.moves.edge_count))
+        for index in range(len(self.players)):
+            self.assertEqual(int(masks[index].sum()), self.moves.attack_count(index))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+# test_odds.py
+# Testes para as tabelas exatas de probabilidade de batalha
+
+import os
+import tempfile
+import unittest
+from war.odds import BattleOdds, round_outcomes
+
+
+class TestRoundOutcomes(unittest.TestCase):
+
+    def test_one_vs_one(self):
+        outcomes = dict(round_outcomes(1, 1))
+        # Atacante vence com 15 de 36 combinações
+        self.assertAlmostEqual(outcomes[(0, 1)], 15 / 36)
+        self.assertAlmostEqual(outcomes[(1, 0)], 21 / 36)
+
+    def test_three_vs_two(self):
+        outcomes = dict(round_outcomes(3, 2))
+        self.assertAlmostEqual(sum(outcomes.values()), 1.0)
+        self.assertAlmostEqual(outcomes[(0, 2)], 2890 / 7776)
+        self.assertAlmostEqual(outcomes[(1, 1)], 2611 / 7776)
+        self.assertAlmostEqual(outcomes[(2, 0)], 2275 / 7776)
+
+
+class TestBattleOdds(unittest.TestCase):
+
+    def setUp(self):
+        self.odds = BattleOdds(max_attackers=10, max_defenders=10)
+
+    def test_trivial_cases(self):
+        self.assertEqual(self.odds.conquest_probability(3, 0), 1.0)
+        self.assertEqual(self.odds.conquest_probability(0, 3), 0.0)
+        self.assertEqual(self.odds.expected_survivors(0, 3), (0.0, 3.0))
+
+    def test_single_round(self):
+        self.assertAlmostEqual(self.odds.conquest_probability(1, 1), 15 / 36)
+
+    def test_more_attackers_more_likely(self):
+        self.assertGreater(self.odds.conquest_probability(5, 2),
+                           self.odds.conquest_probability(2, 2))
+
+    def test_distribution_matches_tables(self):
+        distribution = self.odds.outcome_distribution(4, 3)
+        self.assertAlmostEqual(sum(distribution.values()), 1.0)
+        win = sum(p for (a, d), p in distribution.items() if d == 0)
+        self.assertAlmostEqual(win, self.odds.conquest_probability(4, 3))
+        expected_attackers = sum(a * p for (a, d), p in distribution.items())
+        self.assertAlmostEqual(expected_attackers,
+                               self.odds.expected_survivors(4, 3)[0])
+
+    def test_grows_on_demand(self):
+        self.odds.conquest_probability(15, 2)
+        self.assertEqual(self.odds.max_attackers, 15)
+
+    def test_incremental_growth_matches_fresh_build(self):
+        self.odds.conquest_probability(25, 3)
+        self.odds.conquest_probability(4, 40)
+        fresh = BattleOdds(max_attackers=25, max_defenders=40)
+        for a in range(26):
+            for d in range(41):
+                self.assertAlmostEqual(self.odds.conquest_probability(a, d),
+                                       fresh.conquest_probability(a, d))
+
+    def test_limit_caps_table(self):
+        odds = BattleOdds(max_attackers=5, max_defenders=5, limit=20)
+        probability = odds.conquest_probability(1000, 400)
+        self.assertEqual((odds.max_attackers, odds.max_defenders), (20, 8))
+        self.assertAlmostEqual(probability, odds.conquest_probability(20, 8))
+        attackers, _ = odds.expected_survivors(1000, 400)
+        self.assertAlmostEqual(attackers,
+                               odds.expected_survivors(20, 8)[0] * 50)
+
+    def test_large_distribution(self):
+        distribution = self.odds.outcome_distribution(400, 400)
+        self.assertAlmostEqual(sum(distribution.values()), 1.0)
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'odds.json')
+            self.odds.save(path)
+            loaded = BattleOdds.load(path)
+            self.assertAlmostEqual(loaded.conquest_probability(7, 4),
+                                   self.odds.conquest_probability(7, 4))
+
+            # Tabela menor que a pedida é recalculada e regravada
+            bigger = BattleOdds.load_or_build(path, 12, 12)
+            self.assertEqual(bigger.max_attackers, 12)
+            self.assertEqual(BattleOdds.load(path).max_attackers, 12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+# test_regions.py
+# Testes para o índice de regiões conexas e o deslocamento em vários passos
+
+import unittest
+from war.regions import RegionIndex
+from war.rng import GameRandom
+from tests.helpers import new_game
+
+
+def bfs_regions(game, player_index):
+    owner, topology = game.state.owner, game.topology
+    seen, regions = set(), []
+    for start in range(len(owner)):
+        if owner[start] != player_index or start in seen:
+            continue
+        region, stack = [], [start]
+        seen.add(start)
+        while stack:
+            territory = stack.pop()
+            region.append(territory)
+            for neighbor in topology.neighbors_of(territory):
+                if owner[neighbor] == player_index and neighbor not in seen:
+                    seen.add(neighbor)
+                    stack.append(neighbor)
+        regions.append(sorted(region))
+    return sorted(regions)
+
+
+def transfer(game, territory, player):
+    territory.owner.territories.remove(territory)
+    territory.owner = player
+    player.territories.append(territory)
+
+
+class TestRegionIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.game = new_game(seed=6)
+        self.index = self.game.region_index()
+
+    def assert_matches_bfs(self):
+        for player_index in range(len(self.game.players)):
+            regions = sorted(sorted(r) for r in self.index.regions(player_index))
+            self.assertEqual(regions, bfs_regions(self.game, player_index))
+
+    def test_initial_regions(self):
+        self.assert_matches_bfs()
+
+    def test_incremental_ownership_changes(self):
+        rng = GameRandom(11)
+        for step in range(400):
+            transfer(self.game, rng.choice(self.game.territories),
+                     rng.choice(self.game.players))
+            if step % 37 == 0:
+                self.assert_matches_bfs()
+        self.assert_matches_bfs()
+        for player_index in range(len(self.game.players)):
+            for region in bfs_regions(self.game, player_index):
+                for territory_id in region:
+                    self.assertEqual(self.index.region_of(territory_id),
+                                     region)
+
+    def test_connected_and_region_of(self):
+        alice = self.game.players[0]
+        for territory in self.game.territories:
+            if territory.owner is not alice:
+                transfer(self.game, territory, alice)
+        self.assertTrue(self.index.connected(0, len(self.game.territories) - 1))
+        self.assertEqual(len(self.index.region_of(0)), len(self.game.territories))
+
+    def test_is_shared_and_closable(self):
+        self.assertIs(self.game.region_index(), self.index)
+        other = RegionIndex(self.game.state)
+        other.close()
+
+
+class TestMultiHopFortify(unittest.TestCase):
+
+    def setUp(self):
+        self.game = new_game(seed=6)
+        self.alice = self.game.players[0]
+        self.bob = self.game.players[1]
+        # Caminho simples de 3 territórios (origem, meio, destino) de Alice
+        self.path = self.find_path(3)
+        for territory in self.path:
+            if territory.owner is not self.alice:
+                transfer(self.game, territory, self.alice)
+
+    def find_path(self, length):
+        topology = self.game.topology
+        for start in range(len(topology)):
+            path = [start]
+            while len(path) < length:
+                options = [n for n in topology.neighbors_of(path[-1])
+                           if n not in path
+                           and not any(topology.are_adjacent(n, p) for p in path[:-1])]
+                if not options:
+                    break
+                path.append(options[0])
+            if len(path) == length:
+                return [self.game.territories[t] for t in path]
+        self.fail("mapa sem caminho simples")
+
+    def test_multi_hop_move(self):
+        source, _, target = self.path
+        source.troops = 6
+        target_troops = target.troops
+        self.assertIn(target, self.game.fortify_destinations(source))
+        self.game.fortify(source, target, 4)
+        self.assertEqual(source.troops, 2)
+        self.assertEqual(target.troops, target_troops + 4)
+
+    def test_disconnected_move_fails(self):
+        source, middle, target = self.path
+        source.troops = 6
+        transfer(self.game, middle, self.bob)
+        if not self.game.region_index().connected(source.id, target.id):
+            self.assertNotIn(target, self.game.fortify_destinations(source))
+            with self.assertRaises(ValueError):
+                self.game.fortify(source, target, 1)
+
+    def test_fortify_validations(self):
+        source, _, target = self.path
+        source.troops = 2
+        with self.assertRaises(ValueError):
+            self.game.fortify(source, target, 2)
+        with self.assertRaises(ValueError):
+            self.game.fortify(source, source, 1)
+        enemy = next(iter(self.bob.territories))
+        with self.assertRaises(ValueError):
+            self.game.fortify(source, enemy, 1)
+        self.path[1].troops = 1
+        self.assertEqual(self.game.fortify_destinations(self.path[1]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
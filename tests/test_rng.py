@@ -0,0 +1,86 @@
+# test_rng.py
+# Testes para o gerador aleatório por jogo
+
+import unittest
+from war.rng import GameRandom
+from war.deck import Deck
+from war.utils import roll_die, roll_multiple_dice
+from tests.helpers import new_game
+
+
+def summary(game):
+    return ([t.owner.name for t in game.territories],
+            [p.mission['id'] for p in game.players],
+            [c.territory_name for c in game.deck.cards])
+
+
+class TestGameRandom(unittest.TestCase):
+
+    def test_seed_is_reproducible(self):
+        self.assertEqual(GameRandom(7).dice(20), GameRandom(7).dice(20))
+        self.assertEqual(GameRandom(7).initial_seed, 7)
+
+    def test_dice_values(self):
+        rolls = GameRandom(1).dice(100)
+        self.assertEqual(len(rolls), 100)
+        self.assertTrue(all(1 <= value <= 6 for value in rolls))
+
+    def test_permutation(self):
+        self.assertEqual(sorted(GameRandom(3).permutation(10)), list(range(10)))
+
+    def test_snapshot_restore(self):
+        rng = GameRandom(5)
+        snapshot = rng.snapshot()
+        first = rng.dice(10)
+        rng.restore(snapshot)
+        self.assertEqual(rng.dice(10), first)
+
+    def test_fork_is_deterministic(self):
+        self.assertEqual(GameRandom(9).fork().dice(10), GameRandom(9).fork().dice(10))
+
+    def test_utils_accept_rng(self):
+        self.assertEqual(roll_die(GameRandom(2)), roll_die(GameRandom(2)))
+        self.assertEqual(roll_multiple_dice(4, GameRandom(2)),
+                         roll_multiple_dice(4, GameRandom(2)))
+        # Os dados saem em lote de GameRandom.dice
+        self.assertEqual(roll_multiple_dice(4, GameRandom(2)),
+                         GameRandom(2).dice(4))
+        self.assertEqual(roll_multiple_dice(-1, GameRandom(2)), [])
+
+    def test_deck_uses_rng(self):
+        a = Deck(list(range(20)), GameRandom(4))
+        b = Deck(list(range(20)), GameRandom(4))
+        a.shuffle()
+        b.shuffle()
+        self.assertEqual(a.cards, b.cards)
+
+
+class TestSeededGame(unittest.TestCase):
+
+    def test_same_seed_same_setup(self):
+        self.assertEqual(summary(new_game(123)), summary(new_game(123)))
+
+    def test_different_seeds_differ(self):
+        self.assertNotEqual(summary(new_game(1)), summary(new_game(2)))
+
+    def test_same_seed_same_battles(self):
+        results = []
+        for _ in range(2):
+            game = new_game(42)
+            attacker = next(t for t in game.territories
+                            if any(t.owner is not n.owner
+                                   for n in game.territories if t.is_adjacent_to(n)))
+            defender = next(n for n in game.territories
+                            if attacker.is_adjacent_to(n) and n.owner is not attacker.owner)
+            attacker.troops = 20
+            defender.troops = 20
+            rounds = []
+            for _ in range(5):
+                game.attack_territory(attacker, defender, 3)
+                rounds.append((attacker.troops, defender.troops))
+            results.append(rounds)
+        self.assertEqual(results[0], results[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
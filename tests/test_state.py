@@ -0,0 +1,176 @@
+# test_state.py
+# Testes para o estado compacto do jogo (GameState)
+
+import unittest
+from war.state import GameState, NO_OWNER
+from war.events import OWNERSHIP_CHANGED
+from war.game import Game
+from war.player import Player
+from war.territory import Territory
+
+
+class TestGameState(unittest.TestCase):
+
+    def setUp(self):
+        self.player1 = Player("Alice", "Azul")
+        self.player2 = Player("Bob", "Vermelho")
+        self.state = GameState(3, [0, 0, 1], [self.player1, self.player2])
+
+    def test_inicializacao(self):
+        self.assertEqual(len(self.state), 3)
+        self.assertEqual(list(self.state.owner), [NO_OWNER] * 3)
+        self.assertEqual(list(self.state.troops), [0, 0, 0])
+        self.assertEqual(list(self.state.continent), [0, 0, 1])
+        self.assertEqual(self.player2.index, 1)
+
+    def test_player_index(self):
+        self.assertEqual(self.state.player_index(self.player1), 0)
+        self.assertEqual(self.state.player_index(None), NO_OWNER)
+        self.assertIsNone(self.state.player_at(NO_OWNER))
+        self.assertIs(self.state.player_at(1), self.player2)
+
+    def test_territory_view(self):
+        territory = Territory("Brasil", "América do Sul")
+        territory.owner = self.player1
+        territory.troops = 4
+        territory.bind(self.state, 0)
+
+        # Valores existentes são copiados para os arrays
+        self.assertEqual(self.state.owner[0], 0)
+        self.assertEqual(self.state.troops[0], 4)
+
+        territory.owner = self.player2
+        territory.troops += 1
+        self.assertEqual(self.state.owner[0], 1)
+        self.assertEqual(self.state.troops[0], 5)
+        self.assertIs(territory.owner, self.player2)
+
+    def test_totals(self):
+        self.state.set_owner(0, 0)
+        self.state.set_owner(1, 1)
+        self.state.set_owner(2, 1)
+        self.state.set_troops(0, 3)
+        self.state.set_troops(1, 2)
+        self.state.set_troops(2, 5)
+        self.assertEqual(self.state.territory_counts(), [1, 2])
+        self.assertEqual(self.state.troop_totals(), [3, 7])
+
+    def test_continent_counters(self):
+        self.state.set_owner(0, 0)
+        self.assertEqual(self.state.controller[0], NO_OWNER)
+        self.state.set_owner(1, 0)
+        self.assertTrue(self.state.controls_continent(0, 0))
+        self.state.set_owner(2, 1)
+        self.assertEqual(list(self.state.continent_controllers()), [0, 1])
+
+        # Perder um território desfaz o controle
+        self.state.set_owner(1, 1)
+        self.assertFalse(self.state.controls_continent(0, 0))
+        self.assertEqual(list(self.state.continent_owned[1]), [1, 1])
+
+    def test_copy_is_independent(self):
+        self.state.set_troops(0, 3)
+        clone = self.state.copy()
+        clone.set_troops(0, 9)
+        self.assertEqual(self.state.troops[0], 3)
+        self.assertEqual(clone.troops[0], 9)
+
+    def test_mark_and_undo(self):
+        self.state.set_owner(0, 0)
+        self.state.set_owner(1, 0)
+        self.state.set_troops(0, 2)
+        mark = self.state.mark()
+        self.state.set_owner(1, 1)
+        self.state.set_troops(0, 7)
+        self.state.set_troops(0, 8)
+        inner = self.state.mark()
+        self.state.set_owner(2, 1)
+        self.state.undo(inner)
+        self.assertEqual(self.state.owner[2], NO_OWNER)
+        self.assertEqual(self.state.troops[0], 8)
+        self.state.undo(mark)
+        self.assertEqual(list(self.state.owner), [0, 0, NO_OWNER])
+        self.assertEqual(self.state.troops[0], 2)
+        self.assertTrue(self.state.controls_continent(0, 0))
+        self.assertEqual(self.state.territory_counts(), [2, 0])
+        self.assertIsNone(self.state.journal)
+
+    def test_snapshot_restore(self):
+        self.state.set_owner(0, 0)
+        snapshot = self.state.snapshot()
+        self.state.set_owner(0, 1)
+        self.state.set_owner(1, 1)
+        self.state.set_troops(1, 4)
+        self.state.restore(snapshot)
+        self.assertEqual(list(self.state.owner), [0, NO_OWNER, NO_OWNER])
+        self.assertEqual(list(self.state.troops), [0, 0, 0])
+        self.assertEqual(self.state.territory_counts(), [1, 0])
+
+    def test_load_matches_setters(self):
+        self.state.set_owner(2, 1)
+        self.state.load([0, 0, 1], [3, 1, 2])
+        expected = GameState(3, [0, 0, 1], [self.player1, self.player2])
+        for territory_id, owner in enumerate([0, 0, 1]):
+            expected.set_owner(territory_id, owner)
+        self.assertEqual(list(self.state.owner), [0, 0, 1])
+        self.assertEqual(list(self.state.troops), [3, 1, 2])
+        self.assertEqual(self.state.territory_counts(), [2, 1])
+        self.assertEqual(list(self.state.controller), [0, 1])
+        self.assertEqual(self.state.continent_owned, expected.continent_owned)
+
+    def test_load_with_subscribers_emits_events(self):
+        changes = []
+        self.state.events.subscribe(OWNERSHIP_CHANGED,
+                                    lambda *args: changes.append(args))
+        self.state.load([1, NO_OWNER, NO_OWNER], [1, 0, 0])
+        self.assertEqual(changes, [(0, NO_OWNER, 1)])
+        self.assertEqual(self.state.territory_counts(), [0, 1])
+
+    def test_copy_with_players(self):
+        others = [Player("Carol", "Verde"), Player("Dave", "Preto")]
+        clone = self.state.copy(others)
+        self.assertIs(clone.player_at(1), others[1])
+        self.assertIs(others[1]._state, clone)
+        self.assertIs(self.state.player_at(1), self.player2)
+
+
+class TestGameStateInGame(unittest.TestCase):
+
+    def test_game_territories_are_views(self):
+        players = [Player("Alice", "Azul"), Player("Bob", "Vermelho")]
+        game = Game(players, players[0])
+
+        self.assertEqual(len(game.state), len(game.territories))
+        for territory_id, territory in enumerate(game.territories):
+            self.assertEqual(territory.id, territory_id)
+            self.assertIs(territory.owner,
+                          game.state.player_at(game.state.owner[territory_id]))
+            self.assertEqual(territory.troops, 1)
+
+        self.assertEqual(sum(game.state.territory_counts()),
+                         len(game.territories))
+
+    def test_continent_controllers_match_scan(self):
+        players = [Player("Alice", "Azul"), Player("Bob", "Vermelho")]
+        game = Game(players, players[0])
+        alice = players[0]
+        for territory in game.territories:
+            if territory.continent == 'Oceania' and territory.owner is not alice:
+                territory.owner.territories.remove(territory)
+                territory.owner = alice
+                alice.territories.append(territory)
+
+        controllers = game.get_continent_controllers()
+        self.assertIs(controllers['Oceania'], alice)
+        self.assertIs(game.get_continent_controller('Oceania'), alice)
+        for continent in game.map_data['continents']:
+            name = continent['name']
+            scan = [p for p in players
+                    if set(continent['territories']) <= {t.name for t in p.territories}]
+            self.assertEqual(controllers[name], scan[0] if scan else None)
+            self.assertEqual(alice.owns_continent(name, game.map_data),
+                             alice in scan)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+# test_template.py
+# Testes para o molde de criação de jogos (GameTemplate)
+
+import unittest
+from war.game import Game, GameTemplate
+from war.missions import DestroyPlayerMission
+from war.utils_data import load_missions
+from tests.helpers import make_players
+
+
+def board(game):
+    return (list(game.state.owner), list(game.state.troops),
+            [player.mission for player in game.players],
+            [(card.territory_name, card.symbol) for card in game.deck.cards],
+            [[t.name for t in player.territories] for player in game.players],
+            game.state.hash)
+
+
+class TestGameTemplate(unittest.TestCase):
+
+    def setUp(self):
+        self.template = GameTemplate()
+
+    def test_same_game_as_constructor(self):
+        for seed in range(5):
+            players = make_players(3 + seed % 3)
+            game = Game(players, players[seed % len(players)], seed=seed)
+            others = make_players(3 + seed % 3)
+            stamped = self.template.new_game(
+                others, others[seed % len(others)], seed=seed)
+            self.assertEqual(board(stamped), board(game))
+
+    def test_constructor_reuses_default_template(self):
+        players = make_players()
+        game = Game(players, players[0], seed=1)
+        self.assertIs(game.template, GameTemplate.default())
+        self.assertIs(game.cards[0], GameTemplate.default().cards[0])
+
+    def test_games_are_independent(self):
+        first_players, second_players = make_players(), make_players()
+        first = self.template.new_game(first_players, first_players[0], seed=1)
+        second = self.template.new_game(second_players, second_players[0],
+                                        seed=1)
+        first.territories[0].troops = 50
+        first.deck.draw()
+        self.assertEqual(second.territories[0].troops, 1)
+        self.assertEqual(len(second.deck.cards), len(first.deck.cards) + 1)
+        self.assertEqual(list(self.template.state.owner),
+                         [-1] * len(self.template.map))
+        self.assertEqual(len(self.template.state.players), 0)
+
+    def test_initial_board_is_consistent(self):
+        players = make_players(4)
+        game = self.template.new_game(players, players[0], seed=3)
+        counts = game.state.territory_counts()
+        for player in players:
+            index = game.state.player_index(player)
+            self.assertEqual(counts[index], len(player.territories))
+            for territory in player.territories:
+                self.assertIs(territory.owner, player)
+        expected = game.state.zobrist.board_hash(game.state.owner,
+                                                 game.state.troops)
+        self.assertEqual(game.state.hash, expected)
+        # Cartas distribuídas em rodízio a partir do jogador após o entregador
+        self.assertEqual([len(p.territories) for p in players], [10, 11, 11, 10])
+
+    def test_destroy_missions_are_copied(self):
+        missions = [m for m in load_missions()
+                    if 'destruir' in m['description'].lower()]
+        first = self.template.mission_predicate(missions[0])
+        second = self.template.mission_predicate(missions[0])
+        self.assertIsInstance(first, DestroyPlayerMission)
+        self.assertIsNot(first, second)
+        first.target = 1
+        self.assertNotEqual(second.target, 1)
+
+    def test_batch_is_reproducible(self):
+        def seatings():
+            for _ in range(4):
+                players = make_players()
+                yield players, players[0]
+
+        games = self.template.new_games(seatings(), seed=7)
+        again = self.template.new_games(seatings(), seed=7)
+        self.assertEqual(len(games), 4)
+        self.assertEqual([board(g) for g in games], [board(g) for g in again])
+        self.assertNotEqual(board(games[0]), board(games[1]))
+
+    def test_too_many_players(self):
+        players = make_players(9)
+        with self.assertRaises(ValueError):
+            self.template.new_game(players, players[0], seed=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
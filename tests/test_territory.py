@@ -27,6 +27,12 @@ class TestTerritory(unittest.TestCase):
         self.assertTrue(self.territory.is_border_with("Peru"))
         self.assertFalse(self.territory.is_border_with("França"))
 
+    def test_is_adjacent_to_unbound(self):
+        argentina = Territory("Argentina", "América do Sul", ["Brasil"])
+        franca = Territory("França", "Europa")
+        self.assertTrue(self.territory.is_adjacent_to(argentina))
+        self.assertFalse(self.territory.is_adjacent_to(franca))
+
     def test_set_owner(self):
         self.territory.owner = self.player
         self.assertEqual(self.territory.owner, self.player)
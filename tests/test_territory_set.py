@@ -0,0 +1,58 @@
+# test_territory_set.py
+# Testes para a coleção indexada de territórios do jogador
+
+import unittest
+from war.territory_set import TerritorySet
+from war.territory import Territory
+from war.player import Player
+
+
+class TestTerritorySet(unittest.TestCase):
+
+    def setUp(self):
+        self.brasil = Territory("Brasil", "América do Sul")
+        self.peru = Territory("Peru", "América do Sul")
+        self.chile = Territory("Chile", "América do Sul")
+        self.chile.id = 7
+        self.territories = TerritorySet([self.brasil, self.peru])
+
+    def test_list_api(self):
+        self.territories.append(self.chile)
+        self.assertEqual(len(self.territories), 3)
+        self.assertIs(self.territories[0], self.brasil)
+        self.assertIs(self.territories[-1], self.chile)
+        self.assertIs(self.territories[1], self.peru)
+        self.assertEqual(self.territories[1:], [self.peru, self.chile])
+        self.assertEqual(self.territories, [self.brasil, self.peru, self.chile])
+        with self.assertRaises(IndexError):
+            self.territories[3]
+
+    def test_add_is_idempotent(self):
+        self.territories.add(self.brasil)
+        self.assertEqual(len(self.territories), 2)
+
+    def test_remove_keeps_order(self):
+        self.territories.append(self.chile)
+        self.territories.remove(self.peru)
+        self.assertEqual(list(self.territories), [self.brasil, self.chile])
+        self.assertNotIn(self.peru, self.territories)
+        with self.assertRaises(ValueError):
+            self.territories.remove(self.peru)
+
+    def test_lookup_by_name_and_id(self):
+        self.territories.append(self.chile)
+        self.assertIs(self.territories.get("Peru"), self.peru)
+        self.assertIsNone(self.territories.get("França"))
+        self.assertIs(self.territories.get_by_id(7), self.chile)
+        self.territories.discard(self.chile)
+        self.assertIsNone(self.territories.get_by_id(7))
+
+    def test_player_wraps_assigned_lists(self):
+        player = Player("Ana", "Verde")
+        player.territories = [self.brasil]
+        self.assertIsInstance(player.territories, TerritorySet)
+        self.assertIn(self.brasil, player.territories)
+
+
+if __name__ == '__main__':
+    unittest.main()
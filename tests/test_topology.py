@@ -0,0 +1,73 @@
+# test_topology.py
+# Testes para a topologia compilada do mapa
+
+import unittest
+from war.topology import MapTopology
+from war.utils_data import load_map_data
+
+
+class TestMapTopology(unittest.TestCase):
+
+    def setUp(self):
+        self.map_data = {
+            'continents': [
+                {'name': 'Europa', 'territories': ['França']},
+                {'name': 'América do Sul', 'territories': ['Brasil', 'Argentina']}
+            ],
+            'territories': [
+                {'name': 'Brasil', 'continent': 'América do Sul', 'borders': ['Argentina', 'Inexistente']},
+                {'name': 'Argentina', 'continent': 'América do Sul', 'borders': ['Brasil']},
+                {'name': 'França', 'continent': 'Europa'}
+            ]
+        }
+        self.topology = MapTopology.from_map_data(self.map_data)
+
+    def test_ids_and_names(self):
+        self.assertEqual(len(self.topology), 3)
+        self.assertEqual(self.topology.id_of('Argentina'), 1)
+        self.assertIsNone(self.topology.id_of('Japão'))
+        self.assertEqual(self.topology.name_of(2), 'França')
+
+    def test_continents_follow_map_order(self):
+        self.assertEqual(self.topology.continent_names, ('Europa', 'América do Sul'))
+        self.assertEqual(list(self.topology.continent_of), [1, 1, 0])
+        self.assertEqual(self.topology.territories_in_continent(1), [0, 1])
+
+    def test_csr_neighbors(self):
+        # Fronteiras desconhecidas são ignoradas
+        self.assertEqual(list(self.topology.offsets), [0, 1, 2, 2])
+        self.assertEqual(list(self.topology.neighbors), [1, 0])
+        self.assertEqual(self.topology.neighbors_of(0), (1,))
+        self.assertEqual(self.topology.degree(2), 0)
+
+    def test_are_adjacent(self):
+        self.assertTrue(self.topology.are_adjacent(0, 1))
+        self.assertFalse(self.topology.are_adjacent(0, 2))
+        self.assertTrue(self.topology.are_adjacent_by_name('Argentina', 'Brasil'))
+        self.assertFalse(self.topology.are_adjacent_by_name('Brasil', 'Japão'))
+
+    def test_real_map_matches_borders(self):
+        map_data = load_map_data()
+        topology = MapTopology.from_map_data(map_data)
+        for territory in map_data['territories']:
+            a = topology.id_of(territory['name'])
+            for border in territory['borders']:
+                self.assertTrue(topology.are_adjacent(a, topology.id_of(border)))
+            self.assertEqual(topology.degree(a), len(set(territory['borders'])))
+
+    def test_large_sparse_map(self):
+        # Anel de 5000 territórios: adjacência só entre vizinhos do anel
+        size = 5000
+        names = [f'T{i}' for i in range(size)]
+        borders = [[names[i - 1], names[(i + 1) % size], names[i - 1]]
+                   for i in range(size)]
+        topology = MapTopology(names, ['C'] * size, borders)
+        self.assertTrue(topology.are_adjacent(0, size - 1))
+        self.assertTrue(topology.are_adjacent(2500, 2501))
+        self.assertFalse(topology.are_adjacent(0, 2500))
+        self.assertEqual(topology.degree(0), 2)
+        self.assertEqual(len(topology.neighbors), 2 * size)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+# test_tournament.py
+# Testes para o torneio de estratégias
+
+import unittest
+from war.player import Player
+from war.tournament import (wilson_interval, seat_order, game_seed,
+                            play_tournament_game, run_tournament, iter_tournament)
+
+
+class TestTournamentHelpers(unittest.TestCase):
+
+    def test_wilson_interval(self):
+        self.assertEqual(wilson_interval(0, 0), (0.0, 0.0))
+        low, high = wilson_interval(50, 100)
+        self.assertLess(low, 0.5)
+        self.assertGreater(high, 0.5)
+        self.assertAlmostEqual((low + high) / 2, 0.5)
+
+    def test_seat_order_rotates(self):
+        names = ['a', 'b', 'c']
+        self.assertEqual(seat_order(names, 0), ['a', 'b', 'c'])
+        self.assertEqual(seat_order(names, 1), ['b', 'c', 'a'])
+        self.assertEqual(seat_order(names, 3), ['a', 'b', 'c'])
+
+    def test_game_seed_is_stable(self):
+        self.assertEqual(game_seed(1, 5), game_seed(1, 5))
+        self.assertNotEqual(game_seed(1, 5), game_seed(1, 6))
+
+
+class TestTournament(unittest.TestCase):
+
+    def setUp(self):
+        self.strategies = {'a': Player, 'b': Player, 'c': Player}
+
+    def test_game_is_reproducible(self):
+        task = (0, 99, ['a', 'b', 'c'], self.strategies, 5)
+        self.assertEqual(play_tournament_game(task), play_tournament_game(task))
+
+    def test_run_inline(self):
+        results = []
+        stats = run_tournament(self.strategies, 6, processes=1, max_turns=3,
+                               on_result=results.append)
+        self.assertEqual(stats.games, 6)
+        self.assertEqual(len(results), 6)
+        self.assertEqual(stats.played, {'a': 6, 'b': 6, 'c': 6})
+        self.assertEqual(set(stats.win_rates()), {'a', 'b', 'c'})
+
+    def test_pool_matches_inline(self):
+        inline = sorted((r['game_id'], r['dealer_seat'], r['turns']) for r in
+                        iter_tournament(self.strategies, 4, processes=1, max_turns=3))
+        pooled = sorted((r['game_id'], r['dealer_seat'], r['turns']) for r in
+                        iter_tournament(self.strategies, 4, processes=2, max_turns=3))
+        self.assertEqual(inline, pooled)
+
+
+if __name__ == '__main__':
+    unittest.main()
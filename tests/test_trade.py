@@ -0,0 +1,165 @@
+# test_trade.py
+# Testes para a troca de cartas por exércitos
+
+import copy
+import unittest
+from itertools import combinations
+from war.bots import Bot, GameView
+from war.card import Card
+from war.trade import (JOKER, Hand, is_valid_trade, trade_bonus)
+from tests.helpers import new_game
+
+
+def card(symbol, name=None):
+    return Card(name, symbol)
+
+
+def brute_force_can_trade(cards):
+    return any(is_valid_trade(list(trio)) for trio in combinations(cards, 3))
+
+
+class TestTradeRules(unittest.TestCase):
+
+    def test_bonus_sequence(self):
+        self.assertEqual([trade_bonus(i) for i in range(9)],
+                         [4, 6, 8, 10, 12, 15, 20, 25, 30])
+
+    def test_valid_sets(self):
+        q, c, t, j = 'quadrado', 'círculo', 'triângulo', JOKER
+        self.assertTrue(is_valid_trade([card(q), card(q), card(q)]))
+        self.assertTrue(is_valid_trade([card(q), card(c), card(t)]))
+        self.assertTrue(is_valid_trade([card(q), card(c), card(j)]))
+        self.assertTrue(is_valid_trade([card(q), card(q), card(j)]))
+        self.assertTrue(is_valid_trade([card(j), card(j), card(j)]))
+        self.assertFalse(is_valid_trade([card(q), card(q), card(c)]))
+        self.assertFalse(is_valid_trade([card(q), card(q)]))
+        same = card(q)
+        self.assertFalse(is_valid_trade([same, same, card(q)]))
+
+
+class TestHand(unittest.TestCase):
+
+    def test_counters_follow_list_operations(self):
+        hand = Hand([card('quadrado'), card('círculo')])
+        hand.append(card(JOKER))
+        hand.extend([card('quadrado')])
+        self.assertEqual(hand.symbol_count('quadrado'), 2)
+        self.assertEqual(hand.jokers, 1)
+        hand.remove(hand[0])
+        hand.pop()
+        self.assertEqual(hand.symbol_count('quadrado'), 0)
+        hand[:] = [card('triângulo')] * 2
+        self.assertEqual(hand.symbol_count('triângulo'), 2)
+        del hand[0]
+        self.assertEqual(hand.symbol_count('triângulo'), 1)
+        hand.clear()
+        self.assertEqual(hand.symbol_count('triângulo'), 0)
+        self.assertEqual(hand, [])
+
+    def test_copy_keeps_counters(self):
+        hand = Hand([card('quadrado'), card('quadrado'), card(JOKER)])
+        for clone in (copy.copy(hand), copy.deepcopy(hand)):
+            self.assertEqual(clone.symbol_count('quadrado'), 2)
+            self.assertTrue(clone.can_trade())
+
+    def test_can_trade_matches_brute_force(self):
+        symbols = ['quadrado', 'círculo', 'triângulo', JOKER]
+        for size in range(6):
+            for hand_symbols in combinations(symbols * 3, size):
+                cards = [card(symbol) for symbol in hand_symbols]
+                hand = Hand(cards)
+                self.assertEqual(hand.can_trade(),
+                                 brute_force_can_trade(cards), hand_symbols)
+                best = hand.best_trade()
+                if hand.can_trade():
+                    self.assertTrue(is_valid_trade(best))
+                    self.assertTrue(all(c in hand for c in best))
+                else:
+                    self.assertIsNone(best)
+
+    def test_best_trade_saves_jokers(self):
+        joker = card(JOKER)
+        hand = Hand([card('quadrado'), card('quadrado'), joker,
+                     card('círculo'), card('triângulo')])
+        self.assertNotIn(joker, hand.best_trade())
+
+    def test_best_trade_prefers_owned_territories(self):
+        mine = card('quadrado', 'Brasil')
+        hand = Hand([card('quadrado', 'Chile'), card('quadrado', 'Peru'),
+                     card('quadrado', 'México'), mine])
+        best = hand.best_trade(lambda c: c.territory_name == 'Brasil')
+        self.assertIn(mine, best)
+
+
+class TestGameTrade(unittest.TestCase):
+
+    def setUp(self):
+        self.game = new_game(seed=1)
+        self.player = self.game.players[1]
+
+    def give(self, cards):
+        for c in cards:
+            self.player.receive_card(c)
+
+    def test_trade_cards(self):
+        owned = self.player.territories[0]
+        troops = owned.troops
+        cards = [card('quadrado', owned.name), card('círculo'),
+                 card('triângulo')]
+        self.give(cards)
+        self.assertEqual(self.game.trade_cards(self.player, cards), 4)
+        self.assertEqual(owned.troops, troops + 2)
+        self.assertEqual(len(self.player.cards), 0)
+        self.assertEqual(self.game.deck.cards[:3], cards)
+        self.give([card('quadrado'), card('quadrado'), card(JOKER)])
+        self.assertEqual(
+            self.game.trade_cards(self.player, list(self.player.cards)), 6)
+        self.assertEqual(self.game.trades, 2)
+
+    def test_invalid_trades_raise(self):
+        cards = [card('quadrado'), card('quadrado'), card('círculo')]
+        self.give(cards)
+        with self.assertRaises(ValueError):
+            self.game.trade_cards(self.player, cards)
+        with self.assertRaises(ValueError):
+            self.game.trade_cards(self.player, [card('quadrado')] * 3)
+        self.assertEqual(len(self.player.cards), 3)
+        self.assertEqual(self.game.trades, 0)
+
+    def test_bot_trades_at_turn_start(self):
+        self.player.bot = Bot()
+        self.give([card('quadrado'), card('círculo'), card('triângulo')])
+        armies = self.game.phase_1_distribute_armies(self.player)
+        self.assertEqual(armies,
+                         self.game.calculate_armies_to_receive(self.player) + 4)
+        self.assertEqual(len(self.player.cards), 0)
+
+    def test_full_hand_forces_trade(self):
+        class HoardingBot(Bot):
+            def trade(self, view):
+                return None
+
+        self.player.bot = HoardingBot()
+        self.give([card('quadrado'), card('quadrado'), card('círculo'),
+                   card('círculo'), card('triângulo')])
+        self.game.phase_1_distribute_armies(self.player)
+        self.assertEqual(len(self.player.cards), 2)
+        self.assertEqual(self.game.trades, 1)
+
+    def test_view_and_snapshot(self):
+        self.give([card('quadrado'), card('quadrado'), card('quadrado')])
+        view = GameView(self.game, self.player)
+        self.assertTrue(view.can_trade())
+        self.assertEqual(view.trade_bonus, 4)
+        snapshot = self.game.snapshot()
+        self.game.trade_cards(self.player, view.best_trade())
+        self.game.restore(snapshot)
+        self.assertEqual(self.game.trades, 0)
+        self.assertEqual(self.player.cards.symbol_count('quadrado'), 3)
+        fork = self.game.fork()
+        self.assertTrue(fork.players[1].cards.can_trade())
+        self.assertIsNot(fork.players[1].cards, self.player.cards)
+
+
+if __name__ == '__main__':
+    unittest.main()
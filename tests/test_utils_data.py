@@ -2,9 +2,15 @@
 # Testes para funções de carregamento de dados JSON
 
 import unittest
+import copy
 import json
+import os
+import pickle
+import tempfile
 from pathlib import Path
-from war.utils_data import load_map_data, load_missions
+from war.utils_data import (load_map_data, load_missions, load_json,
+                            load_topology, preload, freeze, FrozenDict,
+                            FrozenList)
 
 
 class TestUtilsData(unittest.TestCase):
@@ -176,5 +182,52 @@ class TestUtilsData(unittest.TestCase):
             self.fail(f"missions.json não é um JSON válido: {e}")
 
 
+
+class TestCachedLoader(unittest.TestCase):
+    """Testes para o cache de dados do processo."""
+
+    def test_same_object_is_shared(self):
+        self.assertIs(load_map_data(), load_map_data())
+        self.assertIs(load_missions(), load_missions())
+        self.assertIs(load_topology(), load_topology())
+
+    def test_data_is_immutable(self):
+        data = load_map_data()
+        with self.assertRaises(TypeError):
+            data['territories'] = []
+        with self.assertRaises(TypeError):
+            data['territories'].append({})
+        with self.assertRaises(TypeError):
+            data['territories'][0]['borders'].remove('Argentina')
+        with self.assertRaises(TypeError):
+            load_missions().sort(key=lambda m: m['id'])
+
+    def test_frozen_copies(self):
+        data = freeze({'a': [1, {'b': 2}]})
+        self.assertIsInstance(data, FrozenDict)
+        self.assertIsInstance(data['a'], FrozenList)
+        self.assertIs(copy.deepcopy(data), data)
+        self.assertEqual(pickle.loads(pickle.dumps(data)), data)
+        self.assertEqual(list(data['a']), [1, {'b': 2}])
+
+    def test_reload_on_change(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'data.json')
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump([1, 2], f)
+            first = load_json(path)
+            self.assertIs(load_json(path), first)
+
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump([1, 2, 3], f)
+            stat = os.stat(path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            self.assertEqual(load_json(path), [1, 2, 3])
+
+    def test_preload(self):
+        preload()
+        self.assertIs(load_map_data(), load_map_data())
+
+
 if __name__ == '__main__':
     unittest.main()
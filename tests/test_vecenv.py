@@ -0,0 +1,113 @@
+# test_vecenv.py
+# Testes para o ambiente vetorizado (requer NumPy)
+
+import unittest
+from war.vecenv import VecEnv, np
+from war.enums import PHASE_PLACE_ARMIES, PHASE_ATTACK, PHASE_MOVE
+from war.game import Game
+from war.player import Player
+from war.topology import MapTopology
+
+
+def random_actions(rng, masks):
+    return (rng.random(masks.shape) * masks).argmax(axis=1)
+
+
+def small_topology():
+    names = ['A', 'B', 'C']
+    borders = [['B'], ['A', 'C'], ['B']]
+    return MapTopology(names, ['X'] * 3, borders)
+
+
+@unittest.skipIf(np is None, "NumPy não instalado")
+class TestVecEnv(unittest.TestCase):
+
+    def setUp(self):
+        self.env = VecEnv(64, players=3, seed=0)
+        self.obs, self.masks = self.env.reset()
+
+    def test_reset_deals_every_territory(self):
+        env = self.env
+        self.assertTrue((env.owned_count.sum(axis=1) == env.num_territories).all())
+        self.assertTrue((env.troops == 1).all())
+        self.assertTrue((env.phase == PHASE_PLACE_ARMIES).all())
+        self.assertTrue((env.owned_count.max(axis=1)
+                         - env.owned_count.min(axis=1) <= 1).all())
+        self.assertEqual(self.masks.shape, (64, env.num_actions))
+        # Do ponto de vista do jogador da vez, os seus territórios são 0
+        self.assertTrue(((self.obs['owner'] == 0).sum(axis=1)
+                         == env.owned_count[np.arange(64), env.player]).all())
+
+    def test_random_play_keeps_invariants(self):
+        env = self.env
+        rng = np.random.default_rng(1)
+        masks = self.masks
+        for _ in range(300):
+            obs, masks, rewards, dones = env.step(random_actions(rng, masks))
+            self.assertTrue((env.owned_count.sum(axis=1) == env.num_territories).all())
+            self.assertTrue((env.troops >= 1).all())
+            counts = (env.owner[:, :, None] == np.arange(3)).sum(axis=1)
+            self.assertTrue((counts == env.owned_count).all())
+            self.assertTrue((rewards.sum(axis=1)[env.winners >= 0] == -1).all())
+            self.assertTrue(masks.any(axis=1).all())
+
+    def test_phases(self):
+        env = self.env
+        masks = self.masks
+        env.step(masks[:, :env.num_territories].argmax(axis=1))
+        self.assertTrue((env.phase == PHASE_ATTACK).all())
+        env.step(np.full(64, env.end_action))
+        self.assertTrue((env.phase == PHASE_MOVE).all())
+        players = env.player.copy()
+        env.step(np.full(64, env.end_action))
+        self.assertTrue((env.phase == PHASE_PLACE_ARMIES).all())
+        self.assertTrue((env.player == (players + 1) % 3).all())
+        self.assertTrue((env.turns == 1).all())
+
+    def test_invalid_action(self):
+        with self.assertRaises(ValueError):
+            self.env.step(np.full(64, self.env.end_action))
+
+    def test_masks_match_move_generator(self):
+        players = [Player(f"P{i}", "Azul") for i in range(3)]
+        game = Game(players, players[0], seed=3, headless=True)
+        for territory in game.territories[::2]:
+            territory.troops = 3
+        self.env.load_game(0, game, players[1], PHASE_ATTACK)
+        edges = self.env.masks[0, self.env.num_territories:self.env.end_action]
+        expected = game.move_generator().attack_masks()[1]
+        self.assertTrue((edges == expected).all())
+        self.assertTrue(self.env.masks[0, self.env.end_action])
+
+    def test_conquest_finishes_and_resets(self):
+        env = VecEnv(1, players=2, topology=small_topology(), seed=5)
+        env.reset()
+        env.owner[0] = [0, 1, 0]
+        env.owned_count[0] = [2, 1]
+        env.troops[0] = [50, 1, 50]
+        env.player[0] = 0
+        env.phase[0] = PHASE_ATTACK
+        masks = env.action_masks()
+        attack = env.num_territories + 0  # aresta A -> B
+        for _ in range(20):
+            _, masks, rewards, dones = env.step([attack])
+            if dones[0]:
+                break
+        self.assertTrue(dones[0])
+        self.assertEqual(env.winners[0], 0)
+        self.assertEqual(list(rewards[0]), [1.0, -1.0])
+        # A partida recomeçou
+        self.assertEqual(env.owned_count[0].sum(), 3)
+        self.assertEqual(env.phase[0], PHASE_PLACE_ARMIES)
+
+
+@unittest.skipIf(np is not None, "NumPy instalado")
+class TestWithoutNumpy(unittest.TestCase):
+
+    def test_requires_numpy(self):
+        with self.assertRaises(ImportError):
+            VecEnv(2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+# test_zobrist.py
+# Testes para o hash de Zobrist das posições
+
+import unittest
+from war.zobrist import (ZobristKeys, zobrist_keys, troop_bucket,
+                         TROOP_BUCKETS)
+from war.state import GameState
+from war.player import Player
+from war.card import Card
+from war.enums import PHASE_ATTACK, PHASE_MOVE
+from tests.helpers import new_game
+
+
+def full_hash(state):
+    return state.zobrist.board_hash(state.owner, state.troops)
+
+
+class TestZobristKeys(unittest.TestCase):
+
+    def test_buckets(self):
+        self.assertEqual([troop_bucket(t) for t in range(6)], [0, 1, 2, 3, 4, 5])
+        self.assertEqual(troop_bucket(5), troop_bucket(6))
+        self.assertEqual(troop_bucket(1000), TROOP_BUCKETS - 1)
+
+    def test_keys_are_shared_and_deterministic(self):
+        self.assertIs(zobrist_keys(42), zobrist_keys(42))
+        self.assertEqual(ZobristKeys(10).owner, ZobristKeys(10).owner)
+
+    def test_too_many_players(self):
+        state = GameState(2, players=[Player(str(i), "Azul") for i in range(3)])
+        with self.assertRaises(ValueError):
+            state.enable_hashing(ZobristKeys(2, max_players=2))
+
+
+class TestPositionHash(unittest.TestCase):
+
+    def setUp(self):
+        self.game = new_game(seed=2)
+
+    def test_incremental_matches_full_hash(self):
+        game = self.game
+        attacker, defender = next(
+            (t, n) for t in game.territories for n in game.territories
+            if t.is_adjacent_to(n) and t.owner is not n.owner)
+        attacker.troops = 20
+        for _ in range(5):
+            if game.attack_territory(attacker, defender, 3):
+                break
+        game.place_armies(attacker.owner, attacker.name, 4)
+        self.assertEqual(game.state.hash, full_hash(game.state))
+
+    def test_same_position_same_hash(self):
+        self.assertEqual(new_game(seed=2).position_hash(), self.game.position_hash())
+        self.assertNotEqual(new_game(seed=3).position_hash(),
+                            self.game.position_hash())
+
+    def test_move_and_back_restores_hash(self):
+        territory = self.game.territories[0]
+        before = self.game.position_hash()
+        territory.troops += 5
+        self.assertNotEqual(self.game.position_hash(), before)
+        territory.troops -= 5
+        self.assertEqual(self.game.position_hash(), before)
+
+    def test_turn_and_phase(self):
+        alice, bob = self.game.players[:2]
+        self.game.set_phase(alice, PHASE_ATTACK)
+        attack = self.game.position_hash()
+        self.game.set_phase(alice, PHASE_MOVE)
+        self.assertNotEqual(self.game.position_hash(), attack)
+        self.game.set_phase(bob, PHASE_ATTACK)
+        self.assertNotEqual(self.game.position_hash(), attack)
+        self.game.set_phase(alice, PHASE_ATTACK)
+        self.assertEqual(self.game.position_hash(), attack)
+
+    def test_hands_are_optional(self):
+        board = self.game.position_hash()
+        self.game.players[0].receive_card(self.game.cards[0])
+        self.game.players[0].receive_card(Card("Fora", "quadrado"))
+        self.assertEqual(self.game.position_hash(), board)
+        self.assertNotEqual(self.game.position_hash(include_hands=True), board)
+
+    def test_undo_and_fork_keep_hash(self):
+        before = self.game.position_hash()
+        mark = self.game.mark()
+        self.game.territories[3].troops = 9
+        self.game.undo(mark)
+        self.assertEqual(self.game.position_hash(), before)
+        self.assertEqual(self.game.fork().position_hash(), before)
+
+
+if __name__ == '__main__':
+    unittest.main()
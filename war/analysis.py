@@ -0,0 +1,247 @@
+"""
+Análise estática do grafo do mapa: distâncias entre todos os pares,
+pontes, pontos de articulação e pontos de entrada dos continentes.
+
+O resultado depende só da topologia, então é calculado uma vez e, para o
+mapa padrão, gravado ao lado do map.json; os próximos processos apenas o
+carregam. Outros mapas (sintéticos, de teste) ficam só na memória.
+"""
+import hashlib
+import json
+from array import array
+from pathlib import Path
+from .utils_data import load_topology
+
+ANALYSIS_FORMAT_VERSION = 1
+
+# Distância entre territórios sem caminho entre si
+UNREACHABLE = -1
+
+DEFAULT_ANALYSIS_PATH = (Path(__file__).parent.parent / 'data'
+                         / 'map.analysis.json')
+
+
+def topology_fingerprint(topology):
+    """
+    Identifica a topologia; muda se territórios ou fronteiras mudarem.
+    Calculada uma vez e guardada na própria topologia, que é imutável.
+    """
+    fingerprint = getattr(topology, '_fingerprint', None)
+    if fingerprint is not None:
+        return fingerprint
+    digest = hashlib.sha256()
+    digest.update('\n'.join(topology.names).encode('utf-8'))
+    digest.update(topology.continent_of.tobytes())
+    digest.update(topology.offsets.tobytes())
+    digest.update(topology.neighbors.tobytes())
+    topology._fingerprint = digest.hexdigest()
+    return topology._fingerprint
+
+
+def bfs_distances(topology, sources):
+    """Distância de cada território ao conjunto `sources` (BFS multi-origem)."""
+    offsets, neighbors = topology.offsets, topology.neighbors
+    distances = array('h', [UNREACHABLE]) * len(topology)
+    frontier = []
+    for source in sources:
+        if distances[source] == UNREACHABLE:
+            distances[source] = 0
+            frontier.append(source)
+    depth = 0
+    while frontier:
+        depth += 1
+        next_frontier = []
+        for territory in frontier:
+            for edge in range(offsets[territory], offsets[territory + 1]):
+                neighbor = neighbors[edge]
+                if distances[neighbor] == UNREACHABLE:
+                    distances[neighbor] = depth
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+    return distances
+
+
+def _undirected_neighbors(topology):
+    adjacency = [set(topology.neighbors_of(t)) for t in range(len(topology))]
+    for territory, neighbors in enumerate(adjacency):
+        for neighbor in neighbors:
+            adjacency[neighbor].add(territory)
+    return [sorted(neighbors) for neighbors in adjacency]
+
+
+def cut_structure(topology):
+    """
+    Pontos de articulação e pontes do grafo (fronteiras tratadas como não
+    dirigidas), pelo algoritmo de Tarjan em versão iterativa.
+    """
+    adjacency = _undirected_neighbors(topology)
+    size = len(adjacency)
+    order = [-1] * size
+    low = [0] * size
+    articulation = set()
+    bridges = []
+    counter = 0
+    for root in range(size):
+        if order[root] != -1:
+            continue
+        order[root] = low[root] = counter
+        counter += 1
+        root_children = 0
+        # Pilha de (território, pai, próximo índice de vizinho)
+        stack = [(root, -1, 0)]
+        while stack:
+            territory, parent, position = stack.pop()
+            if position < len(adjacency[territory]):
+                stack.append((territory, parent, position + 1))
+                neighbor = adjacency[territory][position]
+                if neighbor == parent:
+                    continue
+                if order[neighbor] == -1:
+                    order[neighbor] = low[neighbor] = counter
+                    counter += 1
+                    if territory == root:
+                        root_children += 1
+                    stack.append((neighbor, territory, 0))
+                else:
+                    low[territory] = min(low[territory], order[neighbor])
+            elif parent != -1:
+                low[parent] = min(low[parent], low[territory])
+                if low[territory] > order[parent]:
+                    bridges.append((min(parent, territory),
+                                    max(parent, territory)))
+                if parent != root and low[territory] >= order[parent]:
+                    articulation.add(parent)
+        if root_children > 1:
+            articulation.add(root)
+    return tuple(sorted(articulation)), tuple(sorted(bridges))
+
+
+class MapAnalysis:
+    """
+    Dados derivados do grafo do mapa.
+
+    distances: matriz de distâncias em saltos (achatada, n x n).
+    articulation_points: territórios cuja perda separa o mapa.
+    bridges: fronteiras (a, b) cuja remoção separa o mapa.
+    entry_points: por continente, territórios com vizinho fora dele.
+    border_distance: saltos de cada território até o território de outro
+        continente mais próximo (profundidade dentro do continente).
+    """
+
+    def __init__(self, topology, _data=None):
+        self.topology = topology
+        self.size = size = len(topology)
+        if _data is not None:
+            self.distances = array('h', _data['distances'])
+            self.articulation_points = tuple(_data['articulation_points'])
+            self.bridges = tuple(tuple(b) for b in _data['bridges'])
+            self.entry_points = tuple(tuple(e) for e in _data['entry_points'])
+            self.border_distance = array('h', _data['border_distance'])
+            return
+
+        self.distances = array('h')
+        for source in range(size):
+            self.distances.extend(bfs_distances(topology, (source,)))
+        self.articulation_points, self.bridges = cut_structure(topology)
+
+        continent_of = topology.continent_of
+        entry_points = [[] for _ in topology.continent_names]
+        for territory in range(size):
+            continent = continent_of[territory]
+            if any(continent_of[n] != continent
+                   for n in topology.neighbors_of(territory)):
+                entry_points[continent].append(territory)
+        self.entry_points = tuple(tuple(e) for e in entry_points)
+
+        self.border_distance = array('h', [UNREACHABLE]) * size
+        for continent, entries in enumerate(self.entry_points):
+            depth = bfs_distances(topology, entries)
+            for territory in range(size):
+                if continent_of[territory] == continent:
+                    self.border_distance[territory] = depth[territory]
+
+    def distance(self, a, b):
+        """Saltos de a até b (UNREACHABLE se não houver caminho)."""
+        return self.distances[a * self.size + b]
+
+    def distances_from(self, territory_id):
+        start = territory_id * self.size
+        return self.distances[start:start + self.size]
+
+    def is_articulation_point(self, territory_id):
+        return territory_id in self.articulation_points
+
+    def frontier_depth(self, owner, player_index):
+        """
+        Distância de cada território ao território inimigo mais próximo
+        (0 nos inimigos), dado o array de donos atual. 1 é a fronteira.
+        """
+        return bfs_distances(self.topology,
+                             [t for t, o in enumerate(owner)
+                              if o != player_index])
+
+    def save(self, path):
+        data = {
+            'version': ANALYSIS_FORMAT_VERSION,
+            'fingerprint': topology_fingerprint(self.topology),
+            'size': self.size,
+            'distances': self.distances.tolist(),
+            'articulation_points': list(self.articulation_points),
+            'bridges': [list(b) for b in self.bridges],
+            'entry_points': [list(e) for e in self.entry_points],
+            'border_distance': self.border_distance.tolist(),
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+    @classmethod
+    def load(cls, path, topology):
+        """Carrega uma análise gravada; ValueError se for de outro mapa."""
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != ANALYSIS_FORMAT_VERSION:
+            raise ValueError(f"Versão de análise de mapa não suportada: {path}")
+        if data.get('fingerprint') != topology_fingerprint(topology):
+            raise ValueError(f"Análise de outro mapa: {path}")
+        return cls(topology, _data=data)
+
+    @classmethod
+    def load_or_build(cls, topology, path=DEFAULT_ANALYSIS_PATH):
+        """
+        Carrega a análise do disco ou a calcula e grava. Se o diretório não
+        aceitar escrita, a análise calculada é usada só neste processo.
+        """
+        path = Path(path)
+        if path.exists():
+            try:
+                return cls.load(path, topology)
+            except (ValueError, KeyError, json.JSONDecodeError):
+                pass
+        analysis = cls(topology)
+        try:
+            analysis.save(path)
+        except OSError:
+            pass
+        return analysis
+
+
+_cache = {}
+
+
+def map_analysis(topology, path=None):
+    """
+    Análise compartilhada no processo, por topologia. Sem `path`, só a
+    topologia do mapa padrão é persistida (em DEFAULT_ANALYSIS_PATH); as
+    demais são calculadas e guardadas só na memória.
+    """
+    key = topology_fingerprint(topology)
+    analysis = _cache.get(key)
+    if analysis is None:
+        if path is None and topology is load_topology():
+            path = DEFAULT_ANALYSIS_PATH
+        if path is None:
+            analysis = MapAnalysis(topology)
+        else:
+            analysis = MapAnalysis.load_or_build(topology, path)
+        _cache[key] = analysis
+    return analysis
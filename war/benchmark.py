@@ -0,0 +1,199 @@
+"""
+Benchmark de escala do motor em mapas sintéticos (ver war.mapgen).
+
+Para cada tamanho de mapa mede: criação de jogos a partir do molde,
+montagem do gerador de jogadas e listagem dos ataques, rodadas de combate,
+conquistas (desfeitas com undo) e turnos completos de uma partida de bots
+(aleatórios por padrão, para medir o motor e não a análise do bot). Os
+tempos por operação que crescem com o mapa apontam os caminhos O(n) e
+O(n²) do motor.
+
+Uso: python -m war.benchmark --sizes 42 500 2000 --players 4
+"""
+import argparse
+from time import perf_counter
+from .bots import BOTS, RandomBot
+from .game import GameTemplate
+from .mapgen import generate_map
+from .moves import MoveGenerator
+from .player import Player
+from .enums import COLORS
+
+# Fração do mapa das missões de conquista (24 e 18 de 42 no mapa original)
+MISSION_SHARES = (24 / 42, 18 / 42)
+
+
+def benchmark_missions(territories, players):
+    """Missões de conquista proporcionais ao mapa, uma por jogador."""
+    return [{'id': i + 1,
+             'description': f"Conquistar {max(1, round(territories * share))}"
+                            " territórios"}
+            for i, share in enumerate(MISSION_SHARES * players)][:players]
+
+
+def _players(count, bot=None):
+    return [Player(f"P{i}", COLORS[i % len(COLORS)],
+                   bot=bot() if bot is not None else None)
+            for i in range(count)]
+
+
+def _per_operation(function, repeat, minimum_time=0.2):
+    """Menor tempo médio (s) por chamada entre `repeat` rodadas."""
+    best = None
+    for _ in range(repeat):
+        calls = 0
+        start = perf_counter()
+        elapsed = 0.0
+        while elapsed < minimum_time or calls == 0:
+            function()
+            calls += 1
+            elapsed = perf_counter() - start
+        average = elapsed / calls
+        best = average if best is None else min(best, average)
+    return best
+
+
+def _first_border(game):
+    """Primeira fronteira entre territórios de donos diferentes."""
+    owner = game.state.owner
+    for source in range(len(owner)):
+        for target in game.topology.neighbors_of(source):
+            if owner[source] != owner[target]:
+                return game.territories[source], game.territories[target]
+    raise ValueError("O mapa não tem fronteira entre jogadores")
+
+
+def benchmark_map(territories, players=3, average_degree=4.0, turns=50,
+                  seed=0, repeat=3, minimum_time=0.2, bot=RandomBot):
+    """
+    Mede um mapa sintético de `territories` territórios. Retorna um dict
+    com os tempos em microssegundos por operação e a vazão de turnos.
+    """
+    map_data = generate_map(territories, average_degree=average_degree,
+                            seed=seed)
+    start = perf_counter()
+    template = GameTemplate(map_data,
+                            benchmark_missions(territories, players))
+    template_us = (perf_counter() - start) * 1e6
+
+    def setup():
+        seats = _players(players)
+        template.new_game(seats, seats[0], seed=seed, headless=True)
+
+    seats = _players(players)
+    game = template.new_game(seats, seats[0], seed=seed, headless=True)
+    # No início toda pilha tem 1 tropa e não há ataque permitido; com 3
+    # tropas em cada território toda fronteira vira ataque a listar
+    for territory in game.territories:
+        territory.troops = 3
+    # Índices incrementais inscritos, como em uma partida de bots
+    game.move_generator()
+    game.frontier_index()
+    player_index = game.state.player_index(game.players[0])
+
+    def move_generation():
+        MoveGenerator(game.state).close()
+
+    def list_attacks():
+        # attacks() é um gerador: só consumido ele lista de fato os ataques
+        list(game.move_generator().attacks(player_index))
+
+    attacker, defender = _first_border(game)
+
+    def combat():
+        attacker.troops = 1000
+        defender.troops = 1000
+        game.attack_territory(attacker, defender, 3)
+
+    def conquest():
+        mark = game.mark()
+        attacker.troops = 4
+        defender.troops = 1
+        while not game.attack_territory(attacker, defender, 3):
+            attacker.troops = 4
+            defender.troops = 1
+        game.undo(mark)
+
+    timings = {
+        name: _per_operation(function, repeat, minimum_time) * 1e6
+        for name, function in (('setup_us', setup),
+                               ('movegen_us', move_generation),
+                               ('attacks_us', list_attacks),
+                               ('combat_us', combat),
+                               ('conquest_us', conquest))}
+
+    attack_moves = game.move_generator().attack_count(player_index)
+
+    seats = _players(players, bot)
+    game = template.new_game(seats, seats[0], seed=seed, headless=True)
+    start = perf_counter()
+    result = game.play_game(max_turns=turns)
+    elapsed = perf_counter() - start
+    return {
+        'territories': territories,
+        'edges': sum(len(t['borders']) for t in map_data['territories']) // 2,
+        'template_us': template_us,
+        **timings,
+        'attack_moves': attack_moves,
+        'turns': result['turns'],
+        'turns_per_second': result['turns'] / elapsed if elapsed else 0.0,
+    }
+
+
+def run_benchmark(sizes, players=3, average_degree=4.0, turns=50, seed=0,
+                  repeat=3, minimum_time=0.2, bot=RandomBot, on_result=None):
+    """Roda `benchmark_map` para cada tamanho e retorna a lista de resultados."""
+    results = []
+    for size in sizes:
+        result = benchmark_map(size, players, average_degree, turns, seed,
+                               repeat, minimum_time, bot)
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+    return results
+
+
+_COLUMNS = (('territories', 'territórios', '{:>11}'),
+            ('edges', 'fronteiras', '{:>10}'),
+            ('template_us', 'molde µs', '{:>10.0f}'),
+            ('setup_us', 'jogo µs', '{:>9.0f}'),
+            ('movegen_us', 'movegen µs', '{:>10.0f}'),
+            ('attacks_us', 'ataques µs', '{:>10.1f}'),
+            ('combat_us', 'combate µs', '{:>10.1f}'),
+            ('conquest_us', 'conquista µs', '{:>12.1f}'),
+            ('turns_per_second', 'turnos/s', '{:>9.1f}'))
+
+
+def format_header():
+    return ' '.join(f"{title:>{len(fmt.format(0))}}"
+                    for _, title, fmt in _COLUMNS)
+
+
+def format_row(result):
+    return ' '.join(fmt.format(result[key]) for key, _, fmt in _COLUMNS)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark de escala do War em mapas sintéticos")
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[42, 250, 1000, 4000])
+    parser.add_argument('--players', type=int, default=3)
+    parser.add_argument('--degree', type=float, default=4.0)
+    parser.add_argument('--turns', type=int, default=50,
+                        help="turnos da partida de bots em cada mapa")
+    parser.add_argument('--bot', choices=list(BOTS), default=RandomBot.name,
+                        help="bot da partida completa")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(format_header())
+    run_benchmark(args.sizes, args.players, args.degree, args.turns,
+                  args.seed, args.repeat, bot=BOTS[args.bot],
+                  on_result=lambda result: print(format_row(result),
+                                                 flush=True))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,294 @@
+from time import perf_counter_ns
+from .odds import BattleOdds
+from .trade import trade_bonus
+
+_odds = None
+
+
+def shared_odds():
+    """Tabela de odds compartilhada pelos bots do processo."""
+    global _odds
+    if _odds is None:
+        _odds = BattleOdds()
+    return _odds
+
+
+class GameView:
+    """
+    Visão somente leitura do jogo, do ponto de vista de um jogador.
+
+    Dono e tropas são memoryviews somente leitura sobre os arrays do
+    GameState, então montar a visão não copia o tabuleiro.
+    """
+
+    def __init__(self, game, player):
+        state = game.state
+        self.player_index = state.player_index(player)
+        self.topology = game.topology
+        self.owner = memoryview(state.owner).toreadonly()
+        self.troops = memoryview(state.troops).toreadonly()
+        self.controller = memoryview(state.controller).toreadonly()
+        self.player_count = len(state.players)
+        self.phase = game.phase
+        self.cards = tuple(player.cards)
+        self.trade_bonus = trade_bonus(game.trades)
+        self._hand = player.cards
+        self.rng = game.rng
+        self._territories = tuple(t.id for t in player.territories)
+        self._owned_count = state.owned_count
+        self._moves = game.move_generator()
+        self._frontier = game.frontier_index()
+        self._state = state
+        # Só a missão do próprio jogador é visível
+        predicates = game.mission_tracker.predicates
+        self.mission = (predicates[self.player_index]
+                        if self.player_index < len(predicates) else None)
+
+    def copy_state(self):
+        """Cópia do GameState para busca (não afeta o jogo)."""
+        return self._state.copy()
+
+    def my_territories(self):
+        """IDs dos territórios do jogador."""
+        return self._territories
+
+    def territory_count(self, player_index=None):
+        if player_index is None:
+            player_index = self.player_index
+        return self._owned_count[player_index]
+
+    def enemy_neighbors(self, territory_id):
+        owner = self.owner
+        me = self.player_index
+        return [n for n in self.topology.neighbors_of(territory_id)
+                if owner[n] != me]
+
+    def owned_neighbors(self, territory_id):
+        owner = self.owner
+        me = self.player_index
+        return [n for n in self.topology.neighbors_of(territory_id)
+                if owner[n] == me]
+
+    def is_frontier(self, territory_id):
+        """O território tem vizinho de outro dono?"""
+        return self._frontier.is_frontier(territory_id)
+
+    def frontier(self):
+        """IDs dos territórios de fronteira do jogador."""
+        return self._frontier.frontier(self.player_index)
+
+    def interior(self):
+        """IDs dos territórios do jogador sem vizinhos inimigos."""
+        return self._frontier.interior(self.player_index)
+
+    def attack_options(self):
+        """Pares (origem, destino) de ataques permitidos."""
+        return self._moves.attack_pairs(self.player_index)
+
+    def fortify_options(self):
+        """Pares (origem, destino) de deslocamentos permitidos."""
+        return self._moves.fortify_pairs(self.player_index)
+
+    def owns_card(self, card):
+        """A carta é de um território do jogador (rende exércitos extras)?"""
+        territory_id = self.topology.id_of(card.territory_name)
+        return (territory_id is not None
+                and self.owner[territory_id] == self.player_index)
+
+    def can_trade(self):
+        """O jogador tem alguma troca de cartas válida?"""
+        return self._hand.can_trade()
+
+    def best_trade(self):
+        """Melhor troca de cartas do jogador (ver Hand.best_trade) ou None."""
+        return self._hand.best_trade(self.owns_card)
+
+    def threat(self, territory_id):
+        """Tropas inimigas vizinhas menos as tropas do território."""
+        troops = self.troops
+        return (sum(troops[n] for n in self.enemy_neighbors(territory_id))
+                - troops[territory_id])
+
+
+class Bot:
+    """
+    Interface de um jogador automático.
+
+    Cada decisão recebe uma GameView e devolve uma ação:
+      place(view, armies)  -> [(territory_id, quantidade), ...]
+      attack(view)         -> (origem, destino, exércitos) ou None para parar
+      fortify(view)        -> (origem, destino, tropas) ou None para parar
+      trade(view)          -> três cartas a trocar ou None
+    O tempo de cada chamada fica em `decision_stats` (via `timed`).
+    """
+
+    name = 'bot'
+
+    def __init__(self, time_budget_ms=None):
+        self.time_budget_ns = (None if time_budget_ms is None
+                               else int(time_budget_ms * 1_000_000))
+        # {decisão: [chamadas, tempo total ns, maior tempo ns]}
+        self.decision_stats = {}
+        self.budget_overruns = 0
+
+    def timed(self, decision, *args):
+        """Chama a decisão medindo a latência."""
+        start = perf_counter_ns()
+        result = getattr(self, decision)(*args)
+        elapsed = perf_counter_ns() - start
+        stats = self.decision_stats.get(decision)
+        if stats is None:
+            self.decision_stats[decision] = [1, elapsed, elapsed]
+        else:
+            stats[0] += 1
+            stats[1] += elapsed
+            if elapsed > stats[2]:
+                stats[2] = elapsed
+        if self.time_budget_ns is not None and elapsed > self.time_budget_ns:
+            self.budget_overruns += 1
+        return result
+
+    def mean_latency_ms(self, decision):
+        stats = self.decision_stats.get(decision)
+        if not stats:
+            return 0.0
+        return stats[1] / stats[0] / 1_000_000
+
+    def place(self, view, armies):
+        territories = view.frontier() or view.my_territories()
+        return [(territories[0], armies)] if territories else []
+
+    def attack(self, view):
+        return None
+
+    def fortify(self, view):
+        return None
+
+    def trade(self, view):
+        # Troca assim que puder: exércitos agora valem mais que um bônus
+        # maior depois
+        return view.best_trade()
+
+
+class RandomBot(Bot):
+    """Escolhe ações permitidas ao acaso."""
+
+    name = 'aleatorio'
+
+    def __init__(self, stop_probability=0.2, time_budget_ms=None):
+        super().__init__(time_budget_ms)
+        self.stop_probability = stop_probability
+
+    def place(self, view, armies):
+        territories = view.frontier() or view.my_territories()
+        if not territories:
+            return []
+        counts = {}
+        for _ in range(armies):
+            territory = view.rng.choice(territories)
+            counts[territory] = counts.get(territory, 0) + 1
+        return list(counts.items())
+
+    def attack(self, view):
+        options = view.attack_options()
+        if not options or view.rng.random() < self.stop_probability:
+            return None
+        source, target = view.rng.choice(options)
+        return source, target, min(view.troops[source] - 1, 3)
+
+    def fortify(self, view):
+        options = view.fortify_options()
+        if not options or view.rng.random() < 0.5:
+            return None
+        source, target = view.rng.choice(options)
+        return source, target, view.rng.randint(1, view.troops[source] - 1)
+
+
+class GreedyBot(Bot):
+    """Ataca sempre a batalha com maior chance de conquista."""
+
+    name = 'guloso'
+
+    def __init__(self, min_probability=0.5, time_budget_ms=None):
+        super().__init__(time_budget_ms)
+        self.min_probability = min_probability
+        self.odds = shared_odds()
+
+    def place(self, view, armies):
+        troops = view.troops
+        best, best_margin = None, None
+        for territory in view.frontier():
+            weakest = min(troops[n] for n in view.enemy_neighbors(territory))
+            margin = troops[territory] - weakest
+            if best_margin is None or margin > best_margin:
+                best, best_margin = territory, margin
+        if best is None:
+            return super().place(view, armies)
+        return [(best, armies)]
+
+    def attack(self, view):
+        troops = view.troops
+        best, best_probability = None, self.min_probability
+        for source, target in view.attack_options():
+            probability = self.odds.conquest_probability(
+                troops[source] - 1, troops[target])
+            if probability >= best_probability:
+                best, best_probability = (source, target), probability
+        if best is None:
+            return None
+        return best[0], best[1], min(troops[best[0]] - 1, 3)
+
+    def fortify(self, view):
+        troops = view.troops
+        for territory in view.my_territories():
+            if troops[territory] > 1 and not view.is_frontier(territory):
+                for neighbor in view.owned_neighbors(territory):
+                    if view.is_frontier(neighbor):
+                        return territory, neighbor, troops[territory] - 1
+        return None
+
+
+class BorderDefenceBot(Bot):
+    """Reforça as fronteiras mais ameaçadas e só ataca com grande vantagem."""
+
+    name = 'defensivo'
+
+    def __init__(self, min_probability=0.8, time_budget_ms=None):
+        super().__init__(time_budget_ms)
+        self.min_probability = min_probability
+        self.odds = shared_odds()
+
+    def place(self, view, armies):
+        frontier = view.frontier()
+        if not frontier:
+            return super().place(view, armies)
+        return [(max(frontier, key=view.threat), armies)]
+
+    def attack(self, view):
+        troops = view.troops
+        for source, target in view.attack_options():
+            if view.threat(source) > 0:
+                continue  # não enfraquece uma fronteira ameaçada
+            probability = self.odds.conquest_probability(
+                troops[source] - 1, troops[target])
+            if probability >= self.min_probability:
+                return source, target, min(troops[source] - 1, 3)
+        return None
+
+    def fortify(self, view):
+        troops = view.troops
+        best, best_threat = None, None
+        for source, target in view.fortify_options():
+            if view.is_frontier(source):
+                continue
+            threat = view.threat(target)
+            if view.is_frontier(target) and (best_threat is None
+                                             or threat > best_threat):
+                best, best_threat = (source, target), threat
+        if best is None:
+            return None
+        return best[0], best[1], troops[best[0]] - 1
+
+
+BOTS = {bot.name: bot for bot in (RandomBot, GreedyBot, BorderDefenceBot)}
+
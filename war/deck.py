@@ -2,11 +2,12 @@ import random
 
 
 class Deck:
-    def __init__(self, cards=None):
+    def __init__(self, cards=None, rng=None):
         self.cards = cards if cards is not None else []
+        self.rng = rng if rng is not None else random
 
     def shuffle(self):
-        random.shuffle(self.cards)
+        self.rng.shuffle(self.cards)
 
     def draw(self):
         return self.cards.pop() if self.cards else None
@@ -22,3 +23,7 @@ class Deck:
 
     def add_cards(self, cards):
         self.cards.extend(cards)
+
+    def return_cards(self, cards):
+        """Devolve cartas trocadas para o fundo do baralho."""
+        self.cards[:0] = cards
@@ -0,0 +1,79 @@
+import random
+
+_FACES = (1, 2, 3, 4, 5, 6)
+
+# Limites de dados por rodada de combate
+MAX_ATTACK_DICE = 3
+MAX_DEFENSE_DICE = 2
+
+
+class DiceSource:
+    """
+    Fonte de dados de 6 lados sorteados em lote.
+
+    Em vez de uma chamada a `random.randint` por dado, sorteia um buffer
+    inteiro com uma única chamada a `choices` e o consome em fatias.
+    """
+
+    def __init__(self, rng=None, buffer_size=4096):
+        self.rng = rng if rng is not None else random
+        self.buffer_size = buffer_size
+        self._buffer = []
+        self._position = 0
+
+    def _refill(self, minimum):
+        self._buffer = self.rng.choices(
+            _FACES, k=max(self.buffer_size, minimum))
+        self._position = 0
+
+    def roll(self, quantity):
+        """Retorna uma lista com `quantity` dados."""
+        if quantity <= 0:
+            return []
+        if self._position + quantity > len(self._buffer):
+            self._refill(quantity)
+        start = self._position
+        self._position += quantity
+        return self._buffer[start:self._position]
+
+    def getstate(self):
+        """Estado completo (gerador + buffer), para replay determinístico."""
+        return self.rng.getstate(), list(self._buffer), self._position
+
+    def setstate(self, state):
+        rng_state, buffer, position = state
+        self.rng.setstate(rng_state)
+        self._buffer = list(buffer)
+        self._position = position
+
+    def roll_one(self):
+        if self._position >= len(self._buffer):
+            self._refill(1)
+        value = self._buffer[self._position]
+        self._position += 1
+        return value
+
+
+def compare_rolls(attack_rolls, defense_rolls):
+    """
+    Compara os dados par a par (maior com maior) e retorna
+    (perdas do atacante, perdas do defensor). Empate favorece a defesa.
+    """
+    attack_sorted = sorted(attack_rolls, reverse=True)
+    defense_sorted = sorted(defense_rolls, reverse=True)
+    attacker_losses = 0
+    defender_losses = 0
+    for attack, defense in zip(attack_sorted, defense_sorted):
+        if attack > defense:
+            defender_losses += 1
+        else:
+            attacker_losses += 1
+    return attacker_losses, defender_losses
+
+
+def battle_round(dice, attacking_armies, defending_armies):
+    """Rola uma rodada de combate e retorna (perdas do atacante, perdas do defensor)."""
+    attack_dice = min(attacking_armies, MAX_ATTACK_DICE)
+    defense_dice = min(defending_armies, MAX_DEFENSE_DICE)
+    rolls = dice.roll(attack_dice + defense_dice)
+    return compare_rolls(rolls[:attack_dice], rolls[attack_dice:])
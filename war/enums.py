@@ -7,3 +7,9 @@ COLORS = [
     "Preto",
     "Branco"
 ]
+
+# Fases do turno
+PHASE_PLACE_ARMIES = 1
+PHASE_ATTACK = 2
+PHASE_MOVE = 3
+PHASE_DRAW_CARD = 4
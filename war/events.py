@@ -0,0 +1,45 @@
+# Tipos de evento emitidos pelo motor do jogo
+OWNERSHIP_CHANGED = 'ownership_changed'  # (territory_id, old_index, new_index)
+TROOPS_CHANGED = 'troops_changed'  # (territory_id, old_troops, new_troops)
+PLAYER_ELIMINATED = 'player_eliminated'  # (player, eliminated_by)
+PHASE_CHANGED = 'phase_changed'  # (player, old_phase, new_phase)
+
+EVENT_TYPES = (OWNERSHIP_CHANGED, TROOPS_CHANGED,
+               PLAYER_ELIMINATED, PHASE_CHANGED)
+
+
+class EventBus:
+    """
+    Barramento simples de eventos (observer).
+
+    Quem emite deve testar `bus.active` (ou o atributo do evento, como
+    `bus.ownership_changed`) antes de montar os argumentos: sem inscritos o
+    custo é apenas a leitura de um atributo.
+    """
+
+    def __init__(self):
+        self._handlers = {event_type: [] for event_type in EVENT_TYPES}
+        self.active = False
+        for event_type in EVENT_TYPES:
+            setattr(self, event_type, False)
+
+    def subscribe(self, event_type, handler):
+        """Inscreve `handler` para um tipo de evento e o retorna."""
+        if event_type not in self._handlers:
+            raise ValueError(f"Tipo de evento desconhecido: {event_type}")
+        self._handlers[event_type].append(handler)
+        self._refresh()
+        return handler
+
+    def unsubscribe(self, event_type, handler):
+        self._handlers[event_type].remove(handler)
+        self._refresh()
+
+    def emit(self, event_type, *args):
+        for handler in tuple(self._handlers[event_type]):
+            handler(*args)
+
+    def _refresh(self):
+        for event_type, handlers in self._handlers.items():
+            setattr(self, event_type, bool(handlers))
+        self.active = any(self._handlers.values())
@@ -0,0 +1,105 @@
+from array import array
+from .events import OWNERSHIP_CHANGED
+from .state import NO_OWNER
+
+
+class FrontierIndex:
+    """
+    Fronteira e interior de cada jogador, mantidos incrementalmente.
+
+    Para cada território guarda quantos vizinhos têm outro dono. Uma troca
+    de dono só mexe nesse contador do próprio território e dos vizinhos,
+    então a atualização custa O(grau) em vez de uma varredura do mapa.
+    Fronteira: territórios do jogador com ao menos um vizinho de outro dono.
+    """
+
+    def __init__(self, state):
+        self.state = state
+        topology = state.topology
+        self.topology = topology
+        size = len(topology)
+        # Territórios que têm `t` como vizinho (fronteiras podem não ser
+        # simétricas no map.json)
+        incoming = [[] for _ in range(size)]
+        for territory in range(size):
+            for neighbor in topology.neighbors_of(territory):
+                incoming[neighbor].append(territory)
+        self._incoming = [tuple(t) for t in incoming]
+
+        self.enemy_neighbors = array('h', [0]) * size
+        self._frontier = {}
+        self._interior = {}
+        for territory in range(size):
+            self.enemy_neighbors[territory] = self._count(territory)
+            self._classify(territory, state.owner[territory])
+        state.events.subscribe(OWNERSHIP_CHANGED, self.on_ownership_changed)
+
+    def close(self):
+        """Para de acompanhar o estado."""
+        self.state.events.unsubscribe(OWNERSHIP_CHANGED,
+                                      self.on_ownership_changed)
+
+    def copy(self, state):
+        """Índice que acompanha `state`, uma cópia do estado deste."""
+        clone = FrontierIndex.__new__(FrontierIndex)
+        clone.__dict__.update(self.__dict__)
+        clone.state = state
+        clone.enemy_neighbors = array('h', self.enemy_neighbors)
+        clone._frontier = {p: set(t) for p, t in self._frontier.items()}
+        clone._interior = {p: set(t) for p, t in self._interior.items()}
+        state.events.subscribe(OWNERSHIP_CHANGED, clone.on_ownership_changed)
+        return clone
+
+    def _count(self, territory):
+        owner = self.state.owner
+        mine = owner[territory]
+        return sum(1 for n in self.topology.neighbors_of(territory)
+                   if owner[n] != mine)
+
+    def _classify(self, territory, player_index):
+        if player_index == NO_OWNER:
+            return
+        if self.enemy_neighbors[territory]:
+            self._interior.get(player_index, set()).discard(territory)
+            self._frontier.setdefault(player_index, set()).add(territory)
+        else:
+            self._frontier.get(player_index, set()).discard(territory)
+            self._interior.setdefault(player_index, set()).add(territory)
+
+    def on_ownership_changed(self, territory_id, old_index, new_index):
+        if old_index != NO_OWNER:
+            self._frontier.get(old_index, set()).discard(territory_id)
+            self._interior.get(old_index, set()).discard(territory_id)
+        self.enemy_neighbors[territory_id] = self._count(territory_id)
+        self._classify(territory_id, new_index)
+
+        owner = self.state.owner
+        for neighbor in self._incoming[territory_id]:
+            neighbor_owner = owner[neighbor]
+            if neighbor_owner == old_index:
+                self.enemy_neighbors[neighbor] += 1
+            elif neighbor_owner == new_index:
+                self.enemy_neighbors[neighbor] -= 1
+            else:
+                continue
+            self._classify(neighbor, neighbor_owner)
+
+    def is_frontier(self, territory_id):
+        """O território tem vizinho de outro dono?"""
+        return self.enemy_neighbors[territory_id] > 0
+
+    def frontier(self, player_index):
+        """IDs dos territórios de fronteira do jogador, em ordem."""
+        return sorted(self._frontier.get(player_index, ()))
+
+    def interior(self, player_index):
+        """IDs dos territórios do jogador sem vizinhos inimigos, em ordem."""
+        return sorted(self._interior.get(player_index, ()))
+
+    def owned(self, player_index):
+        """IDs de todos os territórios do jogador, em ordem."""
+        return sorted(self._frontier.get(player_index, set())
+                      | self._interior.get(player_index, set()))
+
+    def frontier_size(self, player_index):
+        return len(self._frontier.get(player_index, ()))
@@ -0,0 +1,48 @@
+"""Dicts e listas somente leitura para dados compartilhados no processo."""
+
+
+def _immutable(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} é imutável (dados compartilhados "
+                    "pelos jogos); copie antes de alterar")
+
+
+class FrozenList(list):
+    """Lista somente leitura (continua sendo uma `list` para quem a lê)."""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = extend = insert = pop = remove = clear = _immutable
+    sort = reverse = _immutable
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return FrozenList, (list(self),)
+
+
+class FrozenDict(dict):
+    """Dicionário somente leitura (continua sendo um `dict` para quem o lê)."""
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+
+def freeze(value):
+    """Converte recursivamente dicts e listas em versões imutáveis."""
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    return value
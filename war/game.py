@@ -1,90 +1,192 @@
-import random
+import copy
+import logging
+import operator
+from array import array
 from .territory import Territory
 from .card import Card
 from .deck import Deck
-from .utils_data import load_map_data, load_missions
+from .rng import GameRandom
+from .dice import DiceSource, MAX_ATTACK_DICE, battle_round
+from .bots import GameView
+from .state import GameState, NO_OWNER
+from .enums import (PHASE_PLACE_ARMIES, PHASE_ATTACK, PHASE_MOVE,
+                    PHASE_DRAW_CARD)
+from .events import PHASE_CHANGED, PLAYER_ELIMINATED
+from .missions import (MissionTracker, DestroyPlayerMission, compile_mission,
+                       mission_description)
+from .moves import MoveGenerator
+from .regions import RegionIndex
+from .frontier import FrontierIndex
+from .analysis import map_analysis
+from .mapfile import CompiledMap
+from .utils_data import load_map_data, load_missions, compiled_map
+from .zobrist import zobrist_keys
+from .trade import JOKER, MAX_HAND, OWNED_TERRITORY_BONUS, trade_bonus
 
 
 class Game:
-    def __init__(self, players, dealer):
+    def __init__(self, players, dealer, seed=None, rng=None,
+                 headless=False, logger=None, template=None):
         self.players = players
         self.dealer = dealer
-        self.map_data = load_map_data()
-        self.missions = load_missions()
+        # Modo headless: nenhuma saída no console; mensagens só vão para o
+        # logger opcional, se o nível estiver habilitado
+        self.headless = headless
+        self.logger = logger
+        # Gerador do jogo: todas as decisões aleatórias passam por ele
+        self.rng = rng if rng is not None else GameRandom(seed)
+        # Partes imutáveis (mapa, cartas, missões, estado vazio) vêm do
+        # molde, compartilhado pelos jogos do mesmo mapa; a lista de missões
+        # é copiada porque é embaralhada
+        if template is None:
+            template = GameTemplate.for_data(load_map_data(), load_missions())
+        self.template = template
+        self.map_data = template.map_data
+        self.missions = list(template.missions)
+        self.map = template.map
+        self.topology = template.topology
+        self.state = self.create_state()
         self.territories = self.create_territories()
+        self.events = self.state.events
+        self.phase = PHASE_PLACE_ARMIES
+        # Parte do hash de posição que vem do jogador e da fase do turno
+        self.turn_hash = 0
+        self._move_generator = None
+        self._region_index = None
+        self._frontier_index = None
         self.cards, self.jokers = self.create_cards()
-        self.deck = Deck()  # Baralho final para o jogo
+        self._card_index = template.card_index
+        self.deck = Deck(rng=self.rng)  # Baralho final para o jogo
+        # Trocas de cartas feitas no jogo (o bônus cresce a cada uma)
+        self.trades = 0
+        self.dice = DiceSource(self.rng)
         self.setup()
 
     def create_territories(self):
-        territories = []
-        for t in self.map_data['territories']:
-            borders = t.get('borders', [])
-            territory = Territory(t['name'], t['continent'], borders)
-            territories.append(territory)
-        return territories
+        """Territórios do jogo: visões novas sobre o estado, a partir do molde."""
+        return [territory.bound_copy(self.state)
+                for territory in self.template.territories]
+
+    def create_state(self):
+        """Copia o GameState vazio do molde e registra os jogadores nele."""
+        state = self.template.state.copy()
+        for player in self.players:
+            state.add_player(player)
+        return state
 
     def create_cards(self):
-        # Cartas de território vêm do map.json com símbolos definidos
-        cards = []
-        for territory_data in self.map_data['territories']:
-            cards.append(
-                Card(
-                    territory_data['name'],
-                    territory_data['symbol']))
-        # Dois curingas clássicos
-        jokers = [Card(None, 'coringa'), Card(None, 'coringa')]
-        return cards, jokers
+        # As cartas são compartilhadas com o molde; as listas são do jogo
+        return list(self.template.cards), list(self.template.jokers)
 
     def setup(self):
         self.distribute_missions()
         self.distribute_territory_cards()
         self.assign_territories_and_place_troops()
         self.collect_cards_and_prepare_deck()
+        self.prepare_mission_tracker()
 
     def distribute_missions(self):
-        random.shuffle(self.missions)
+        self.rng.shuffle(self.missions)
         for i, player in enumerate(self.players):
             player.receive_mission(self.missions[i])
 
+    def prepare_mission_tracker(self):
+        """
+        Compila as missões, passa a acompanhá-las pelos eventos e verifica
+        se alguma já está cumprida pelo tabuleiro inicial.
+        """
+        self.mission_tracker = MissionTracker(self)
+        for player in self.players:
+            others = [p for p in self.players if p is not player]
+            if others:
+                self.mission_tracker.assign_target(
+                    player, self.rng.choice(others))
+        # O tabuleiro inicial é gravado sem eventos: uma missão já cumprida
+        # na distribuição só seria vista na próxima conquista
+        self.mission_tracker.check_all()
+
     def distribute_territory_cards(self):
         # Remove curingas, distribui só cartas de território
         n = len(self.players)
         dealer_idx = self.players.index(self.dealer)
         order = [(dealer_idx + 1 + i) % n for i in range(n)]
         deck = self.cards[:]
-        random.shuffle(deck)
-        idx = 0
-        while deck:
-            player = self.players[order[idx % n]]
-            player.receive_card(deck.pop(0))
-            idx += 1
+        self.rng.shuffle(deck)
+        for position, card in enumerate(deck):
+            self.players[order[position % n]].receive_card(card)
 
     def assign_territories_and_place_troops(self):
-        # Cada player recebe os territórios das cartas e coloca 1 tropa
-        territory_dict = {t.name: t for t in self.territories}
+        # Cada player recebe os territórios das cartas e coloca 1 tropa; o
+        # tabuleiro é carregado de uma vez no estado (contadores e hash em
+        # uma passada, em vez de uma escrita por território)
+        owners = array('h', self.state.owner)
+        troops = array('i', self.state.troops)
         for player in self.players:
+            player_index = self.state.player_index(player)
             for card in player.cards:
-                terr = territory_dict.get(card.territory_name)
-                if terr:
-                    terr.owner = player
-                    player.receive_territory(terr)
-                    terr.troops = 1  # 1 tropa inicial
+                territory_id = self.topology.id_of(card.territory_name)
+                if territory_id is not None:
+                    owners[territory_id] = player_index
+                    troops[territory_id] = 1  # 1 tropa inicial
+                    player.receive_territory(self.territories[territory_id])
             # Limpa as cartas do player após distribuição
             player.cards.clear()
+        self.state.load(owners, troops)
 
     def collect_cards_and_prepare_deck(self):
         # Junta todas as cartas de território e curingas, embaralha e deixa
         # pronto para o jogo
         all_cards = self.cards + self.jokers
-        self.deck = Deck(all_cards)
+        self.deck = Deck(all_cards, self.rng)
         self.deck.shuffle()
 
+    def move_generator(self):
+        """Gerador incremental de jogadas permitidas (criado sob demanda)."""
+        if self._move_generator is None:
+            self._move_generator = MoveGenerator(self.state)
+        return self._move_generator
+
+    def region_index(self):
+        """Índice de regiões conexas dos jogadores (criado sob demanda)."""
+        if self._region_index is None:
+            self._region_index = RegionIndex(self.state)
+        return self._region_index
+
+    def frontier_index(self):
+        """Fronteira e interior de cada jogador (criado sob demanda)."""
+        if self._frontier_index is None:
+            self._frontier_index = FrontierIndex(self.state)
+        return self._frontier_index
+
+    def analysis(self):
+        """Distâncias, pontes e pontos de entrada do mapa (ver war.analysis)."""
+        return map_analysis(self.topology)
+
+    def get_continent_controller(self, continent_name):
+        """Retorna o jogador que controla o continente (O(1)), ou None."""
+        continent_id = self.topology.continent_index[continent_name]
+        return self.state.player_at(self.state.controller[continent_id])
+
+    def get_continent_controllers(self):
+        """Retorna {nome do continente: jogador ou None} para todos os continentes."""
+        controller = self.state.continent_controllers()
+        return {name: self.state.player_at(controller[continent_id])
+                for continent_id, name in enumerate(self.topology.continent_names)}
+
     def get_first_player_after_dealer(self):
         idx = self.players.index(self.dealer)
         return self.players[(idx + 1) % len(self.players)]
 
     # Sistema de Turnos
+    def set_phase(self, player, phase):
+        """Muda a fase do turno atual e notifica os inscritos."""
+        old_phase = self.phase
+        self.phase = phase
+        self.turn_hash = self.state.zobrist.turn_key(
+            self.state.player_index(player), phase)
+        if self.events.phase_changed:
+            self.events.emit(PHASE_CHANGED, player, old_phase, phase)
+
     def calculate_armies_to_receive(self, player):
         """Calcula quantos exércitos o jogador deve receber no início do turno."""
         territory_count = len(player.territories)
@@ -95,24 +197,120 @@ class Game:
     def phase_1_distribute_armies(self, player):
         """Etapa 1: O jogador recebe e distribui exércitos."""
         armies = self.calculate_armies_to_receive(player)
+        if player.bot is not None:
+            armies += self.bot_trade(player)
+            self.place_bot_armies(player, armies)
         return armies  # Retorna quantos exércitos o jogador pode distribuir
 
+    def next_trade_bonus(self):
+        """Exércitos que a próxima troca de cartas do jogo rende."""
+        return trade_bonus(self.trades)
+
+    def trade_cards(self, player, cards):
+        """
+        Troca três cartas do jogador por exércitos e retorna quantos ele tem
+        para distribuir. Cada carta de um território do jogador põe mais
+        exércitos direto nesse território; as cartas voltam para o fundo do
+        baralho.
+        """
+        cards = player.trocarCartasPorTropas(cards)
+        armies = self.next_trade_bonus()
+        self.trades += 1
+        for card in cards:
+            territory = player.territories.get(card.territory_name)
+            if territory is not None:
+                territory.troops += OWNED_TERRITORY_BONUS
+        self.deck.return_cards(cards)
+        self.report(logging.INFO, "%s troca cartas por %d exércitos",
+                    player.name, armies)
+        return armies
+
+    def bot_trade(self, player):
+        """
+        Troca de cartas decidida pelo bot no início do turno. Com a mão
+        cheia a troca é obrigatória: se o bot não trocar, faz a melhor.
+        Retorna os exércitos recebidos (0 sem troca).
+        """
+        if not player.cards.can_trade():
+            return 0
+        cards = player.bot.timed('trade', GameView(self, player))
+        if cards is None and len(player.cards) >= MAX_HAND:
+            cards = player.cards.best_trade(
+                lambda card: card.territory_name in player.territories.names())
+        if cards is None:
+            return 0
+        return self.trade_cards(player, cards)
+
+    def place_bot_armies(self, player, armies):
+        """Distribui os exércitos conforme a decisão do bot do jogador."""
+        placements = player.bot.timed('place', GameView(self, player), armies)
+        # Contagens negativas fechariam a soma tirando exércitos de outro lugar
+        if any(count < 1 for _, count in placements):
+            raise ValueError(
+                f"Bot de {player.name} deve colocar pelo menos 1 exército "
+                "em cada território escolhido")
+        if sum(count for _, count in placements) != armies:
+            raise ValueError(
+                f"Bot de {player.name} deve distribuir exatamente {armies} exércitos")
+        # Valida todos os IDs antes de colocar qualquer exército
+        placements = [(self.territory_by_id(territory_id), count)
+                      for territory_id, count in placements]
+        for territory, count in placements:
+            self.place_armies(player, territory.name, count)
+
     def place_armies(self, player, territory_name, army_count):
         """
         Coloca exércitos em um território do jogador.
         """
-        for territory in player.territories:
-            if territory.name == territory_name:
-                territory.troops += army_count
-                return
+        territory = player.territories.get(territory_name)
+        if territory is not None:
+            territory.troops += army_count
+            return
         raise ValueError(
             f"Territory {territory_name} not owned by player {player.name}")
 
+    def territory_by_id(self, territory_id):
+        """
+        Território pelo ID vindo de um bot; ValueError se não for um ID do
+        mapa (negativos não podem contar do fim da lista).
+        """
+        try:
+            index = operator.index(territory_id)
+        except TypeError:
+            index = -1
+        if not 0 <= index < len(self.territories):
+            raise ValueError(f"ID de território inválido: {territory_id!r}")
+        return self.territories[index]
+
+    def own_territory(self, player, territory_id):
+        """Território `territory_id`, que precisa ser do jogador (ValueError)."""
+        territory = self.territory_by_id(territory_id)
+        if territory.owner is not player:
+            raise ValueError(
+                f"Território {territory.name} não pertence a {player.name}")
+        return territory
+
     def phase_2_attack(self, player):
         """Etapa 2: Fase de ataque (opcional)."""
         territories_conquered = 0  # Contador de territórios conquistados neste turno
-        # Esta será uma implementação básica - pode ser expandida para
-        # interface
+        # Jogadores humanos atacam pela interface; bots decidem aqui
+        if player.bot is None:
+            return territories_conquered
+
+        while True:
+            action = player.bot.timed('attack', GameView(self, player))
+            if action is None:
+                break
+            source, target, armies = action
+            if not 1 <= armies <= MAX_ATTACK_DICE:
+                raise ValueError(
+                    f"Bot de {player.name} deve atacar com 1 a "
+                    f"{MAX_ATTACK_DICE} exércitos")
+            if self.attack_territory(self.own_territory(player, source),
+                                     self.territory_by_id(target), armies):
+                territories_conquered += 1
+                if self.is_game_over()[0]:
+                    break
         return territories_conquered
 
     def attack_territory(
@@ -127,22 +325,22 @@ class Game:
         if attacker_territory.owner == defender_territory.owner:
             raise ValueError("Não é possível atacar território próprio")
 
+        if attacking_armies < 1:
+            raise ValueError("O ataque precisa de pelo menos 1 exército")
+
         if attacker_territory.troops <= attacking_armies:
             raise ValueError("Tropas insuficientes para ataque")
 
-        if defender_territory.name not in attacker_territory.borders:
+        if not attacker_territory.is_adjacent_to(defender_territory):
             raise ValueError("Territórios não são adjacentes")
 
-        # Simulação simples de combate (pode ser expandida com dados)
-        # Por enquanto, vamos usar probabilidade baseada nas tropas
-        # Máximo 3 dados para atacante
-        attacker_strength = min(attacking_armies, 3)
-        defender_strength = min(
-            defender_territory.troops,
-            2)  # Máximo 2 dados para defensor
+        # Rodada de combate: até 3 dados de ataque contra até 2 de defesa
+        attacker_losses, defender_losses = battle_round(
+            self.dice, attacking_armies, defender_territory.troops)
+        attacker_territory.troops -= attacker_losses
+        defender_territory.troops -= defender_losses
 
-        # Simulação básica: atacante precisa superar defensor
-        if attacker_strength > defender_strength:
+        if defender_territory.troops <= 0:
             # Território conquistado
             old_owner = defender_territory.owner
             new_owner = attacker_territory.owner
@@ -155,20 +353,31 @@ class Game:
             defender_territory.owner = new_owner
             new_owner.territories.append(defender_territory)
 
-            # Move tropas do atacante para o território conquistado
-            attacker_territory.troops -= attacking_armies
-            defender_territory.troops = attacking_armies
+            if old_owner and len(old_owner.territories) == 0:
+                if self.events.player_eliminated:
+                    self.events.emit(PLAYER_ELIMINATED, old_owner, new_owner)
+
+            # Os exércitos sobreviventes ocupam o território conquistado
+            survivors = attacking_armies - attacker_losses
+            attacker_territory.troops -= survivors
+            defender_territory.troops = survivors
 
             return True
-        else:
-            # Ataque falhou, atacante perde tropas
-            attacker_territory.troops -= 1
-            return False
+        return False
 
     def phase_3_troop_movement(self, player):
         """Etapa 3: Deslocamento de tropas entre territórios próprios."""
-        # Implementação básica - pode ser expandida
-        pass
+        if player.bot is None:
+            return
+
+        # Limite de deslocamentos por turno evita bots em ciclo
+        for _ in range(len(player.territories)):
+            action = player.bot.timed('fortify', GameView(self, player))
+            if action is None:
+                break
+            source, target, troop_count = action
+            self.fortify(self.own_territory(player, source),
+                         self.territory_by_id(target), troop_count)
 
     def move_troops(self, from_territory, to_territory, troop_count):
         """
@@ -178,9 +387,49 @@ class Game:
         if from_territory.owner != to_territory.owner:
             raise ValueError("Territórios devem pertencer ao mesmo jogador")
 
-        if to_territory.name not in from_territory.borders:
+        if not from_territory.is_adjacent_to(to_territory):
             raise ValueError("Territórios devem ser adjacentes")
 
+        if troop_count < 1:
+            raise ValueError("Deve deslocar pelo menos 1 tropa")
+
+        if from_territory.troops <= troop_count:
+            raise ValueError(
+                "Deve manter pelo menos 1 tropa no território de origem")
+
+        from_territory.troops -= troop_count
+        to_territory.troops += troop_count
+
+    def fortify_destinations(self, territory):
+        """
+        Territórios para onde `territory` pode deslocar tropas: os da sua
+        região conexa, exceto ele mesmo (vazio se tiver só 1 tropa).
+        """
+        if territory.troops <= 1:
+            return []
+        return [self.territories[territory_id]
+                for territory_id in self.region_index().region_of(territory.id)
+                if territory_id != territory.id]
+
+    def fortify(self, from_territory, to_territory, troop_count):
+        """
+        Desloca tropas por um caminho de territórios do próprio jogador, com
+        qualquer número de passos. A validação custa O(α(n)) pelo índice de
+        regiões conexas.
+        """
+        if from_territory.owner != to_territory.owner:
+            raise ValueError("Territórios devem pertencer ao mesmo jogador")
+
+        if from_territory is to_territory:
+            raise ValueError("Origem e destino devem ser diferentes")
+
+        if troop_count < 1:
+            raise ValueError("Deve deslocar pelo menos 1 tropa")
+
+        if not self.region_index().connected(from_territory.id,
+                                             to_territory.id):
+            raise ValueError("Territórios devem estar conectados")
+
         if from_territory.troops <= troop_count:
             raise ValueError(
                 "Deve manter pelo menos 1 tropa no território de origem")
@@ -198,31 +447,48 @@ class Game:
                     return card
         return None
 
+    def report(self, level, message, *args):
+        """
+        Mostra uma mensagem do andamento do jogo. A formatação só acontece
+        se a mensagem for de fato exibida (console ou logger habilitado).
+        """
+        if not self.headless:
+            print(message % args if args else message)
+        elif self.logger is not None and self.logger.isEnabledFor(level):
+            self.logger.log(level, message, *args)
+
     def play_turn(self, player):
         """Executa um turno completo de um jogador."""
-        print(f"\n=== Turno de {player.name} ===")
+        self.report(logging.INFO, "\n=== Turno de %s ===", player.name)
 
         # Etapa 1: Distribuir exércitos
+        self.set_phase(player, PHASE_PLACE_ARMIES)
         armies_to_place = self.phase_1_distribute_armies(player)
-        print(
-            f"Etapa 1: {player.name} recebe {armies_to_place} exércitos para distribuir")
+        self.report(logging.INFO,
+                    "Etapa 1: %s recebe %d exércitos para distribuir",
+                    player.name, armies_to_place)
 
         # Etapa 2: Atacar (retorna quantos territórios foram conquistados)
-        print("Etapa 2: Fase de ataque")
+        self.report(logging.DEBUG, "Etapa 2: Fase de ataque")
+        self.set_phase(player, PHASE_ATTACK)
         territories_conquered = self.phase_2_attack(player)
 
         # Etapa 3: Mover tropas
-        print("Etapa 3: Deslocamento de tropas")
+        self.report(logging.DEBUG, "Etapa 3: Deslocamento de tropas")
+        self.set_phase(player, PHASE_MOVE)
         self.phase_3_troop_movement(player)
 
         # Etapa 4: Receber carta (se conquistou território)
-        print("Etapa 4: Recebimento de carta")
+        self.report(logging.DEBUG, "Etapa 4: Recebimento de carta")
+        self.set_phase(player, PHASE_DRAW_CARD)
         card_received = self.phase_4_draw_card(player, territories_conquered)
         if card_received:
-            print(
-                f"{player.name} recebeu uma carta: {card_received.territory_name or 'Coringa'}")
+            self.report(logging.INFO, "%s recebeu uma carta: %s", player.name,
+                        card_received.territory_name or 'Coringa')
         else:
-            print(f"{player.name} não recebeu carta (não conquistou territórios)")
+            self.report(logging.DEBUG,
+                        "%s não recebeu carta (não conquistou territórios)",
+                        player.name)
 
         return {
             'armies_placed': armies_to_place,
@@ -236,10 +502,43 @@ class Game:
             dealer_index = self.players.index(self.dealer)
             current_player_index = (dealer_index + 1) % len(self.players)
         else:
-            print("Aviso: dealer não encontrado nos jogadores, começando com jogador 0")
+            self.report(logging.WARNING,
+                        "Aviso: dealer não encontrado nos jogadores, começando com jogador 0")
             current_player_index = 0
         return current_player_index
 
+    def play_game(self, max_turns=1000):
+        """
+        Joga turnos em sequência até alguém vencer ou até `max_turns`.
+        Jogadores sem territórios são pulados. Retorna um resumo da partida.
+        """
+        player_index = self.start_game()
+        turns = 0
+        territories_conquered = 0
+        game_over, winner = self.is_game_over()
+        skipped = 0
+        while not game_over and turns < max_turns:
+            player = self.players[player_index]
+            if len(player.territories) > 0:
+                skipped = 0
+                result = self.play_turn(player)
+                territories_conquered += result['territories_conquered']
+                turns += 1
+                game_over, winner = self.is_game_over()
+            else:
+                skipped += 1
+                if skipped >= len(self.players):
+                    break  # ninguém mais tem territórios
+            player_index = self.get_next_player(player_index)
+
+        return {
+            'winner': winner,
+            'turns': turns,
+            'finished': game_over,
+            'territories_conquered': territories_conquered,
+            'territory_counts': self.state.territory_counts(),
+        }
+
     def get_next_player(self, current_player_index):
         """Retorna o índice do próximo jogador."""
         return (current_player_index + 1) % len(self.players)
@@ -251,10 +550,133 @@ class Game:
         if len(active_players) == 1:
             return True, active_players[0]  # Último jogador sobrevivente
 
-        # Aqui poderia verificar missões, mas isso dependeria da implementação
-        # das missões
+        # Missões são reavaliadas a cada conquista pelo MissionTracker
+        if self.mission_tracker.winner is not None:
+            return True, self.mission_tracker.winner
         return False, None
 
+    def position_hash(self, include_hands=False):
+        """
+        Hash de Zobrist de 64 bits da posição: donos, tropas por faixa,
+        jogador e fase do turno e, opcionalmente, as cartas nas mãos. O
+        tabuleiro é mantido a cada escrita no GameState, então sem as mãos
+        o custo é O(1).
+        """
+        value = self.state.hash ^ self.turn_hash
+        if include_hands:
+            keys = self.state.zobrist
+            for player in self.players:
+                player_index = self.state.player_index(player)
+                for card in player.cards:
+                    # Cartas de fora do baralho deste jogo não entram
+                    card_index = self._card_index.get(card)
+                    if card_index is not None:
+                        value ^= keys.card_key(player_index, card_index)
+        return value
+
+    # Snapshots e bifurcações (para busca)
+    def snapshot(self):
+        """
+        Captura a parte mutável do jogo: tabuleiro, mãos, baralho, fase,
+        missões, dados e trocas de cartas. Mapa, topologia e cartas não são copiados.
+        """
+        return (self.state.snapshot(),
+                [tuple(t.id for t in player.territories)
+                 for player in self.players],
+                [list(player.cards) for player in self.players],
+                list(self.deck.cards),
+                self.phase,
+                self.turn_hash,
+                self.mission_tracker.snapshot(),
+                self.dice.getstate(),
+                self.trades)
+
+    def restore(self, snapshot):
+        """Volta a um snapshot tirado deste jogo."""
+        (board, territory_ids, hands, deck, self.phase, self.turn_hash,
+         missions, dice, self.trades) = snapshot
+        self.state.restore(board)
+        for player, ids, cards in zip(self.players, territory_ids, hands):
+            # Recria os conjuntos na ordem original, para o replay ser exato
+            player.territories.clear()
+            player.territories.extend(self.territories[i] for i in ids)
+            player.cards[:] = cards
+        self.deck.cards[:] = deck
+        self.mission_tracker.restore(missions)
+        self.dice.setstate(dice)
+
+    def mark(self):
+        """
+        Marca para desfazer jogadas no tabuleiro com `undo`. Mais barato que
+        um snapshot: só as escritas feitas depois da marca são registradas.
+        Mãos, baralho e dados não entram; para eles use snapshot/restore.
+        """
+        return self.state.mark(), self.mission_tracker.snapshot()
+
+    def undo(self, mark):
+        """Desfaz as jogadas no tabuleiro feitas depois da marca."""
+        state_mark, missions = mark
+        journal = self.state.journal
+        if journal is None:
+            return
+        owner = self.state.owner
+        changed = {territory_id: owner[territory_id]
+                   for is_owner, territory_id, _ in journal[state_mark:]
+                   if is_owner}
+        self.state.undo(state_mark)
+        for territory_id, old_index in changed.items():
+            new_index = owner[territory_id]
+            if new_index == old_index:
+                continue
+            territory = self.territories[territory_id]
+            if old_index != NO_OWNER:
+                self.state.players[old_index].territories.discard(territory)
+            if new_index != NO_OWNER:
+                self.state.players[new_index].territories.add(territory)
+        self.mission_tracker.restore(missions)
+
+    def fork(self, rng=None):
+        """
+        Novo Game independente a partir do estado atual, sem deepcopy: mapa,
+        topologia, definições de missões e cartas (imutáveis) são
+        compartilhados e só tabuleiro, mãos, baralho e dados são copiados.
+        Os bots também são compartilhados. Sem `rng`, o gerador é clonado e
+        a bifurcação repete o futuro do original; com `rng`, diverge.
+        """
+        clone = Game.__new__(Game)
+        clone.__dict__.update(self.__dict__)
+        players = []
+        for player in self.players:
+            player_clone = copy.copy(player)
+            player_clone.cards = list(player.cards)
+            players.append(player_clone)
+        clone.players = players
+        if self.dealer in self.players:
+            clone.dealer = players[self.players.index(self.dealer)]
+
+        clone.state = self.state.copy(players)
+        clone.events = clone.state.events
+        clone.territories = [territory.bound_copy(clone.state)
+                             for territory in self.territories]
+        for player, original in zip(players, self.players):
+            player.territories = [clone.territories[territory.id]
+                                  for territory in original.territories]
+        clone._move_generator = None
+        clone._region_index = None
+        clone._frontier_index = None
+
+        if rng is None:
+            rng = GameRandom(getattr(self.rng, 'initial_seed', None))
+            clone.dice = DiceSource(rng, self.dice.buffer_size)
+            clone.dice.setstate(self.dice.getstate())
+        else:
+            clone.dice = DiceSource(rng, self.dice.buffer_size)
+        clone.rng = rng
+        clone.deck = Deck(list(self.deck.cards), rng)
+        clone.mission_tracker = MissionTracker(clone)
+        clone.mission_tracker.restore(self.mission_tracker.snapshot())
+        return clone
+
     def get_game_state(self):
         """Retorna informações sobre o estado atual do jogo."""
         state = {
@@ -263,14 +685,117 @@ class Game:
                 self.deck.cards) if hasattr(
                 self.deck, 'cards') else 0}
 
+        troop_totals = self.state.troop_totals()
         for player in self.players:
             player_info = {
                 'name': player.name,
                 'color': player.color,
                 'territories_count': len(player.territories),
-                'total_troops': sum(t.troops for t in player.territories),
+                'total_troops': troop_totals[self.state.player_index(player)],
                 'cards_count': len(player.cards)
             }
             state['players'].append(player_info)
 
         return state
+
+
+class GameTemplate:
+    """
+    Molde de jogos de um mapa: tudo o que não muda entre partidas é
+    montado uma vez (mapa compilado, cartas, curingas, predicados das
+    missões, territórios e o GameState vazio com as chaves de Zobrist).
+    Cada jogo novo só copia o estado vazio, cria as visões dos territórios
+    e sorteia missões e cartas com o próprio gerador, na mesma ordem de
+    sempre: com a mesma semente, o jogo é idêntico ao de `Game(...)`.
+    """
+
+    # Último molde criado por for_data: (map_data, missões, molde)
+    _last = None
+
+    def __init__(self, map_data=None, missions=None, game_map=None):
+        if game_map is None:
+            self.map_data = load_map_data() if map_data is None else map_data
+            self.map = compiled_map(self.map_data)
+        else:
+            self.map = game_map
+            self.map_data = (game_map.to_map_data() if map_data is None
+                             else map_data)
+        self.missions = tuple(load_missions() if missions is None
+                              else missions)
+        self.topology = self.map.topology
+        symbol_names = self.map.symbol_names
+        self.cards = tuple(
+            Card(name, symbol_names[symbol])
+            for name, symbol in zip(self.map.names, self.map.symbol_of))
+        # Dois curingas clássicos
+        self.jokers = (Card(None, JOKER), Card(None, JOKER))
+        self.card_index = {card: index for index, card
+                           in enumerate(self.cards + self.jokers)}
+        self._predicates = {}
+
+        self.state = GameState(len(self.map), self.topology.continent_of,
+                               None, self.topology)
+        continent_names = self.map.continent_names
+        self.territories = tuple(
+            Territory(name, continent_names[continent], borders)
+            for name, continent, borders in zip(
+                self.map.names, self.map.continent_of, self.map.borders))
+        for territory_id, territory in enumerate(self.territories):
+            territory.bind(self.state, territory_id)
+        self.state.enable_hashing(zobrist_keys(len(self.map)))
+
+    @classmethod
+    def for_data(cls, map_data, missions):
+        """Molde de `map_data`/`missions`, reaproveitado se forem os mesmos objetos."""
+        last = cls._last
+        if last is None or last[0] is not map_data or last[1] is not missions:
+            last = (map_data, missions, cls(map_data, missions))
+            GameTemplate._last = last
+        return last[2]
+
+    @classmethod
+    def from_compiled(cls, game_map, missions=None):
+        """
+        Molde de um mapa já compilado: um CompiledMap ou o caminho de um
+        artefato .bin (gerado por `python -m war.mapfile`, que valida o mapa).
+        """
+        if not isinstance(game_map, CompiledMap):
+            game_map = CompiledMap.load(game_map)
+        return cls(missions=missions, game_map=game_map)
+
+    @classmethod
+    def default(cls):
+        """Molde do mapa e das missões padrão (compartilhado no processo)."""
+        return cls.for_data(load_map_data(), load_missions())
+
+    def mission_predicate(self, mission):
+        """
+        Predicado compilado da missão. A compilação é feita uma vez por
+        descrição; missões de destruir jogador têm estado e são copiadas.
+        """
+        description = mission_description(mission)
+        try:
+            predicate = self._predicates[description]
+        except KeyError:
+            predicate = compile_mission(mission, self.topology)
+            self._predicates[description] = predicate
+        if isinstance(predicate, DestroyPlayerMission):
+            predicate = copy.copy(predicate)
+        return predicate
+
+    def new_game(self, players, dealer, seed=None, rng=None, headless=False,
+                 logger=None):
+        """Cria um jogo a partir do molde (mesmos argumentos de Game)."""
+        return Game(players, dealer, seed, rng, headless, logger,
+                    template=self)
+
+    def new_games(self, seatings, seed=None, **options):
+        """
+        Cria um jogo por par (jogadores, entregador) de `seatings`. Cada
+        jogo recebe um gerador derivado da semente do lote, então o lote
+        inteiro é reproduzível.
+        """
+        batch_rng = GameRandom(seed)
+        return [self.new_game(players, dealer, rng=batch_rng.fork(),
+                              **options)
+                for players, dealer in seatings]
@@ -3,6 +3,7 @@ import sys
 from typing import Optional
 from war.game import Game
 from war.player import Player
+from war.rng import GameRandom
 from .screens.main_menu import MainMenu
 from .screens.player_setup import PlayerSetupScreen
 from .screens.dealer_selection import DealerSelectionScreen
@@ -13,8 +14,11 @@ from .utils.constants import *
 class GameApp:
     """Aplicação principal do jogo War com Pygame."""
 
-    def __init__(self):
-        """Inicializa a aplicação."""
+    def __init__(self, seed=None):
+        """
+        Inicializa a aplicação. Com `seed`, o sorteio do entregador e a
+        partida são reproduzíveis.
+        """
         # Inicializar pygame primeiro
         pygame.init()
         pygame.mixer.pre_init()
@@ -31,6 +35,9 @@ class GameApp:
         self.running = True
         self.current_screen = "menu"
         self.game: Optional[Game] = None
+        self.seed = seed
+        # Gerador da partida: o mesmo do sorteio do entregador e do jogo
+        self.rng: Optional[GameRandom] = None
 
         # Telas (inicializar depois do pygame)
         self.main_menu = MainMenu(self.screen, self)
@@ -146,8 +153,9 @@ class GameApp:
 
     def start_dealer_selection(self, players_config):
         """Inicia a tela de seleção do dealer."""
+        self.rng = GameRandom(self.seed)
         self.dealer_selection = DealerSelectionScreen(
-            self.screen, self, players_config)
+            self.screen, self, players_config, rng=self.rng)
         self.current_screen = "dealer_selection"
 
     def start_game_with_dealer(self, players_config, dealer_index):
@@ -163,8 +171,10 @@ class GameApp:
             if i == dealer_index:
                 dealer = player
 
-        # Criar jogo com dealer específico
-        self.game = Game(players, dealer)
+        # Criar jogo com dealer específico, continuando o gerador do sorteio
+        if self.rng is None:
+            self.rng = GameRandom(self.seed)
+        self.game = Game(players, dealer, rng=self.rng)
 
         # Criar tela do jogo
         self.game_screen = GameScreen(self.screen, self, self.game)
@@ -181,7 +191,8 @@ class GameApp:
             players.append(player)
 
         # Criar jogo
-        self.game = Game(players, players[0])  # Primeiro jogador é o dealer
+        self.rng = GameRandom(self.seed)
+        self.game = Game(players, players[0], rng=self.rng)  # Primeiro jogador é o dealer
 
         # Criar tela do jogo
         self.game_screen = GameScreen(self.screen, self, self.game)
@@ -196,6 +207,7 @@ class GameApp:
         self.game_screen = None
         self.player_setup = None
         self.dealer_selection = None
+        self.rng = None
 
     def quit_game(self):
         """Encerra a aplicação."""
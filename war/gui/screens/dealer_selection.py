@@ -1,15 +1,17 @@
 import pygame
 import random
+from war.rng import GameRandom
 from ..utils.constants import *
 
 
 class DealerSelectionScreen:
     """Tela para determinar quem será o entregador de cartas."""
 
-    def __init__(self, screen, app, players_config):
+    def __init__(self, screen, app, players_config, rng=None):
         self.screen = screen
         self.app = app
         self.players_config = players_config
+        self.rng = rng if rng is not None else GameRandom()
         self.font_large = pygame.font.Font(None, FONT_LARGE)
         self.font_medium = pygame.font.Font(None, FONT_MEDIUM)
         self.font_small = pygame.font.Font(None, FONT_SMALL)
@@ -110,7 +112,8 @@ class DealerSelectionScreen:
 
         # Gerar valores finais para todos os jogadores ativos
         for player_idx in self.current_players:
-            self.final_rolls[player_idx] = random.randint(1, 6)
+            self.final_rolls[player_idx] = self.rng.randint(1, 6)
+            # Valor da animação é apenas visual
             self.dice_animations[player_idx] = random.randint(1, 6)
 
         # Iniciar animação
@@ -33,6 +33,8 @@ class GameScreen:
         # Territórios selecionados
         self.selected_territory = None
         self.target_territory = None
+        # Destinos válidos do território selecionado na fase de movimento
+        self.move_destinations = set()
 
         # Posições dos territórios no mapa (simplificado por enquanto)
         self.territory_positions = self.calculate_territory_positions()
@@ -110,7 +112,7 @@ class GameScreen:
                     self.selected_territory = territory
             else:
                 if territory.owner != self.current_player:
-                    if territory.name in self.selected_territory.borders:
+                    if self.selected_territory.is_adjacent_to(territory):
                         # Executar ataque
                         self.execute_attack(self.selected_territory, territory)
                     self.selected_territory = None
@@ -120,19 +122,32 @@ class GameScreen:
         elif self.game_phase == PHASE_MOVE:
             if self.selected_territory is None:
                 if territory.owner == self.current_player and territory.troops > 1:
-                    self.selected_territory = territory
+                    self.select_move_source(territory)
+            elif territory.name in self.move_destinations:
+                # Move uma tropa por qualquer caminho de territórios próprios
+                # e mantém a seleção para mover mais
+                self.game.fortify(self.selected_territory, territory, 1)
+                if self.selected_territory.troops > 1:
+                    self.select_move_source(self.selected_territory)
+                else:
+                    self.select_move_source(None)
             else:
-                if territory.owner == self.current_player and territory.name in self.selected_territory.borders:
-                    # Mover uma tropa
-                    if self.selected_territory.troops > 1:
-                        self.game.move_troops(
-                            self.selected_territory, territory, 1)
-                self.selected_territory = None
+                self.select_move_source(None)
+
+    def select_move_source(self, territory):
+        """Seleciona a origem do movimento e destaca os destinos válidos."""
+        self.selected_territory = territory
+        self.move_destinations = set()
+        if territory is not None:
+            self.move_destinations = {
+                t.name for t in self.game.fortify_destinations(territory)}
 
     def execute_attack(self, attacker, defender):
         """Executa um ataque."""
         try:
-            conquered = self.game.attack_territory(attacker, defender, 1)
+            # Ataca com o máximo de dados permitido (até 3)
+            armies = min(attacker.troops - 1, 3)
+            conquered = self.game.attack_territory(attacker, defender, armies)
             if conquered:
                 self.territories_conquered_this_turn += 1
                 print(f"{self.current_player.name} conquistou {defender.name}!")
@@ -149,8 +164,10 @@ class GameScreen:
             self.game_phase = PHASE_MOVE
         elif self.game_phase == PHASE_MOVE:
             self.end_turn()
+        self.game.set_phase(self.current_player, self.game_phase)
 
         self.selected_territory = None
+        self.move_destinations = set()
 
     def end_turn(self):
         """Termina o turno atual."""
@@ -218,6 +235,12 @@ class GameScreen:
 
     def render_territories(self):
         """Renderiza os territórios no mapa."""
+        # Na colocação, destaca a fronteira do jogador atual
+        frontier = set()
+        if self.game_phase == PHASE_PLACE_ARMIES:
+            frontier = set(self.game.frontier_index().frontier(
+                self.game.state.player_index(self.current_player)))
+
         for territory in self.game.territories:
             if territory.name not in self.territory_positions:
                 continue
@@ -234,6 +257,12 @@ class GameScreen:
             if territory == self.selected_territory:
                 pygame.draw.circle(
                     self.screen, YELLOW, pos, TERRITORY_RADIUS + 3)
+            elif territory.name in self.move_destinations:
+                pygame.draw.circle(
+                    self.screen, GREEN, pos, TERRITORY_RADIUS + 3)
+            elif territory.id in frontier:
+                pygame.draw.circle(
+                    self.screen, ORANGE, pos, TERRITORY_RADIUS + 3)
 
             # Território
             pygame.draw.circle(self.screen, color, pos, TERRITORY_RADIUS)
@@ -57,8 +57,5 @@ GAME_STATE_SETUP = "setup"
 GAME_STATE_PLAYING = "playing"
 GAME_STATE_GAME_OVER = "game_over"
 
-# Fases do turno
-PHASE_PLACE_ARMIES = 1
-PHASE_ATTACK = 2
-PHASE_MOVE = 3
-PHASE_DRAW_CARD = 4
+# Fases do turno (mesmos valores do motor)
+from war.enums import PHASE_PLACE_ARMIES, PHASE_ATTACK, PHASE_MOVE, PHASE_DRAW_CARD  # noqa: E402
@@ -0,0 +1,332 @@
+"""
+Formato binário compilado do mapa.
+
+`python -m war.mapfile [map.json] [map.bin]` valida o map.json uma vez
+(fronteiras simétricas, continentes cobrindo todos os territórios) e grava
+um artefato versionado com IDs, continentes, símbolos das cartas, fronteiras
+em CSR e os territórios de cada continente. Carregar o artefato é uma única
+leitura do arquivo seguida de cópias de arrays, sem validação e sem montar
+dicionários a cada jogo.
+
+Layout (little-endian): cabeçalho `HEADER`, tabela de nomes em UTF-8
+separados por NUL (territórios, continentes, símbolos), alinhamento a 4
+bytes e os arrays int32 offsets[n+1], neighbors[e], continent_offsets[c+1],
+continent_members[n], int16 continent_of[n] e int8 symbol_of[n].
+"""
+import argparse
+import json
+import os
+import struct
+import sys
+import zlib
+from array import array
+from pathlib import Path
+from .frozen import FrozenList, freeze
+from .topology import MapTopology
+
+MAP_FORMAT_MAGIC = b'WARMAP\r\n'
+MAP_FORMAT_VERSION = 1
+
+# magic, versão, territórios, continentes, símbolos, fronteiras, bytes da
+# tabela de nomes, mtime_ns e tamanho do map.json de origem, CRC32 do resto
+HEADER = struct.Struct('<8sHxxIIIIIqQI')
+
+_DATA_DIR = Path(__file__).parent.parent / 'data'
+
+
+def _name_problem(kind, name):
+    if not isinstance(name, str) or not name or '\0' in name:
+        return f"Nome de {kind} inválido: {name!r}"
+    return None
+
+
+def validate_map_data(map_data):
+    """
+    Lista os problemas do mapa (vazia se ele for válido): nomes repetidos,
+    fronteiras com territórios inexistentes ou só de um lado, territórios
+    sem símbolo e continentes que não cobrem cada território exatamente uma
+    vez.
+    """
+    territories = map_data.get('territories') or []
+    if not territories:
+        return ["O mapa não tem territórios"]
+    problems = []
+    borders = {}
+    for territory in territories:
+        name = territory.get('name')
+        problem = _name_problem('território', name)
+        if problem:
+            problems.append(problem)
+        elif name in borders:
+            problems.append(f"Território repetido: {name}")
+        else:
+            borders[name] = set(territory.get('borders', []))
+        problem = _name_problem('símbolo', territory.get('symbol'))
+        if problem:
+            problems.append(f"{name}: {problem}")
+
+    for name, neighbors in borders.items():
+        for neighbor in sorted(neighbors):
+            if neighbor == name:
+                problems.append(f"{name}: faz fronteira consigo mesmo")
+            elif neighbor not in borders:
+                problems.append(
+                    f"{name}: fronteira com território inexistente {neighbor!r}")
+            elif name not in borders[neighbor]:
+                problems.append(f"Fronteira só de um lado: {name} -> {neighbor}")
+
+    continents = map_data.get('continents')
+    if not continents:
+        problems.append("O mapa não declara continentes")
+        return problems
+    listed = {}
+    for continent in continents:
+        continent_name = continent.get('name')
+        problem = _name_problem('continente', continent_name)
+        if problem:
+            problems.append(problem)
+        for name in continent.get('territories', []):
+            if name not in borders:
+                problems.append(
+                    f"{continent_name}: território inexistente {name!r}")
+            elif name in listed:
+                problems.append(
+                    f"{name}: está em {listed[name]} e em {continent_name}")
+            else:
+                listed[name] = continent_name
+    for territory in territories:
+        name = territory.get('name')
+        if name not in borders:
+            continue
+        if name not in listed:
+            problems.append(f"{name}: não pertence a nenhum continente")
+        elif listed[name] != territory.get('continent'):
+            problems.append(f"{name}: continente {territory.get('continent')!r}"
+                            f" diverge da lista de {listed[name]}")
+    return problems
+
+
+def _little_endian(values):
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _padding(strings_size):
+    # Os arrays começam alinhados a 4 bytes
+    return -(HEADER.size + strings_size) % 4
+
+
+def compile_map(map_data, source_stamp=(0, 0), validate=True):
+    """
+    Compila o dicionário do map.json no formato binário. `source_stamp` é o
+    (mtime_ns, tamanho) do arquivo de origem, usado para saber se o artefato
+    está atualizado. Levanta ValueError se o mapa não for válido.
+    """
+    if validate:
+        problems = validate_map_data(map_data)
+        if problems:
+            raise ValueError("Mapa inválido:\n  " + "\n  ".join(problems))
+    territories = map_data['territories']
+    topology = MapTopology.from_map_data(map_data)
+
+    symbol_names = []
+    symbol_of = array('b')
+    for territory in territories:
+        symbol = territory['symbol']
+        if symbol not in symbol_names:
+            symbol_names.append(symbol)
+        symbol_of.append(symbol_names.index(symbol))
+
+    continent_offsets = array('i', [0])
+    continent_members = array('i')
+    for continent_id in range(len(topology.continent_names)):
+        continent_members.extend(topology.territories_in_continent(continent_id))
+        continent_offsets.append(len(continent_members))
+
+    strings = '\0'.join(topology.names + topology.continent_names
+                        + tuple(symbol_names)).encode('utf-8')
+    payload = b''.join([
+        strings,
+        b'\0' * _padding(len(strings)),
+        _little_endian(topology.offsets),
+        _little_endian(topology.neighbors),
+        _little_endian(continent_offsets),
+        _little_endian(continent_members),
+        _little_endian(topology.continent_of),
+        _little_endian(symbol_of),
+    ])
+    header = HEADER.pack(
+        MAP_FORMAT_MAGIC, MAP_FORMAT_VERSION, len(topology),
+        len(topology.continent_names), len(symbol_names),
+        len(topology.neighbors), len(strings), source_stamp[0],
+        source_stamp[1], zlib.crc32(payload))
+    return header + payload
+
+
+class CompiledMap:
+    """
+    Mapa carregado do formato binário (imutável, compartilhado pelos jogos).
+
+    names, continent_names, symbol_names: tabelas de nomes.
+    continent_of, symbol_of: continente e símbolo da carta de cada território.
+    continent_offsets/continent_members: territórios de cada continente (CSR).
+    borders: nomes dos vizinhos de cada território (listas somente leitura).
+    topology: MapTopology sobre os mesmos arrays.
+    source_stamp: (mtime_ns, tamanho) do map.json que gerou o artefato.
+    """
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Lê o artefato; ValueError se ele estiver corrompido ou for de outra versão."""
+        view = memoryview(data)
+        if len(view) < HEADER.size:
+            raise ValueError("Mapa compilado truncado")
+        (magic, version, size, continents, symbols, edges, strings_size,
+         mtime_ns, source_size, checksum) = HEADER.unpack_from(view)
+        if magic != MAP_FORMAT_MAGIC:
+            raise ValueError("Arquivo não é um mapa compilado")
+        if version != MAP_FORMAT_VERSION:
+            raise ValueError(f"Versão de mapa compilado não suportada: {version}")
+        padding = _padding(strings_size)
+        expected = (HEADER.size + strings_size + padding
+                    + 4 * (size + 1 + edges + continents + 1 + size)
+                    + 2 * size + size)
+        if len(view) != expected:
+            raise ValueError("Mapa compilado truncado")
+        if zlib.crc32(view[HEADER.size:]) != checksum:
+            raise ValueError("Mapa compilado corrompido (CRC32)")
+
+        game_map = cls.__new__(cls)
+        position = HEADER.size
+
+        def read(typecode, count):
+            nonlocal position
+            values = array(typecode)
+            end = position + count * values.itemsize
+            values.frombytes(view[position:end])
+            if sys.byteorder == 'big':
+                values.byteswap()
+            position = end
+            return values
+
+        names = bytes(view[position:position + strings_size]).decode(
+            'utf-8').split('\0')
+        position += strings_size + padding
+        game_map.names = tuple(names[:size])
+        game_map.continent_names = tuple(names[size:size + continents])
+        game_map.symbol_names = tuple(names[size + continents:])
+        offsets = read('i', size + 1)
+        neighbors = read('i', edges)
+        game_map.continent_offsets = read('i', continents + 1)
+        game_map.continent_members = read('i', size)
+        game_map.continent_of = read('h', size)
+        game_map.symbol_of = read('b', size)
+        game_map.source_stamp = (mtime_ns, source_size)
+        game_map.topology = MapTopology.from_csr(
+            game_map.names, game_map.continent_names, game_map.continent_of,
+            offsets, neighbors)
+        game_map.borders = tuple(
+            FrozenList(game_map.names[n] for n in game_map.topology.neighbors_of(t))
+            for t in range(size))
+        return game_map
+
+    @classmethod
+    def load(cls, path):
+        """Carrega o artefato com uma única leitura do arquivo."""
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+    @classmethod
+    def from_map_data(cls, map_data, validate=True):
+        """Compila em memória, sem gravar o artefato."""
+        return cls.from_bytes(compile_map(map_data, validate=validate))
+
+    def __len__(self):
+        return len(self.names)
+
+    def symbol(self, territory_id):
+        """Símbolo da carta do território."""
+        return self.symbol_names[self.symbol_of[territory_id]]
+
+    def territories_in_continent(self, continent_id):
+        """IDs dos territórios do continente, pelo índice pré-calculado."""
+        offsets = self.continent_offsets
+        return self.continent_members[offsets[continent_id]:
+                                      offsets[continent_id + 1]].tolist()
+
+    def to_map_data(self):
+        """Dicionário no formato do map.json (congelado) refeito do artefato."""
+        return freeze({
+            'territories': [
+                {'name': name,
+                 'continent': self.continent_names[self.continent_of[t]],
+                 'symbol': self.symbol(t),
+                 'borders': list(self.borders[t])}
+                for t, name in enumerate(self.names)],
+            'continents': [
+                {'name': name,
+                 'territories': [self.names[t] for t
+                                 in self.territories_in_continent(c)]}
+                for c, name in enumerate(self.continent_names)],
+        })
+
+
+def write_map(path, data):
+    """Grava o artefato de forma atômica (outros processos podem estar lendo)."""
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, 'wb') as f:
+        f.write(data)
+    os.replace(temporary, path)
+
+
+def load_or_compile(source, target):
+    """
+    Mapa compilado do map.json `source`. Usa o artefato `target` se ele foi
+    gerado a partir do arquivo atual; senão compila (validando) e tenta
+    regravá-lo. Sem o map.json, o artefato é usado como está.
+    """
+    try:
+        stat = os.stat(source)
+    except FileNotFoundError:
+        return CompiledMap.load(target)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    try:
+        game_map = CompiledMap.load(target)
+        if game_map.source_stamp == stamp:
+            return game_map
+    except (OSError, ValueError):
+        pass
+    with open(source, encoding='utf-8') as f:
+        data = compile_map(json.load(f), stamp)
+    try:
+        write_map(target, data)
+    except OSError:
+        pass
+    return CompiledMap.from_bytes(data)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compila o map.json no formato binário do War")
+    parser.add_argument('source', nargs='?', default=_DATA_DIR / 'map.json')
+    parser.add_argument('target', nargs='?', default=_DATA_DIR / 'map.bin')
+    args = parser.parse_args(argv)
+
+    stat = os.stat(args.source)
+    with open(args.source, encoding='utf-8') as f:
+        map_data = json.load(f)
+    try:
+        data = compile_map(map_data, (stat.st_mtime_ns, stat.st_size))
+    except ValueError as error:
+        parser.exit(1, f"{error}\n")
+    write_map(args.target, data)
+    game_map = CompiledMap.from_bytes(data)
+    print(f"{args.target}: {len(game_map)} territórios, "
+          f"{len(game_map.continent_names)} continentes, "
+          f"{len(game_map.topology.neighbors)} fronteiras ({len(data)} bytes)")
+
+
+if __name__ == '__main__':
+    main()
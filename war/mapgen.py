@@ -0,0 +1,198 @@
+"""
+Gerador de mapas sintéticos no formato do map.json.
+
+Os territórios ficam em uma grade (linhas x colunas) e só fazem fronteira
+com vizinhos da grade, inclusive diagonais, então o grafo parece o de um
+mapa real (local, quase planar) e a geração é O(n) mesmo com milhares de
+territórios. Uma árvore geradora aleatória garante que o mapa é conexo e
+arestas extras são sorteadas até o grau médio pedido. Continentes crescem
+por BFS a partir de sementes sorteadas, então cada um é contíguo.
+
+Uso: python -m war.mapgen 2000 --continents 12 --degree 4.5 -o grande.json
+"""
+import argparse
+import json
+from collections import deque
+from math import ceil, sqrt
+from .rng import GameRandom
+
+DEFAULT_SYMBOLS = {'quadrado': 1, 'círculo': 1, 'triângulo': 1}
+
+# Vizinhos na grade: 4 ortogonais primeiro, depois as diagonais
+_ORTHOGONAL = ((0, 1), (1, 0))
+_DIAGONAL = ((1, 1), (1, -1))
+
+
+def grid_shape(territories):
+    """(linhas, colunas) de uma grade quase quadrada com `territories` células."""
+    columns = max(1, ceil(sqrt(territories)))
+    return ceil(territories / columns), columns
+
+
+def _grid_edges(territories, columns, offsets):
+    edges = []
+    for cell in range(territories):
+        row, column = divmod(cell, columns)
+        for d_row, d_column in offsets:
+            other_row, other_column = row + d_row, column + d_column
+            other = other_row * columns + other_column
+            if 0 <= other_column < columns and other < territories:
+                edges.append((cell, other))
+    return edges
+
+
+def _find(parent, node):
+    while parent[node] != node:
+        parent[node] = parent[parent[node]]
+        node = parent[node]
+    return node
+
+
+def _spanning_edges(territories, edges, rng):
+    """Árvore geradora aleatória (Kruskal com arestas embaralhadas)."""
+    shuffled = list(edges)
+    rng.shuffle(shuffled)
+    parent = list(range(territories))
+    tree = []
+    for a, b in shuffled:
+        root_a, root_b = _find(parent, a), _find(parent, b)
+        if root_a != root_b:
+            parent[root_a] = root_b
+            tree.append((a, b))
+    return tree
+
+
+def _grow_continents(territories, adjacency, continents, rng):
+    """Continente de cada território: BFS simultânea a partir de sementes."""
+    continent_of = [-1] * territories
+    queue = deque()
+    for continent, seed in enumerate(rng.sample(range(territories),
+                                                continents)):
+        continent_of[seed] = continent
+        queue.append(seed)
+    while queue:
+        territory = queue.popleft()
+        neighbors = list(adjacency[territory])
+        rng.shuffle(neighbors)
+        for neighbor in neighbors:
+            if continent_of[neighbor] == -1:
+                continent_of[neighbor] = continent_of[territory]
+                queue.append(neighbor)
+    return continent_of
+
+
+def _symbol_sequence(territories, symbols, rng):
+    """Símbolos nas proporções pedidas (maiores restos), embaralhados."""
+    names = list(symbols)
+    total = sum(symbols.values())
+    if not names or total <= 0:
+        raise ValueError("É preciso pelo menos um símbolo com peso positivo")
+    quotas = [territories * symbols[name] / total for name in names]
+    counts = [int(quota) for quota in quotas]
+    by_remainder = sorted(range(len(names)),
+                          key=lambda i: quotas[i] - counts[i], reverse=True)
+    for i in by_remainder[:territories - sum(counts)]:
+        counts[i] += 1
+    sequence = [name for name, count in zip(names, counts)
+                for _ in range(count)]
+    rng.shuffle(sequence)
+    return sequence
+
+
+def generate_map(territories, continents=None, average_degree=4.0,
+                 symbols=None, seed=None):
+    """
+    Gera um mapa válido (ver war.mapfile.validate_map_data) no formato do
+    map.json.
+
+    territories: quantidade de territórios.
+    continents: quantidade de continentes (padrão: ~1 a cada 7 territórios,
+        como no mapa original).
+    average_degree: grau médio desejado, entre ~2 (árvore) e o máximo da
+        grade com diagonais (~8).
+    symbols: {símbolo: peso} das cartas (padrão: três símbolos iguais).
+    seed: semente; a mesma semente gera o mesmo mapa.
+    """
+    if territories < 2:
+        raise ValueError("O mapa precisa de pelo menos 2 territórios")
+    if continents is None:
+        continents = max(1, round(territories / 7))
+    if not 1 <= continents <= territories:
+        raise ValueError("Quantidade de continentes inválida")
+    rng = GameRandom(seed)
+    _, columns = grid_shape(territories)
+
+    candidates = _grid_edges(territories, columns, _ORTHOGONAL + _DIAGONAL)
+    wanted = round(territories * average_degree / 2)
+    if not territories - 1 <= wanted <= len(candidates):
+        raise ValueError(
+            f"Grau médio {average_degree} fora do possível para "
+            f"{territories} territórios ({2 * (territories - 1) / territories:.2f}"
+            f" a {2 * len(candidates) / territories:.2f})")
+    tree = _spanning_edges(
+        territories, _grid_edges(territories, columns, _ORTHOGONAL), rng)
+    chosen = set(tree)
+    extra = [edge for edge in candidates if edge not in chosen]
+    chosen.update(rng.sample(extra, wanted - len(tree)))
+
+    adjacency = [[] for _ in range(territories)]
+    for a, b in sorted(chosen):
+        adjacency[a].append(b)
+        adjacency[b].append(a)
+    continent_of = _grow_continents(territories, adjacency, continents, rng)
+    symbol_of = _symbol_sequence(territories, symbols or DEFAULT_SYMBOLS, rng)
+
+    names = [f"Território {i + 1}" for i in range(territories)]
+    continent_names = [f"Continente {i + 1}" for i in range(continents)]
+    members = [[] for _ in range(continents)]
+    for territory, continent in enumerate(continent_of):
+        members[continent].append(names[territory])
+    return {
+        'continents': [{'name': name, 'territories': territory_names}
+                       for name, territory_names
+                       in zip(continent_names, members)],
+        'territories': [
+            {'name': names[territory],
+             'continent': continent_names[continent_of[territory]],
+             'borders': [names[n] for n in sorted(adjacency[territory])],
+             'symbol': symbol_of[territory]}
+            for territory in range(territories)],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Gera um mapa sintético no formato do map.json")
+    parser.add_argument('territories', type=int)
+    parser.add_argument('--continents', type=int, default=None)
+    parser.add_argument('--degree', type=float, default=4.0,
+                        help="grau médio (fronteiras por território)")
+    parser.add_argument('--symbol', action='append', default=[],
+                        metavar='NOME=PESO',
+                        help="símbolo das cartas e peso (pode repetir)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-o', '--output', default=None,
+                        help="arquivo de saída (padrão: saída padrão)")
+    args = parser.parse_args(argv)
+
+    symbols = None
+    if args.symbol:
+        symbols = {}
+        for item in args.symbol:
+            name, _, weight = item.partition('=')
+            symbols[name] = float(weight or 1)
+    try:
+        map_data = generate_map(args.territories, args.continents,
+                                args.degree, symbols, args.seed)
+    except ValueError as error:
+        parser.error(str(error))
+    text = json.dumps(map_data, ensure_ascii=False, indent=2)
+    if args.output is None:
+        print(text)
+    else:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+
+
+if __name__ == '__main__':
+    main()
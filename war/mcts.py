@@ -0,0 +1,463 @@
+"""
+Busca em árvore Monte Carlo (MCTS) sobre as fases do turno.
+
+A busca joga sobre cópias do GameState (sem visões nem eventos), com nós
+de acaso para os dados do ataque e uma tabela de transposição que junta
+posições iguais alcançadas por caminhos diferentes.
+"""
+from math import log, sqrt
+from time import perf_counter_ns
+from .bots import Bot
+from .enums import PHASE_PLACE_ARMIES, PHASE_ATTACK, PHASE_MOVE
+from .moves import ACTION_PLACE, ACTION_ATTACK, ACTION_FORTIFY
+from .frontier import FrontierIndex
+from .odds import round_outcomes
+from .dice import MAX_ATTACK_DICE, MAX_DEFENSE_DICE
+from .rng import GameRandom
+from .state import NO_OWNER
+
+# Ação de encerrar a fase atual (parar de atacar / não deslocar)
+END_PHASE = None
+
+
+class TurnSimulator:
+    """
+    Turnos simplificados sobre um GameState copiado.
+
+    Cada fase é reduzida a poucas ações: os exércitos recebidos vão todos
+    para um território, cada ataque é uma rodada de dados com o máximo de
+    exércitos e o deslocamento move todas as tropas livres uma vez. Cartas
+    não entram na simulação. Territórios e fronteira vêm de um
+    FrontierIndex sobre o estado copiado, copiado junto com o simulador,
+    então a política não varre o mapa a cada passo.
+    """
+
+    __slots__ = ('state', 'player', 'phase', 'armies', 'turns',
+                 'mission', 'mission_player', '_frontier')
+
+    def __init__(self, state, player, phase, armies=0, mission=None,
+                 mission_player=NO_OWNER):
+        self.state = state
+        self.player = player
+        self.phase = phase
+        self.armies = armies
+        self.turns = 0
+        self.mission = mission  # predicado da missão de `mission_player`
+        self.mission_player = mission_player
+        # Índice de fronteira do estado, criado na primeira consulta
+        self._frontier = None
+
+    def copy(self):
+        state = self.state.copy()
+        clone = TurnSimulator(state, self.player, self.phase,
+                              self.armies, self.mission, self.mission_player)
+        clone.turns = self.turns
+        # O índice é montado uma vez no original (a raiz da busca) e
+        # copiado, bem mais barato que montá-lo de novo a cada iteração
+        clone._frontier = self.frontier_index().copy(state)
+        return clone
+
+    def frontier_index(self):
+        if self._frontier is None:
+            self._frontier = FrontierIndex(self.state)
+        return self._frontier
+
+    def key(self):
+        """
+        Chave da posição para a tabela de transposição: o hash de Zobrist do
+        tabuleiro (tropas em faixas, exatas até 4) quando o estado o mantém.
+        """
+        state = self.state
+        board = (state.hash if state.zobrist is not None
+                 else (state.owner.tobytes(), state.troops.tobytes()))
+        return (board, self.player, self.phase, self.armies)
+
+    def winner(self):
+        """Índice do vencedor ou NO_OWNER se o jogo continua."""
+        state = self.state
+        if (self.mission is not None
+                and self.mission.is_complete(state, self.mission_player)):
+            return self.mission_player
+        alive = NO_OWNER
+        for index, count in enumerate(state.owned_count):
+            if count:
+                if alive != NO_OWNER:
+                    return NO_OWNER
+                alive = index
+        return alive
+
+    def territory_share(self):
+        total = len(self.state.owner)
+        return [count / total for count in self.state.owned_count]
+
+    def owned(self):
+        return self.frontier_index().owned(self.player)
+
+    def frontier(self):
+        return self.frontier_index().frontier(self.player)
+
+    def attack_options(self):
+        # Só territórios de fronteira têm alvos: a consulta custa
+        # O(fronteira x grau), não uma varredura do mapa
+        state = self.state
+        owner, troops = state.owner, state.troops
+        neighbors_of = state.topology.neighbors_of
+        player = self.player
+        return [(source, target)
+                for source in self.frontier() if troops[source] > 1
+                for target in neighbors_of(source) if owner[target] != player]
+
+    def fortify_options(self):
+        state = self.state
+        owner, troops = state.owner, state.troops
+        neighbors_of = state.topology.neighbors_of
+        player = self.player
+        return [(source, target)
+                for source in self.owned() if troops[source] > 1
+                for target in neighbors_of(source) if owner[target] == player]
+
+    def legal_actions(self):
+        """Ações da fase atual como tuplas (tipo, origem, destino)."""
+        if self.phase == PHASE_PLACE_ARMIES:
+            territories = self.frontier() or self.owned()
+            return [(ACTION_PLACE, t, t) for t in territories]
+        if self.phase == PHASE_ATTACK:
+            actions = [(ACTION_ATTACK, source, target)
+                       for source, target in self.attack_options()]
+        else:
+            actions = [(ACTION_FORTIFY, source, target)
+                       for source, target in self.fortify_options()]
+        actions.append(END_PHASE)
+        return actions
+
+    def attack_outcomes(self, source, target):
+        """Distribuição ((perdas atacante, perdas defensor), prob.) da rodada."""
+        troops = self.state.troops
+        return round_outcomes(min(troops[source] - 1, MAX_ATTACK_DICE),
+                              min(troops[target], MAX_DEFENSE_DICE))
+
+    def apply_attack(self, source, target, attacker_losses, defender_losses):
+        state = self.state
+        troops = state.troops
+        attacking = min(troops[source] - 1, MAX_ATTACK_DICE)
+        defenders = troops[target] - defender_losses
+        if defenders <= 0:
+            # Conquista: os sobreviventes ocupam o território
+            state.set_owner(target, self.player)
+            survivors = attacking - attacker_losses
+            state.set_troops(source, troops[source] - attacker_losses
+                             - survivors)
+            state.set_troops(target, survivors)
+        else:
+            if attacker_losses:
+                state.set_troops(source, troops[source] - attacker_losses)
+            state.set_troops(target, defenders)
+
+    def apply(self, action):
+        """Aplica uma ação determinística (colocação, deslocamento ou fim)."""
+        state = self.state
+        if self.phase == PHASE_PLACE_ARMIES:
+            territory = action[1]
+            state.set_troops(territory, state.troops[territory] + self.armies)
+            self.armies = 0
+            self.phase = PHASE_ATTACK
+        elif action is END_PHASE:
+            if self.phase == PHASE_ATTACK:
+                self.phase = PHASE_MOVE
+            else:
+                self.next_turn()
+        else:
+            _, source, target = action
+            troops = state.troops
+            state.set_troops(target, troops[target] + troops[source] - 1)
+            state.set_troops(source, 1)
+            self.next_turn()
+
+    def step(self, action, rng):
+        """Aplica qualquer ação, sorteando os dados se for um ataque."""
+        if action is not END_PHASE and action[0] == ACTION_ATTACK:
+            _, source, target = action
+            losses = sample_outcome(self.attack_outcomes(source, target),
+                                    rng.random())
+            self.apply_attack(source, target, *losses)
+        else:
+            self.apply(action)
+
+    def next_turn(self):
+        owned_count = self.state.owned_count
+        player_count = len(owned_count)
+        player = self.player
+        for _ in range(player_count):
+            player = (player + 1) % player_count
+            if owned_count[player]:
+                break
+        self.player = player
+        self.phase = PHASE_PLACE_ARMIES
+        # Mesma regra de Game.calculate_armies_to_receive
+        self.armies = max(owned_count[player] // 2, 1)
+        self.turns += 1
+
+
+def sample_outcome(outcomes, r):
+    """Escolhe um resultado de `round_outcomes` a partir de r em [0, 1)."""
+    for losses, probability in outcomes:
+        r -= probability
+        if r < 0:
+            return losses
+    return outcomes[-1][0]
+
+
+def random_policy(sim, rng):
+    """Política de simulação: ações permitidas ao acaso."""
+    if sim.phase == PHASE_PLACE_ARMIES:
+        territories = sim.frontier() or sim.owned()
+        territory = rng.choice(territories)
+        return (ACTION_PLACE, territory, territory)
+    if sim.phase == PHASE_ATTACK:
+        options = sim.attack_options()
+        if not options or rng.random() < 0.2:
+            return END_PHASE
+        return (ACTION_ATTACK, *rng.choice(options))
+    return END_PHASE
+
+
+def greedy_policy(sim, rng):
+    """
+    Política de simulação: reforça a fronteira mais forte e ataca onde a
+    vantagem de tropas é maior.
+    """
+    troops = sim.state.troops
+    if sim.phase == PHASE_PLACE_ARMIES:
+        territories = sim.frontier() or sim.owned()
+        territory = max(territories, key=troops.__getitem__)
+        return (ACTION_PLACE, territory, territory)
+    if sim.phase == PHASE_ATTACK:
+        best, best_margin = END_PHASE, 0
+        for source, target in sim.attack_options():
+            margin = troops[source] - troops[target]
+            if margin > best_margin:
+                best, best_margin = (ACTION_ATTACK, source, target), margin
+        return best
+    return END_PHASE
+
+
+class ChanceNode:
+    """Nó de acaso: os resultados possíveis dos dados de um ataque."""
+
+    __slots__ = ('outcomes', 'visits')
+
+    def __init__(self, outcomes):
+        self.outcomes = outcomes
+        self.visits = [0] * len(outcomes)
+
+    def sample(self, rng):
+        r = rng.random()
+        for index, (losses, probability) in enumerate(self.outcomes):
+            r -= probability
+            if r < 0:
+                break
+        self.visits[index] += 1
+        return self.outcomes[index][0]
+
+
+class DecisionNode:
+    """Nó de decisão com estatísticas por ação (UCT)."""
+
+    __slots__ = ('player', 'actions', 'untried', 'visits', 'counts',
+                 'values', 'chance')
+
+    def __init__(self, sim, rng):
+        self.player = sim.player
+        self.actions = sim.legal_actions()
+        self.untried = list(range(len(self.actions)))
+        rng.shuffle(self.untried)
+        self.visits = 0
+        self.counts = [0] * len(self.actions)
+        self.values = [0.0] * len(self.actions)
+        self.chance = [None] * len(self.actions)
+
+    def select(self, exploration):
+        log_visits = log(self.visits)
+        best, best_score = 0, -1.0
+        for index, count in enumerate(self.counts):
+            score = (self.values[index] / count
+                     + exploration * sqrt(log_visits / count))
+            if score > best_score:
+                best, best_score = index, score
+        return best
+
+    def best_action(self):
+        """Ação mais visitada."""
+        if not self.actions:
+            return END_PHASE
+        index = max(range(len(self.actions)), key=self.counts.__getitem__)
+        return self.actions[index]
+
+
+class MCTS:
+    """
+    Busca Monte Carlo com UCT, nós de acaso e tabela de transposição.
+
+    O orçamento de cada busca é um número de iterações, um tempo em ms ou
+    ambos (o que acabar primeiro). A tabela é mantida entre buscas e
+    esvaziada quando passa de `max_nodes`.
+    """
+
+    def __init__(self, policy=random_policy, exploration=0.2,
+                 playout_turns=6, max_depth=60, max_nodes=200_000, rng=None):
+        self.policy = policy
+        self.exploration = exploration
+        self.playout_turns = playout_turns
+        self.max_depth = max_depth
+        self.max_nodes = max_nodes
+        self.rng = rng if rng is not None else GameRandom()
+        self.table = {}
+        self.playouts = 0
+        self.search_time_ns = 0
+
+    def playouts_per_second(self):
+        """Vazão acumulada de simulações (playouts/s)."""
+        if not self.search_time_ns:
+            return 0.0
+        return self.playouts * 1e9 / self.search_time_ns
+
+    def node(self, sim):
+        key = sim.key()
+        node = self.table.get(key)
+        if node is None:
+            node = DecisionNode(sim, self.rng)
+            self.table[key] = node
+        return node
+
+    def search(self, root_sim, iterations=None, time_budget_ms=None):
+        """Roda a busca a partir de `root_sim` e devolve o nó raiz."""
+        if iterations is None and time_budget_ms is None:
+            iterations = 200
+        if len(self.table) > self.max_nodes:
+            self.table.clear()
+        start = perf_counter_ns()
+        deadline = (None if time_budget_ms is None
+                    else start + int(time_budget_ms * 1_000_000))
+        root = self.node(root_sim)
+        done = 0
+        while iterations is None or done < iterations:
+            self.iterate(root, root_sim.copy())
+            done += 1
+            if deadline is not None and perf_counter_ns() >= deadline:
+                break
+        self.playouts += done
+        self.search_time_ns += perf_counter_ns() - start
+        return root
+
+    def iterate(self, root, sim):
+        rng = self.rng
+        table = self.table
+        path = []
+        node = root
+        while True:
+            if (not node.actions or sim.winner() != NO_OWNER
+                    or len(path) >= self.max_depth):
+                break
+            if node.untried:
+                index = node.untried.pop()
+                expanding = True
+            else:
+                index = node.select(self.exploration)
+                expanding = False
+            path.append((node, index))
+            action = node.actions[index]
+            if action is not END_PHASE and action[0] == ACTION_ATTACK:
+                chance = node.chance[index]
+                if chance is None:
+                    chance = ChanceNode(sim.attack_outcomes(*action[1:]))
+                    node.chance[index] = chance
+                sim.apply_attack(action[1], action[2], *chance.sample(rng))
+            else:
+                sim.apply(action)
+            key = sim.key()
+            child = table.get(key)
+            if child is None or expanding:
+                if child is None:
+                    table[key] = DecisionNode(sim, rng)
+                self.playout(sim)
+                break
+            node = child
+
+        rewards = self.evaluate(sim)
+        for node, index in path:
+            node.visits += 1
+            node.counts[index] += 1
+            node.values[index] += rewards[node.player]
+
+    def playout(self, sim):
+        """Joga a política de simulação até o fim ou `playout_turns` turnos."""
+        policy, rng = self.policy, self.rng
+        last_turn = sim.turns + self.playout_turns
+        while sim.turns < last_turn and sim.winner() == NO_OWNER:
+            sim.step(policy(sim, rng), rng)
+
+    def evaluate(self, sim):
+        """Recompensa de cada jogador: vitória vale 1, senão a fatia do mapa."""
+        winner = sim.winner()
+        if winner != NO_OWNER:
+            rewards = [0.0] * len(sim.state.owned_count)
+            rewards[winner] = 1.0
+            return rewards
+        return sim.territory_share()
+
+    @staticmethod
+    def visit_distribution(root):
+        """Pares (ação, visitas) da raiz, úteis como dados de treino."""
+        return list(zip(root.actions, root.counts))
+
+
+class MCTSBot(Bot):
+    """Bot que decide cada fase do turno com MCTS."""
+
+    name = 'mcts'
+
+    def __init__(self, iterations=200, time_budget_ms=None,
+                 policy=random_policy, seed=None, **options):
+        super().__init__(time_budget_ms)
+        self.iterations = iterations if time_budget_ms is None else None
+        # Margem para o trabalho fora da busca não estourar o orçamento
+        self.search_budget_ms = (None if time_budget_ms is None
+                                 else time_budget_ms * 0.9)
+        self.policy = policy
+        self.seed = seed
+        self.options = options
+        self.mcts = None
+
+    def playouts_per_second(self):
+        return self.mcts.playouts_per_second() if self.mcts else 0.0
+
+    def decide(self, view, phase, armies=0):
+        if self.mcts is None:
+            # Sem semente própria, deriva da semente do jogo (reprodutível)
+            rng = (GameRandom(self.seed) if self.seed is not None
+                   else view.rng.fork())
+            self.mcts = MCTS(self.policy, rng=rng, **self.options)
+        sim = TurnSimulator(view.copy_state(), view.player_index, phase,
+                            armies, view.mission, view.player_index)
+        root = self.mcts.search(sim, self.iterations, self.search_budget_ms)
+        return root.best_action()
+
+    def place(self, view, armies):
+        action = self.decide(view, PHASE_PLACE_ARMIES, armies)
+        if action is END_PHASE:
+            return super().place(view, armies)
+        return [(action[2], armies)]
+
+    def attack(self, view):
+        action = self.decide(view, PHASE_ATTACK)
+        if action is END_PHASE:
+            return None
+        _, source, target = action
+        return source, target, min(view.troops[source] - 1, MAX_ATTACK_DICE)
+
+    def fortify(self, view):
+        action = self.decide(view, PHASE_MOVE)
+        if action is END_PHASE:
+            return None
+        _, source, target = action
+        return source, target, view.troops[source] - 1
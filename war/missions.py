@@ -0,0 +1,185 @@
+import re
+from .events import OWNERSHIP_CHANGED, PLAYER_ELIMINATED
+from .state import NO_OWNER
+
+# Quantidade de territórios usada quando a missão de destruir um jogador
+# não pode mais ser cumprida (regra oficial do WAR)
+DEFAULT_TERRITORY_GOAL = 24
+
+_TERRITORY_COUNT = re.compile(r'conquistar\s+(\d+)\s+territ', re.IGNORECASE)
+_EXTRA_CONTINENT = re.compile(r'mais\s+um\s+continente', re.IGNORECASE)
+_EXTRA_CONTINENT_PHRASE = re.compile(
+    r'mais\s+um\s+continente(?:\s+à\s+sua\s+escolha)?', re.IGNORECASE)
+# Palavras que podem sobrar numa missão de continentes depois de tirar os
+# nomes dos continentes ("Conquistar a Europa, a Oceania e ...")
+_CONTINENT_FILLER = {'conquistar', 'na', 'totalidade', 'a', 'o', 'as', 'os',
+                     'e'}
+_DESTROY_PLAYER = re.compile(r'destruir', re.IGNORECASE)
+
+
+class ContinentsMission:
+    """Conquistar um conjunto de continentes (e, opcionalmente, mais N à escolha)."""
+
+    def __init__(self, continent_ids, extra=0):
+        self.continent_ids = tuple(continent_ids)
+        self.extra = extra
+
+    def is_complete(self, state, player_index):
+        controller = state.controller
+        for continent_id in self.continent_ids:
+            if controller[continent_id] != player_index:
+                return False
+        if self.extra:
+            others = sum(1 for continent_id, owner in enumerate(controller)
+                         if owner == player_index
+                         and continent_id not in self.continent_ids)
+            return others >= self.extra
+        return True
+
+
+class TerritoryCountMission:
+    """Conquistar uma quantidade mínima de territórios."""
+
+    def __init__(self, count):
+        self.count = count
+
+    def is_complete(self, state, player_index):
+        return state.owned_count[player_index] >= self.count
+
+
+class DestroyPlayerMission:
+    """
+    Destruir um jogador específico. Se o alvo não existir, for o próprio
+    jogador ou for eliminado por outra pessoa, vale a missão alternativa.
+    """
+
+    def __init__(self, fallback):
+        self.fallback = fallback
+        self.target = NO_OWNER
+        self.failed = False  # alvo eliminado por outro jogador
+        self.achieved = False
+
+    def is_complete(self, state, player_index):
+        if self.achieved:
+            return True
+        if self.failed or self.target in (NO_OWNER, player_index):
+            return self.fallback.is_complete(state, player_index)
+        return False
+
+
+def mission_description(mission):
+    """Aceita missões como dicionário do missions.json ou texto puro."""
+    if isinstance(mission, dict):
+        return mission.get('description', '')
+    return str(mission)
+
+
+def compile_mission(mission, topology):
+    """
+    Compila a descrição em texto de uma missão em um predicado estruturado.
+    Retorna None se a descrição não for reconhecida, inclusive quando ela
+    cita um continente que não existe no mapa (a missão não pode ser
+    reduzida aos continentes conhecidos).
+    """
+    description = mission_description(mission)
+
+    if _DESTROY_PLAYER.search(description):
+        match = _TERRITORY_COUNT.search(description)
+        count = int(match.group(1)) if match else DEFAULT_TERRITORY_GOAL
+        return DestroyPlayerMission(TerritoryCountMission(count))
+
+    match = _TERRITORY_COUNT.search(description)
+    if match:
+        return TerritoryCountMission(int(match.group(1)))
+
+    rest = description.lower()
+    continent_ids = []
+    # Nomes mais longos primeiro, para um nome contido em outro não casar
+    for continent_id, name in sorted(enumerate(topology.continent_names),
+                                     key=lambda item: -len(item[1])):
+        if name.lower() in rest:
+            continent_ids.append(continent_id)
+            rest = rest.replace(name.lower(), ' ')
+    if not continent_ids:
+        return None
+    rest = _EXTRA_CONTINENT_PHRASE.sub(' ', rest)
+    if any(word not in _CONTINENT_FILLER for word in re.findall(r'\w+', rest)):
+        return None  # continente desconhecido no mapa
+    extra = 1 if _EXTRA_CONTINENT.search(description) else 0
+    return ContinentsMission(sorted(continent_ids), extra)
+
+
+class MissionTracker:
+    """
+    Acompanha as missões dos jogadores a partir dos eventos do motor.
+
+    Só a missão do jogador que ganhou um território é reavaliada a cada
+    conquista, então a checagem de vitória custa O(1) por troca de dono.
+    """
+
+    def __init__(self, game):
+        self.state = game.state
+        self.predicates = [None] * len(self.state.players)
+        self.winner = None
+        for player in game.players:
+            index = self.state.player_index(player)
+            self.predicates[index] = game.template.mission_predicate(
+                player.mission)
+        game.events.subscribe(OWNERSHIP_CHANGED, self.on_ownership_changed)
+        game.events.subscribe(PLAYER_ELIMINATED, self.on_player_eliminated)
+
+    def assign_target(self, player, target):
+        """Define o alvo de uma missão de destruir jogador."""
+        predicate = self.predicates[self.state.player_index(player)]
+        if isinstance(predicate, DestroyPlayerMission):
+            predicate.target = self.state.player_index(target)
+
+    def check(self, player_index):
+        """Reavalia a missão de um jogador; retorna True se foi cumprida."""
+        if self.winner is not None:
+            return True
+        if player_index >= len(self.predicates):
+            return False  # jogador sem missão neste jogo
+        predicate = self.predicates[player_index]
+        if predicate is not None and predicate.is_complete(
+                self.state, player_index):
+            self.winner = self.state.players[player_index]
+            return True
+        return False
+
+    def snapshot(self):
+        """Parte mutável das missões: vencedor e situação dos alvos."""
+        return self.state.player_index(self.winner), [
+            (predicate.target, predicate.failed, predicate.achieved)
+            if isinstance(predicate, DestroyPlayerMission) else None
+            for predicate in self.predicates]
+
+    def restore(self, snapshot):
+        """Restaura um snapshot (também de outro jogo com os mesmos índices)."""
+        winner_index, targets = snapshot
+        self.winner = self.state.player_at(winner_index)
+        for predicate, target in zip(self.predicates, targets):
+            if target is not None:
+                predicate.target, predicate.failed, predicate.achieved = target
+
+    def check_all(self):
+        for player_index in range(len(self.predicates)):
+            if self.check(player_index):
+                return True
+        return False
+
+    def on_ownership_changed(self, territory_id, old_index, new_index):
+        if new_index != NO_OWNER:
+            self.check(new_index)
+
+    def on_player_eliminated(self, player, eliminated_by):
+        target = self.state.player_index(player)
+        by_index = self.state.player_index(eliminated_by)
+        for player_index, predicate in enumerate(self.predicates):
+            if (isinstance(predicate, DestroyPlayerMission)
+                    and predicate.target == target):
+                if player_index == by_index:
+                    predicate.achieved = True
+                else:
+                    predicate.failed = True
+                self.check(player_index)
@@ -0,0 +1,164 @@
+from array import array
+from .events import OWNERSHIP_CHANGED, TROOPS_CHANGED
+from .state import NO_OWNER
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional (extra "sim")
+    np = None
+
+# Tipos de ação das tuplas (tipo, origem, destino); em colocações
+# origem e destino são o mesmo território
+ACTION_PLACE = 0
+ACTION_ATTACK = 1
+ACTION_FORTIFY = 2
+
+
+class MoveGenerator:
+    """
+    Gerador de jogadas permitidas sobre a topologia compilada.
+
+    Cada aresta dirigida do mapa (índice no array CSR `neighbors`) é
+    classificada como ataque ou deslocamento permitido de algum jogador.
+    A classificação é atualizada pelos eventos do GameState só nas arestas
+    do território que mudou, então entre uma jogada e outra nada é
+    recalculado do zero. As jogadas saem em ordem de aresta, que não
+    depende do histórico: o mesmo estado gera sempre a mesma sequência.
+    """
+
+    def __init__(self, state):
+        self.state = state
+        topology = state.topology
+        self.topology = topology
+        edge_count = len(topology.neighbors)
+        self.edge_count = edge_count
+        self.edge_src = array('i', [0]) * edge_count
+        self.edge_dst = array('i', topology.neighbors)
+        incoming = [[] for _ in range(len(topology))]
+        for source in range(len(topology)):
+            for edge in range(topology.offsets[source],
+                              topology.offsets[source + 1]):
+                self.edge_src[edge] = source
+                incoming[topology.neighbors[edge]].append(edge)
+        self._incoming = [tuple(edges) for edges in incoming]
+
+        # Jogador dono de cada aresta legal (NO_OWNER se não for legal)
+        self._attack_owner = array('h', [NO_OWNER]) * edge_count
+        self._fortify_owner = array('h', [NO_OWNER]) * edge_count
+        self._attacks = {}
+        self._fortifies = {}
+        self._owned = {}
+        for territory_id, owner in enumerate(state.owner):
+            if owner != NO_OWNER:
+                self._owned.setdefault(owner, set()).add(territory_id)
+        for edge in range(edge_count):
+            self._update_edge(edge)
+
+        state.events.subscribe(OWNERSHIP_CHANGED, self.on_ownership_changed)
+        state.events.subscribe(TROOPS_CHANGED, self.on_troops_changed)
+
+    def close(self):
+        """Para de acompanhar o estado."""
+        self.state.events.unsubscribe(OWNERSHIP_CHANGED,
+                                      self.on_ownership_changed)
+        self.state.events.unsubscribe(TROOPS_CHANGED, self.on_troops_changed)
+
+    def _update_edge(self, edge):
+        owner = self.state.owner
+        source = self.edge_src[edge]
+        target = self.edge_dst[edge]
+        source_owner = owner[source]
+        legal = source_owner != NO_OWNER and self.state.troops[source] > 1
+        attacker = (source_owner if legal and owner[target] != source_owner
+                    else NO_OWNER)
+        fortifier = (source_owner if legal and owner[target] == source_owner
+                     else NO_OWNER)
+        self._move_edge(edge, attacker, self._attack_owner, self._attacks)
+        self._move_edge(edge, fortifier, self._fortify_owner, self._fortifies)
+
+    @staticmethod
+    def _move_edge(edge, new_owner, owners, sets):
+        old_owner = owners[edge]
+        if old_owner == new_owner:
+            return
+        if old_owner != NO_OWNER:
+            sets[old_owner].discard(edge)
+        if new_owner != NO_OWNER:
+            sets.setdefault(new_owner, set()).add(edge)
+        owners[edge] = new_owner
+
+    def _update_territory(self, territory_id):
+        offsets = self.topology.offsets
+        for edge in range(offsets[territory_id], offsets[territory_id + 1]):
+            self._update_edge(edge)
+        for edge in self._incoming[territory_id]:
+            self._update_edge(edge)
+
+    def on_ownership_changed(self, territory_id, old_index, new_index):
+        if old_index != NO_OWNER:
+            self._owned[old_index].discard(territory_id)
+        if new_index != NO_OWNER:
+            self._owned.setdefault(new_index, set()).add(territory_id)
+        self._update_territory(territory_id)
+
+    def on_troops_changed(self, territory_id, old_troops, new_troops):
+        # Só cruzar o limite de 1 tropa muda a legalidade das arestas
+        if (old_troops > 1) != (new_troops > 1):
+            offsets = self.topology.offsets
+            for edge in range(offsets[territory_id],
+                              offsets[territory_id + 1]):
+                self._update_edge(edge)
+
+    def placements(self, player_index):
+        """Territórios onde o jogador pode colocar exércitos."""
+        for territory_id in sorted(self._owned.get(player_index, ())):
+            yield ACTION_PLACE, territory_id, territory_id
+
+    def attacks(self, player_index):
+        """Ataques permitidos: (ACTION_ATTACK, origem, destino)."""
+        edge_src, edge_dst = self.edge_src, self.edge_dst
+        for edge in sorted(self._attacks.get(player_index, ())):
+            yield ACTION_ATTACK, edge_src[edge], edge_dst[edge]
+
+    def fortifies(self, player_index):
+        """Deslocamentos permitidos: (ACTION_FORTIFY, origem, destino)."""
+        edge_src, edge_dst = self.edge_src, self.edge_dst
+        for edge in sorted(self._fortifies.get(player_index, ())):
+            yield ACTION_FORTIFY, edge_src[edge], edge_dst[edge]
+
+    def legal_moves(self, player_index):
+        yield from self.placements(player_index)
+        yield from self.attacks(player_index)
+        yield from self.fortifies(player_index)
+
+    def attack_pairs(self, player_index):
+        edge_src, edge_dst = self.edge_src, self.edge_dst
+        return [(edge_src[e], edge_dst[e])
+                for e in sorted(self._attacks.get(player_index, ()))]
+
+    def fortify_pairs(self, player_index):
+        edge_src, edge_dst = self.edge_src, self.edge_dst
+        return [(edge_src[e], edge_dst[e])
+                for e in sorted(self._fortifies.get(player_index, ()))]
+
+    def attack_count(self, player_index):
+        return len(self._attacks.get(player_index, ()))
+
+    def attack_masks(self):
+        """
+        Máscaras de ataques permitidos de todos os jogadores como array
+        NumPy (jogadores x arestas). Requer NumPy.
+        """
+        return self._masks(self._attack_owner)
+
+    def fortify_masks(self):
+        return self._masks(self._fortify_owner)
+
+    def _masks(self, owners):
+        if np is None:
+            raise ImportError(
+                "NumPy é necessário para as máscaras de ações "
+                "(pip install war-board-game[sim])")
+        owner_per_edge = np.frombuffer(owners, dtype=np.int16)
+        players = np.arange(len(self.state.players), dtype=np.int16)
+        return owner_per_edge[None, :] == players[:, None]
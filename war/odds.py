@@ -0,0 +1,203 @@
+import json
+from functools import lru_cache
+from itertools import product
+from pathlib import Path
+from .dice import MAX_ATTACK_DICE, MAX_DEFENSE_DICE, compare_rolls
+
+ODDS_FORMAT_VERSION = 1
+# Maior pilha com tabela exata; acima dela as odds são aproximadas
+DEFAULT_LIMIT = 200
+
+
+@lru_cache(maxsize=None)
+def round_outcomes(attack_dice, defense_dice):
+    """
+    Distribuição exata de uma rodada de combate com as mesmas regras de
+    `Game.attack_territory`: tupla de ((perdas atacante, perdas defensor),
+    probabilidade).
+    """
+    counts = {}
+    for rolls in product(range(1, 7), repeat=attack_dice + defense_dice):
+        losses = compare_rolls(rolls[:attack_dice], rolls[attack_dice:])
+        counts[losses] = counts.get(losses, 0) + 1
+    total = 6 ** (attack_dice + defense_dice)
+    return tuple((losses, count / total)
+                 for losses, count in sorted(counts.items()))
+
+
+def _round(attackers, defenders):
+    return round_outcomes(min(attackers, MAX_ATTACK_DICE),
+                          min(defenders, MAX_DEFENSE_DICE))
+
+
+class BattleOdds:
+    """
+    Probabilidades exatas de uma batalha repetida até o fim.
+
+    `attackers` são os exércitos que participam do ataque (o que fica no
+    território de origem não conta) e `defenders` as tropas do território
+    atacado. A batalha segue rodada a rodada até um dos lados chegar a zero,
+    como uma cadeia de Markov; as tabelas são calculadas uma vez até
+    `max_attackers` x `max_defenders` e crescem sob demanda só com as
+    linhas e colunas novas, até `limit`. Acima do limite os dois lados são
+    reduzidos na mesma proporção e o resultado é aproximado (ver `_scaled`).
+    """
+
+    def __init__(self, max_attackers=30, max_defenders=30,
+                 limit=DEFAULT_LIMIT):
+        self.limit = max(limit, max_attackers, max_defenders)
+        self.max_attackers = -1
+        self.max_defenders = -1
+        self._win = []
+        self._attackers_left = []
+        self._defenders_left = []
+        self._build(max_attackers, max_defenders)
+
+    def _cell(self, a, d):
+        win, attackers_left, defenders_left = (
+            self._win, self._attackers_left, self._defenders_left)
+        if d == 0:
+            win[a][d] = 1.0
+            attackers_left[a][d] = float(a)
+            return
+        if a == 0:
+            defenders_left[a][d] = float(d)
+            return
+        w = survivors = defenders = 0.0
+        # A recorrência só olha estados com menos exércitos dos dois lados
+        for (attacker_losses, defender_losses), p in _round(a, d):
+            na, nd = a - attacker_losses, d - defender_losses
+            w += p * win[na][nd]
+            survivors += p * attackers_left[na][nd]
+            defenders += p * defenders_left[na][nd]
+        win[a][d] = w
+        attackers_left[a][d] = survivors
+        defenders_left[a][d] = defenders
+
+    def _build(self, max_attackers, max_defenders):
+        """Estende as tabelas com as linhas e colunas que faltam."""
+        old_attackers, old_defenders = self.max_attackers, self.max_defenders
+        max_attackers = max(max_attackers, old_attackers)
+        max_defenders = max(max_defenders, old_defenders)
+        new_columns = max_defenders - old_defenders
+        for table in (self._win, self._attackers_left, self._defenders_left):
+            for row in table:
+                row.extend([0.0] * new_columns)
+            for _ in range(max_attackers - old_attackers):
+                table.append([0.0] * (max_defenders + 1))
+        for a in range(old_attackers + 1):
+            for d in range(old_defenders + 1, max_defenders + 1):
+                self._cell(a, d)
+        for a in range(old_attackers + 1, max_attackers + 1):
+            for d in range(max_defenders + 1):
+                self._cell(a, d)
+        self.max_attackers = max_attackers
+        self.max_defenders = max_defenders
+
+    def _scaled(self, attackers, defenders):
+        """
+        (atacantes, defensores, escala) dentro do limite. Pilhas maiores são
+        divididas pela mesma escala: a chance de conquista depende sobretudo
+        da razão entre os lados, e os sobreviventes voltam multiplicados.
+        """
+        largest = max(attackers, defenders)
+        if largest <= self.limit:
+            return attackers, defenders, 1.0
+        scale = largest / self.limit
+        return (min(self.limit, max(1, round(attackers / scale)))
+                if attackers else 0,
+                min(self.limit, max(1, round(defenders / scale)))
+                if defenders else 0,
+                scale)
+
+    def _ensure(self, attackers, defenders):
+        if attackers > self.max_attackers or defenders > self.max_defenders:
+            self._build(attackers, defenders)
+
+    def conquest_probability(self, attackers, defenders):
+        """Probabilidade de o atacante eliminar todos os defensores."""
+        attackers, defenders, _ = self._scaled(attackers, defenders)
+        self._ensure(attackers, defenders)
+        return self._win[attackers][defenders]
+
+    def expected_survivors(self, attackers, defenders):
+        """Valor esperado de (atacantes, defensores) restantes ao fim da batalha."""
+        attackers, defenders, scale = self._scaled(attackers, defenders)
+        self._ensure(attackers, defenders)
+        return (self._attackers_left[attackers][defenders] * scale,
+                self._defenders_left[attackers][defenders] * scale)
+
+    def outcome_distribution(self, attackers, defenders):
+        """
+        Distribuição completa dos estados finais:
+        {(atacantes restantes, defensores restantes): probabilidade}.
+        Exata, sem limite de tamanho; custa O(atacantes x defensores).
+        """
+        return dict(_outcome_distribution(attackers, defenders))
+
+    def save(self, path):
+        """Grava as tabelas em JSON para que outros processos as carreguem."""
+        data = {
+            'version': ODDS_FORMAT_VERSION,
+            'max_attackers': self.max_attackers,
+            'max_defenders': self.max_defenders,
+            'win': self._win,
+            'attackers_left': self._attackers_left,
+            'defenders_left': self._defenders_left,
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+    @classmethod
+    def load(cls, path, limit=DEFAULT_LIMIT):
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != ODDS_FORMAT_VERSION:
+            raise ValueError(f"Versão de tabela de odds não suportada: {path}")
+        odds = cls.__new__(cls)
+        odds.max_attackers = data['max_attackers']
+        odds.max_defenders = data['max_defenders']
+        odds.limit = max(limit, odds.max_attackers, odds.max_defenders)
+        odds._win = data['win']
+        odds._attackers_left = data['attackers_left']
+        odds._defenders_left = data['defenders_left']
+        return odds
+
+    @classmethod
+    def load_or_build(cls, path, max_attackers=30, max_defenders=30):
+        """Carrega a tabela do disco ou a calcula e grava se não existir/for pequena."""
+        path = Path(path)
+        if path.exists():
+            try:
+                odds = cls.load(path)
+            except (ValueError, KeyError, json.JSONDecodeError):
+                odds = None
+            if (odds is not None and odds.max_attackers >= max_attackers
+                    and odds.max_defenders >= max_defenders):
+                return odds
+        odds = cls(max_attackers, max_defenders)
+        odds.save(path)
+        return odds
+
+
+@lru_cache(maxsize=64)
+def _outcome_distribution(attackers, defenders):
+    """
+    Propaga a probabilidade do estado inicial rodada a rodada. Toda rodada
+    tira pelo menos um exército, então os estados são visitados por total
+    de exércitos decrescente, cada um uma vez e com toda a sua massa.
+    """
+    levels = [{} for _ in range(attackers + defenders + 1)]
+    levels[-1][(attackers, defenders)] = 1.0
+    result = {}
+    for total in range(attackers + defenders, -1, -1):
+        for (a, d), p in levels[total].items():
+            if a == 0 or d == 0:
+                result[(a, d)] = result.get((a, d), 0.0) + p
+                continue
+            for (attacker_losses, defender_losses), q in _round(a, d):
+                level = levels[total - attacker_losses - defender_losses]
+                state = (a - attacker_losses, d - defender_losses)
+                level[state] = level.get(state, 0.0) + p * q
+        levels[total] = None
+    return tuple(result.items())
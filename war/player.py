@@ -1,10 +1,43 @@
+from .territory_set import TerritorySet
+from .trade import Hand, is_valid_trade
+
+
 class Player:
-    def __init__(self, name, color, mission=None):
+    def __init__(self, name, color, mission=None, bot=None):
         self.name = name
         self.color = color  # String com nome da cor
-        self.territories = []  # Lista de Territory
-        self.cards = []  # Lista de Card
+        self.territories = TerritorySet()  # Territory indexados por nome/ID
+        self.cards = Hand()  # Lista de Card com contadores por símbolo
         self.mission = mission
+        self.bot = bot  # Bot que decide as jogadas (None para humano)
+        # Índice no GameState do jogo (None enquanto não estiver em um jogo)
+        self.index = None
+        self._state = None
+
+    @property
+    def territories(self):
+        return self._territories
+
+    @territories.setter
+    def territories(self, territories):
+        if not isinstance(territories, TerritorySet):
+            territories = TerritorySet(territories)
+        self._territories = territories
+
+    @property
+    def cards(self):
+        return self._cards
+
+    @cards.setter
+    def cards(self, cards):
+        if not isinstance(cards, Hand):
+            cards = Hand(cards)
+        self._cards = cards
+
+    def bind(self, state, index):
+        """Liga o jogador ao estado compacto do jogo."""
+        self._state = state
+        self.index = index
 
     def receive_mission(self, mission):
         self.mission = mission
@@ -25,6 +58,12 @@ class Player:
 
     def owns_continent(self, continent_name, map_data):
         """Verifica se o player possui todos os territórios de um continente."""
+        if self._state is not None and self._state.topology is not None:
+            continent_id = self._state.topology.continent_index.get(
+                continent_name)
+            if continent_id is not None:
+                return self._state.controls_continent(self.index, continent_id)
+
         continent_territories = None
         for continent in map_data['continents']:
             if continent['name'] == continent_name:
@@ -34,9 +73,8 @@ class Player:
         if not continent_territories:
             return False
 
-        player_territory_names = {
-            territory.name for territory in self.territories}
-        return continent_territories.issubset(player_territory_names)
+        owned_names = self.territories.names()
+        return all(name in owned_names for name in continent_territories)
 
     def atacar(self, jogador, unidades):
         # ...lógica de ataque...
@@ -44,10 +82,10 @@ class Player:
 
     def adicionarTropas(self, territory_name, unidades):
         """Adiciona tropas ao território especificado."""
-        for territory in self.territories:
-            if territory.name == territory_name:
-                territory.troops += unidades
-                return
+        territory = self.territories.get(territory_name)
+        if territory is not None:
+            territory.troops += unidades
+            return
         raise ValueError(
             f"Territory {territory_name} not owned by player {self.name}")
 
@@ -57,5 +95,16 @@ class Player:
         pass
 
     def trocarCartasPorTropas(self, cartas):
-        # ...troca cartas por tropas...
-        pass
+        """
+        Tira da mão as três cartas de uma troca e as retorna. Os exércitos
+        dependem de quantas trocas já houve no jogo (ver Game.trade_cards).
+        """
+        cartas = list(cartas)
+        if not is_valid_trade(cartas):
+            raise ValueError("As cartas não formam uma troca válida")
+        if any(carta not in self.cards for carta in cartas):
+            raise ValueError(
+                f"O jogador {self.name} não tem todas as cartas da troca")
+        for carta in cartas:
+            self.cards.remove(carta)
+        return cartas
@@ -0,0 +1,114 @@
+from array import array
+from .events import OWNERSHIP_CHANGED
+from .state import NO_OWNER
+
+
+class RegionIndex:
+    """
+    Regiões conexas de territórios de cada jogador (union-find).
+
+    Ganhar um território só une a sua classe à dos vizinhos do mesmo dono,
+    em O(α(n)). Cada raiz guarda a lista dos membros da sua classe, juntada
+    na união (a menor entra na maior), então listar uma região custa o
+    tamanho dela. Union-find não sabe separar classes, então perder um
+    território marca o antigo dono como "sujo" e só as regiões dele são
+    refeitas, a partir dos seus territórios, na próxima consulta que
+    precisar delas.
+    """
+
+    def __init__(self, state):
+        self.state = state
+        self.topology = state.topology
+        size = len(state.owner)
+        self.parent = array('i', range(size))
+        self.members = {}  # raiz -> territórios da classe
+        self._owned = {}  # jogador -> territórios dele
+        for territory_id, owner in enumerate(state.owner):
+            if owner != NO_OWNER:
+                self._owned.setdefault(owner, set()).add(territory_id)
+        self._dirty = set(range(len(state.players)))
+        state.events.subscribe(OWNERSHIP_CHANGED, self.on_ownership_changed)
+
+    def close(self):
+        """Para de acompanhar o estado."""
+        self.state.events.unsubscribe(OWNERSHIP_CHANGED,
+                                      self.on_ownership_changed)
+
+    def find(self, territory_id):
+        parent = self.parent
+        root = territory_id
+        while parent[root] != root:
+            root = parent[root]
+        # Compressão de caminho
+        while parent[territory_id] != root:
+            parent[territory_id], territory_id = root, parent[territory_id]
+        return root
+
+    def union(self, a, b):
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return
+        # União por tamanho: a classe menor passa a apontar para a maior
+        members = self.members
+        if len(members[root_a]) < len(members[root_b]):
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        members[root_a].extend(members.pop(root_b))
+
+    def _reset(self, territory_id):
+        self.parent[territory_id] = territory_id
+        self.members[territory_id] = [territory_id]
+
+    def _join_neighbors(self, territory_id, player_index):
+        owner = self.state.owner
+        for neighbor in self.topology.neighbors_of(territory_id):
+            if owner[neighbor] == player_index:
+                self.union(territory_id, neighbor)
+
+    def _rebuild(self, player_index):
+        owned = self._owned.get(player_index, ())
+        for territory_id in owned:
+            self._reset(territory_id)
+        for territory_id in owned:
+            self._join_neighbors(territory_id, player_index)
+        self._dirty.discard(player_index)
+
+    def _ensure(self, player_index):
+        if player_index in self._dirty:
+            self._rebuild(player_index)
+
+    def on_ownership_changed(self, territory_id, old_index, new_index):
+        # Só territórios do antigo dono podem apontar para este
+        self.members.pop(territory_id, None)
+        self.parent[territory_id] = territory_id
+        if old_index != NO_OWNER:
+            self._owned[old_index].discard(territory_id)
+            self._dirty.add(old_index)
+        if new_index != NO_OWNER:
+            self._owned.setdefault(new_index, set()).add(territory_id)
+            self._reset(territory_id)
+            if new_index not in self._dirty:
+                self._join_neighbors(territory_id, new_index)
+
+    def connected(self, a, b):
+        """a e b são do mesmo dono e ligados por territórios dele?"""
+        player_index = self.state.owner[a]
+        if player_index == NO_OWNER or self.state.owner[b] != player_index:
+            return False
+        self._ensure(player_index)
+        return self.find(a) == self.find(b)
+
+    def region_of(self, territory_id):
+        """Territórios da região conexa de `territory_id` (ele incluído)."""
+        player_index = self.state.owner[territory_id]
+        if player_index == NO_OWNER:
+            return [territory_id]
+        self._ensure(player_index)
+        return sorted(self.members[self.find(territory_id)])
+
+    def regions(self, player_index):
+        """Lista das regiões conexas do jogador."""
+        self._ensure(player_index)
+        roots = {self.find(t): None
+                 for t in sorted(self._owned.get(player_index, ()))}
+        return [sorted(self.members[root]) for root in roots]
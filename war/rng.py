@@ -0,0 +1,38 @@
+import random
+from .dice import _FACES
+
+
+class GameRandom(random.Random):
+    """
+    Gerador aleatório de um jogo.
+
+    Cada `Game` tem o seu, então jogos em paralelo não disputam o estado
+    global de `random` e podem ser reproduzidos a partir da semente.
+    """
+
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+        self.initial_seed = seed
+        super().__init__(seed)
+
+    def dice(self, quantity):
+        """Sorteia `quantity` dados de 6 lados com uma única chamada."""
+        return self.choices(_FACES, k=quantity)
+
+    def permutation(self, size):
+        """Retorna uma permutação aleatória de range(size)."""
+        order = list(range(size))
+        self.shuffle(order)
+        return order
+
+    def snapshot(self):
+        """Captura o estado interno (para replay ou busca)."""
+        return self.getstate()
+
+    def restore(self, snapshot):
+        self.setstate(snapshot)
+
+    def fork(self):
+        """Novo gerador independente, derivado deste de forma determinística."""
+        return GameRandom(self.getrandbits(64))
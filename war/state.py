@@ -0,0 +1,262 @@
+from array import array
+from .events import EventBus, OWNERSHIP_CHANGED, TROOPS_CHANGED
+
+# Valor usado no array de donos para territórios sem dono
+NO_OWNER = -1
+
+
+class GameState:
+    """
+    Estado mutável do tabuleiro em arrays compactos (structure-of-arrays).
+
+    Cada território é identificado por um ID inteiro (sua posição no
+    map.json). Dono, tropas e continente ficam em arrays indexados por esse
+    ID; `Territory` e `Player` são apenas visões sobre eles.
+    """
+
+    def __init__(self, territory_count, continent_ids=None, players=None,
+                 topology=None):
+        self.owner = array('h', [NO_OWNER]) * territory_count
+        self.troops = array('i', [0]) * territory_count
+        if continent_ids is None:
+            continent_ids = [0] * territory_count
+        self.continent = array('h', continent_ids)
+        self.topology = topology  # MapTopology compartilhada (imutável)
+        self.events = EventBus()
+
+        # Contadores de controle de continente, atualizados a cada troca de
+        # dono: continent_owned[jogador][continente] e o controlador atual
+        continent_count = max(self.continent, default=-1) + 1
+        if topology is not None:
+            continent_count = max(continent_count,
+                                  len(topology.continent_names))
+        self.continent_size = array('i', [0]) * continent_count
+        for continent in self.continent:
+            self.continent_size[continent] += 1
+        self.continent_owned = []
+        self.owned_count = array('i')  # territórios por jogador
+        self.controller = array('h', [NO_OWNER]) * continent_count
+
+        # Diário de desfazer: (é_dono, território, valor antigo) por escrita,
+        # só enquanto houver uma marca aberta (ver mark/undo)
+        self.journal = None
+
+        # Hash de Zobrist do tabuleiro, mantido a cada escrita depois de
+        # enable_hashing (ver war.zobrist)
+        self.zobrist = None
+        self.hash = 0
+
+        self.players = []
+        self._player_index = {}
+        for player in players or []:
+            self.add_player(player)
+
+    def __len__(self):
+        return len(self.owner)
+
+    def add_player(self, player):
+        """Registra um jogador no estado e retorna seu índice."""
+        index = self._player_index.get(player)
+        if index is None:
+            index = len(self.players)
+            if self.zobrist is not None and index >= self.zobrist.max_players:
+                raise ValueError(
+                    f"Hash de posições suporta até {self.zobrist.max_players} jogadores")
+            self.players.append(player)
+            self._player_index[player] = index
+            self.continent_owned.append(
+                array('i', [0]) * len(self.continent_size))
+            self.owned_count.append(0)
+            if hasattr(player, 'bind'):
+                player.bind(self, index)
+        return index
+
+    def enable_hashing(self, keys):
+        """Passa a manter `hash` com as chaves de Zobrist dadas."""
+        if len(self.players) > keys.max_players:
+            raise ValueError(
+                f"Hash de posições suporta até {keys.max_players} jogadores")
+        self.zobrist = keys
+        self.hash = keys.board_hash(self.owner, self.troops)
+
+    def player_index(self, player):
+        """Retorna o índice do jogador (NO_OWNER para None)."""
+        if player is None:
+            return NO_OWNER
+        index = self._player_index.get(player)
+        if index is None:
+            index = self.add_player(player)
+        return index
+
+    def player_at(self, index):
+        """Retorna o jogador de um índice (None para NO_OWNER)."""
+        return None if index == NO_OWNER else self.players[index]
+
+    def set_owner(self, territory_id, player_index):
+        old_index = self.owner[territory_id]
+        if old_index == player_index:
+            return
+        if self.journal is not None:
+            self.journal.append((True, territory_id, old_index))
+        self.owner[territory_id] = player_index
+        if self.zobrist is not None:
+            self.hash ^= (self.zobrist.owner_key(territory_id, old_index)
+                          ^ self.zobrist.owner_key(territory_id, player_index))
+
+        continent = self.continent[territory_id]
+        if old_index != NO_OWNER:
+            owned = self.continent_owned[old_index]
+            if owned[continent] == self.continent_size[continent]:
+                self.controller[continent] = NO_OWNER
+            owned[continent] -= 1
+            self.owned_count[old_index] -= 1
+        if player_index != NO_OWNER:
+            self.owned_count[player_index] += 1
+            owned = self.continent_owned[player_index]
+            owned[continent] += 1
+            if owned[continent] == self.continent_size[continent]:
+                self.controller[continent] = player_index
+
+        if self.events.ownership_changed:
+            self.events.emit(OWNERSHIP_CHANGED, territory_id,
+                             old_index, player_index)
+
+    def set_troops(self, territory_id, troops):
+        if self.journal is not None:
+            self.journal.append((False, territory_id,
+                                 self.troops[territory_id]))
+        if self.zobrist is not None:
+            self.hash ^= (
+                self.zobrist.troop_key(territory_id, self.troops[territory_id])
+                ^ self.zobrist.troop_key(territory_id, troops))
+        if self.events.troops_changed:
+            old_troops = self.troops[territory_id]
+            self.troops[territory_id] = troops
+            self.events.emit(TROOPS_CHANGED, territory_id, old_troops, troops)
+        else:
+            self.troops[territory_id] = troops
+
+    def controls_continent(self, player_index, continent_id):
+        """O(1): o jogador possui todos os territórios do continente?"""
+        return self.controller[continent_id] == player_index
+
+    def continent_controllers(self):
+        """Índice do controlador de cada continente (NO_OWNER se nenhum)."""
+        return self.controller
+
+    def territory_counts(self):
+        """Quantidade de territórios de cada jogador."""
+        return list(self.owned_count)
+
+    def troop_totals(self):
+        """Total de tropas de cada jogador, em uma passada."""
+        totals = [0] * len(self.players)
+        for owner, troops in zip(self.owner, self.troops):
+            if owner != NO_OWNER:
+                totals[owner] += troops
+        return totals
+
+    def mark(self):
+        """
+        Liga o diário de desfazer e retorna uma marca para `undo`. Cada
+        escrita por set_owner/set_troops custa uma entrada no diário, então
+        fazer e desfazer uma jogada é O(territórios alterados).
+        """
+        if self.journal is None:
+            self.journal = []
+        return len(self.journal)
+
+    def undo(self, mark=0):
+        """
+        Desfaz as escritas feitas depois da marca (os eventos são emitidos
+        de novo, então contadores e inscritos voltam junto). Desfazer até a
+        marca 0 desliga o diário.
+        """
+        journal = self.journal
+        if journal is None:
+            return
+        self.journal = None  # as reversões não entram no diário
+        while len(journal) > mark:
+            is_owner, territory_id, value = journal.pop()
+            if is_owner:
+                self.set_owner(territory_id, value)
+            else:
+                self.set_troops(territory_id, value)
+        self.journal = journal if mark else None
+
+    def snapshot(self):
+        """Cópia de dono e tropas; o resto do estado é derivado deles."""
+        return array('h', self.owner), array('i', self.troops)
+
+    def restore(self, snapshot):
+        """
+        Volta ao snapshot escrevendo só os territórios que mudaram, pelos
+        mesmos caminhos de set_owner/set_troops (contadores e eventos).
+        """
+        owners, troops = snapshot
+        current_owner, current_troops = self.owner, self.troops
+        for territory_id, owner in enumerate(owners):
+            if current_owner[territory_id] != owner:
+                self.set_owner(territory_id, owner)
+        for territory_id, value in enumerate(troops):
+            if current_troops[territory_id] != value:
+                self.set_troops(territory_id, value)
+
+    def load(self, owners, troops):
+        """
+        Carrega um tabuleiro inteiro e recalcula contadores, controladores e
+        hash em uma passada, sem eventos. Feito para montar jogos novos;
+        com inscritos ou diário aberto, cai no caminho de `restore`.
+        """
+        if (self.journal is not None or self.events.ownership_changed
+                or self.events.troops_changed):
+            self.restore((owners, troops))
+            return
+        self.owner[:] = array('h', owners)
+        self.troops[:] = array('i', troops)
+        for player_index in range(len(self.players)):
+            self.owned_count[player_index] = 0
+            self.continent_owned[player_index] = (
+                array('i', [0]) * len(self.continent_size))
+        for territory_id, owner in enumerate(self.owner):
+            if owner != NO_OWNER:
+                self.owned_count[owner] += 1
+                self.continent_owned[owner][self.continent[territory_id]] += 1
+        for continent, size in enumerate(self.continent_size):
+            self.controller[continent] = NO_OWNER
+            for player_index, owned in enumerate(self.continent_owned):
+                if size and owned[continent] == size:
+                    self.controller[continent] = player_index
+        if self.zobrist is not None:
+            self.hash = self.zobrist.board_hash(self.owner, self.troops)
+
+    def copy(self, players=None):
+        """
+        Cópia barata dos arrays mutáveis (sem as visões). Com `players`, a
+        cópia passa a usar esses jogadores, na mesma ordem, ligados a ela.
+        """
+        clone = GameState.__new__(GameState)
+        clone.owner = array('h', self.owner)
+        clone.troops = array('i', self.troops)
+        clone.continent = self.continent  # imutável durante o jogo
+        clone.topology = self.topology
+        clone.events = EventBus()  # inscritos não são copiados
+        clone.continent_size = self.continent_size
+        clone.continent_owned = [array('i', owned)
+                                 for owned in self.continent_owned]
+        clone.owned_count = array('i', self.owned_count)
+        clone.controller = array('h', self.controller)
+        clone.journal = None
+        clone.zobrist = self.zobrist
+        clone.hash = self.hash
+        if players is None:
+            clone.players = list(self.players)
+            clone._player_index = dict(self._player_index)
+        else:
+            clone.players = list(players)
+            clone._player_index = {}
+            for index, player in enumerate(clone.players):
+                clone._player_index[player] = index
+                if hasattr(player, 'bind'):
+                    player.bind(clone, index)
+        return clone
@@ -3,13 +3,70 @@ class Territory:
     def __init__(self, name, continent, borders=None):
         self.name = name
         self.continent = continent
-        self.owner = None  # Player que possui o território
-        self.troops = 0
         self.borders = borders or []  # Lista de territórios vizinhos
+        # Sem estado ligado, dono e tropas ficam no próprio objeto
+        self.id = None
+        self._state = None
+        self._owner = None  # Player que possui o território
+        self._troops = 0
 
     def __repr__(self):
         return f"<Territory {self.name} ({self.continent})>"
 
+    def bind(self, state, territory_id):
+        """Passa a ler e escrever dono e tropas nos arrays do GameState."""
+        owner, troops = self._owner, self._troops
+        self.id = territory_id
+        self._state = state
+        state.set_owner(territory_id, state.player_index(owner))
+        state.set_troops(territory_id, troops)
+
+    def bound_copy(self, state):
+        """Nova visão deste território sobre outro GameState, sem escrever nele."""
+        clone = Territory(self.name, self.continent, self.borders)
+        clone.id = self.id
+        clone._state = state
+        return clone
+
+    @property
+    def owner(self):
+        if self._state is None:
+            return self._owner
+        return self._state.player_at(self._state.owner[self.id])
+
+    @owner.setter
+    def owner(self, player):
+        if self._state is None:
+            self._owner = player
+        else:
+            self._state.set_owner(self.id, self._state.player_index(player))
+
+    @property
+    def troops(self):
+        if self._state is None:
+            return self._troops
+        return self._state.troops[self.id]
+
+    @troops.setter
+    def troops(self, value):
+        if self._state is None:
+            self._troops = value
+        else:
+            self._state.set_troops(self.id, value)
+
     def is_border_with(self, territory_name):
         """Verifica se este território faz fronteira com outro."""
+        topology = self._state.topology if self._state is not None else None
+        if topology is not None:
+            other = topology.id_of(territory_name)
+            if other is not None:
+                return topology.are_adjacent(self.id, other)
         return territory_name in self.borders
+
+    def is_adjacent_to(self, other):
+        """Verifica adjacência com outro Territory (O(1) no mesmo jogo)."""
+        state = self._state
+        if (state is not None and state.topology is not None
+                and other._state is state):
+            return state.topology.are_adjacent(self.id, other.id)
+        return other.name in self.borders
@@ -0,0 +1,89 @@
+from itertools import islice
+
+
+class TerritorySet:
+    """
+    Coleção indexada dos territórios de um jogador.
+
+    Mantém a mesma API de lista usada pela GUI e pelos testes (append,
+    remove, índices, iteração), mas com inserção, remoção e busca por nome
+    ou ID em O(1). A iteração segue a ordem de inserção.
+    """
+
+    def __init__(self, territories=None):
+        self._by_name = {}
+        self._by_id = {}
+        if territories is not None:
+            self.extend(territories)
+
+    def __len__(self):
+        return len(self._by_name)
+
+    def __iter__(self):
+        return iter(self._by_name.values())
+
+    def __contains__(self, territory):
+        return self._by_name.get(territory.name) is territory
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._by_name.values())[index]
+        size = len(self._by_name)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("TerritorySet index out of range")
+        if index == size - 1:
+            return next(reversed(self._by_name.values()))
+        return next(islice(self._by_name.values(), index, None))
+
+    def __eq__(self, other):
+        if isinstance(other, TerritorySet):
+            return list(self) == list(other)
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"TerritorySet({list(self)!r})"
+
+    def add(self, territory):
+        """Adiciona o território (sem efeito se já estiver presente)."""
+        self._by_name[territory.name] = territory
+        if territory.id is not None:
+            self._by_id[territory.id] = territory
+
+    append = add
+
+    def extend(self, territories):
+        for territory in territories:
+            self.add(territory)
+
+    def discard(self, territory):
+        """Remove o território se ele estiver presente."""
+        if self._by_name.get(territory.name) is territory:
+            del self._by_name[territory.name]
+            self._by_id.pop(territory.id, None)
+
+    def remove(self, territory):
+        if territory not in self:
+            raise ValueError(f"{territory!r} not in TerritorySet")
+        self.discard(territory)
+
+    def clear(self):
+        self._by_name.clear()
+        self._by_id.clear()
+
+    def get(self, name, default=None):
+        """Busca O(1) pelo nome do território."""
+        return self._by_name.get(name, default)
+
+    def get_by_id(self, territory_id, default=None):
+        """Busca O(1) pelo ID do território no GameState."""
+        return self._by_id.get(territory_id, default)
+
+    def names(self):
+        return self._by_name.keys()
+
+    def copy(self):
+        return TerritorySet(self)
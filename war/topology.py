@@ -0,0 +1,114 @@
+from array import array
+
+
+class MapTopology:
+    """
+    Topologia compilada de um mapa (imutável).
+
+    Territórios recebem IDs inteiros na ordem do map.json. As fronteiras
+    ficam em arrays no formato CSR (`offsets`/`neighbors`) e em um frozenset
+    de vizinhos por território: o teste de adjacência é O(1) e a memória
+    cresce com o número de fronteiras, não com n².
+    """
+
+    def __init__(self, names, continents, borders, continent_order=()):
+        """
+        names: nomes dos territórios, na ordem dos IDs.
+        continents: nome do continente de cada território.
+        borders: lista de nomes vizinhos de cada território. Nomes que não
+            existem no mapa são ignorados.
+        continent_order: ordem preferida dos IDs de continente.
+        """
+        self.names = tuple(names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+
+        continent_names = list(continent_order)
+        for continent in continents:
+            if continent not in continent_names:
+                continent_names.append(continent)
+        self.continent_names = tuple(continent_names)
+        continent_index = {name: i for i, name in enumerate(continent_names)}
+        self.continent_index = continent_index
+        self.continent_of = array('h', [continent_index[c] for c in continents])
+
+        self.offsets = array('i', [0])
+        self.neighbors = array('i')
+        self._neighbor_sets = []
+        self._neighbor_tuples = []
+        for territory_borders in borders:
+            ids = []
+            seen = set()
+            for name in territory_borders:
+                neighbor = self.index.get(name)
+                if neighbor is not None and neighbor not in seen:
+                    ids.append(neighbor)
+                    seen.add(neighbor)
+            self.neighbors.extend(ids)
+            self.offsets.append(len(self.neighbors))
+            self._neighbor_sets.append(frozenset(ids))
+            self._neighbor_tuples.append(tuple(ids))
+
+    @classmethod
+    def from_map_data(cls, map_data):
+        """Compila a topologia a partir do dicionário do map.json."""
+        territories = map_data['territories']
+        return cls(
+            [t['name'] for t in territories],
+            [t['continent'] for t in territories],
+            [t.get('borders', []) for t in territories],
+            [c['name'] for c in map_data.get('continents', [])])
+
+    @classmethod
+    def from_csr(cls, names, continent_names, continent_of, offsets,
+                 neighbors):
+        """
+        Monta a topologia a partir de arrays já compilados (ver war.mapfile),
+        sem resolver nomes de fronteiras. Os arrays passam a ser da topologia.
+        """
+        topology = cls.__new__(cls)
+        topology.names = tuple(names)
+        topology.index = {name: i for i, name in enumerate(topology.names)}
+        topology.continent_names = tuple(continent_names)
+        topology.continent_index = {name: i for i, name
+                                    in enumerate(topology.continent_names)}
+        topology.continent_of = continent_of
+        topology.offsets = offsets
+        topology.neighbors = neighbors
+        topology._neighbor_tuples = [
+            tuple(neighbors[offsets[t]:offsets[t + 1]])
+            for t in range(len(topology.names))]
+        topology._neighbor_sets = [
+            frozenset(ids) for ids in topology._neighbor_tuples]
+        return topology
+
+    def __len__(self):
+        return len(self.names)
+
+    def id_of(self, name):
+        """Retorna o ID de um território pelo nome (None se não existir)."""
+        return self.index.get(name)
+
+    def name_of(self, territory_id):
+        return self.names[territory_id]
+
+    def neighbors_of(self, territory_id):
+        """Tupla com os IDs dos vizinhos do território."""
+        return self._neighbor_tuples[territory_id]
+
+    def degree(self, territory_id):
+        return self.offsets[territory_id + 1] - self.offsets[territory_id]
+
+    def are_adjacent(self, a, b):
+        """Teste de adjacência O(1) entre dois IDs."""
+        return b in self._neighbor_sets[a]
+
+    def are_adjacent_by_name(self, name_a, name_b):
+        a = self.index.get(name_a)
+        b = self.index.get(name_b)
+        if a is None or b is None:
+            return False
+        return self.are_adjacent(a, b)
+
+    def territories_in_continent(self, continent_id):
+        """IDs dos territórios de um continente."""
+        return [t for t, c in enumerate(self.continent_of) if c == continent_id]
@@ -0,0 +1,185 @@
+"""
+Torneio de estratégias: várias partidas headless, com sementes fixas,
+distribuídas em um pool de processos.
+
+Uso: python -m war.tournament --games 1000 --processes 8
+"""
+import argparse
+import math
+import multiprocessing
+import os
+from .bots import Bot, BOTS
+from .enums import COLORS
+from .game import Game, GameTemplate
+from .mcts import MCTSBot
+from .player import Player
+from .rng import GameRandom
+from .utils_data import preload
+
+# Estratégias disponíveis pela linha de comando: nome -> classe de Bot ou
+# fábrica `fabrica(nome, cor)` que devolve um Player
+STRATEGIES = {
+    'passivo': Player,
+    **BOTS,
+    MCTSBot.name: MCTSBot,
+}
+
+
+def make_player(strategy, name, color):
+    """Cria o jogador de um assento a partir de uma estratégia."""
+    if isinstance(strategy, type) and issubclass(strategy, Bot):
+        return Player(name, color, bot=strategy())
+    return strategy(name, color)
+
+
+def game_seed(base_seed, game_id):
+    """Semente de uma partida, derivada da semente do torneio."""
+    return (base_seed * 1_000_003 + game_id) & 0xFFFFFFFFFFFFFFFF
+
+
+def seat_order(strategy_names, game_id):
+    """Rotaciona os assentos para cada estratégia jogar em todas as posições."""
+    shift = game_id % len(strategy_names)
+    return strategy_names[shift:] + strategy_names[:shift]
+
+
+def play_tournament_game(task):
+    """Joga uma partida do torneio (executada nos processos do pool)."""
+    game_id, seed, seats, strategies, max_turns = task
+    players = [make_player(strategies[name], f"{name}#{seat}",
+                           COLORS[seat % len(COLORS)])
+               for seat, name in enumerate(seats)]
+    # O entregador é sorteado pela semente da partida; o primeiro a jogar é
+    # o seguinte a ele, como em Game.get_first_player_after_dealer
+    rng = GameRandom(seed)
+    dealer_seat = rng.randrange(len(players))
+    game = Game(players, players[dealer_seat], rng=rng, headless=True)
+    result = game.play_game(max_turns=max_turns)
+
+    winner_seat = None
+    if result['winner'] is not None:
+        winner_seat = players.index(result['winner'])
+    return {
+        'game_id': game_id,
+        'seed': seed,
+        'seats': seats,
+        'dealer_seat': dealer_seat,
+        'winner_seat': winner_seat,
+        'winner': seats[winner_seat] if winner_seat is not None else None,
+        'turns': result['turns'],
+        'finished': result['finished'],
+    }
+
+
+def wilson_interval(wins, games, z=1.96):
+    """Intervalo de confiança de Wilson para a taxa de vitórias."""
+    if games == 0:
+        return 0.0, 0.0
+    p = wins / games
+    denominator = 1 + z * z / games
+    center = (p + z * z / (2 * games)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / games
+                           + z * z / (4 * games * games)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+class TournamentStats:
+    """Agrega resultados de partidas em taxas de vitória por estratégia."""
+
+    def __init__(self, strategy_names):
+        self.games = 0
+        self.draws = 0
+        self.turns = 0
+        self.played = {name: 0 for name in strategy_names}
+        self.wins = {name: 0 for name in strategy_names}
+
+    def add(self, result):
+        self.games += 1
+        self.turns += result['turns']
+        for name in result['seats']:
+            self.played[name] += 1
+        if result['winner'] is None:
+            self.draws += 1
+        else:
+            self.wins[result['winner']] += 1
+
+    def win_rates(self, z=1.96):
+        """{estratégia: (taxa, limite inferior, limite superior)}."""
+        rates = {}
+        for name, played in self.played.items():
+            wins = self.wins[name]
+            low, high = wilson_interval(wins, played, z)
+            rates[name] = (wins / played if played else 0.0, low, high)
+        return rates
+
+
+def iter_tournament(strategies, games, processes=None, seed=0,
+                    max_turns=500):
+    """
+    Gera os resultados das partidas à medida que terminam.
+
+    strategies: {nome: classe de Bot ou fábrica(nome, cor) -> Player}; as
+        fábricas precisam ser "picklable" (classes ou funções de módulo).
+    """
+    names = list(strategies)
+    tasks = ((game_id, game_seed(seed, game_id), seat_order(names, game_id),
+              strategies, max_turns) for game_id in range(games))
+
+    processes = processes or os.cpu_count() or 1
+    if processes == 1:
+        for task in tasks:
+            yield play_tournament_game(task)
+        return
+
+    # fork evita recarregar os módulos em cada processo no Linux; com os
+    # dados e o molde de jogo já no cache, os filhos não refazem nada disso
+    preload()
+    GameTemplate.default()
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context(
+        'fork' if 'fork' in methods else None)
+    chunksize = max(1, games // (processes * 8))
+    with context.Pool(processes) as pool:
+        yield from pool.imap_unordered(play_tournament_game, tasks, chunksize)
+
+
+def run_tournament(strategies, games, processes=None, seed=0, max_turns=500,
+                   on_result=None):
+    """Joga o torneio inteiro e retorna o TournamentStats agregado."""
+    stats = TournamentStats(list(strategies))
+    for result in iter_tournament(strategies, games, processes, seed,
+                                  max_turns):
+        stats.add(result)
+        if on_result is not None:
+            on_result(result)
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Torneio de estratégias do War")
+    parser.add_argument('--games', type=int, default=100)
+    parser.add_argument('--processes', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--max-turns', type=int, default=500)
+    parser.add_argument('strategies', nargs='*',
+                        help=f"estratégias ({', '.join(STRATEGIES)})")
+    args = parser.parse_args(argv)
+
+    names = args.strategies or list(BOTS)
+    strategies = {}
+    for seat, name in enumerate(names):
+        if name not in STRATEGIES:
+            parser.error(f"estratégia desconhecida: {name}")
+        # Nomes repetidos viram estratégias distintas (ex.: passivo#1)
+        strategies[name if name not in strategies else f"{name}#{seat}"] = \
+            STRATEGIES[name]
+
+    stats = run_tournament(strategies, args.games, args.processes, args.seed,
+                           args.max_turns)
+    print(f"Partidas: {stats.games}  Empates: {stats.draws}")
+    for name, (rate, low, high) in stats.win_rates().items():
+        print(f"{name:>16}: {rate:6.1%}  (IC95% {low:6.1%} - {high:6.1%})")
+
+
+if __name__ == '__main__':
+    main()
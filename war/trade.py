@@ -0,0 +1,172 @@
+"""
+Regras de troca de cartas por exércitos.
+
+Uma troca usa três cartas: três do mesmo símbolo ou três símbolos
+diferentes, com o coringa valendo qualquer símbolo. A troca rende um bônus
+que cresce a cada troca feita no jogo (4, 6, 8, 10, 12, 15 e depois de 5 em
+5) e cada carta de um território do próprio jogador põe mais 2 exércitos
+nesse território.
+"""
+
+JOKER = 'coringa'
+TRADE_SIZE = 3
+# Mão cheia: com esse número de cartas a troca é obrigatória
+MAX_HAND = 5
+TRADE_BONUSES = (4, 6, 8, 10, 12, 15)
+TRADE_BONUS_STEP = 5
+OWNED_TERRITORY_BONUS = 2
+
+
+def trade_bonus(trade_number):
+    """Exércitos da troca de número `trade_number` (0 para a primeira)."""
+    if trade_number < len(TRADE_BONUSES):
+        return TRADE_BONUSES[trade_number]
+    return (TRADE_BONUSES[-1]
+            + TRADE_BONUS_STEP * (trade_number - len(TRADE_BONUSES) + 1))
+
+
+def is_valid_trade(cards):
+    """As cartas formam uma troca: três iguais ou três diferentes?"""
+    if len(cards) != TRADE_SIZE or len({id(card) for card in cards}) != TRADE_SIZE:
+        return False
+    symbols = [card.symbol for card in cards if card.symbol != JOKER]
+    distinct = len(set(symbols))
+    return distinct <= 1 or distinct == len(symbols)
+
+
+class Hand(list):
+    """
+    Mão de cartas de um jogador.
+
+    É uma lista comum (append, remove, fatias, comparação), mas mantém as
+    cartas agrupadas por símbolo a cada alteração, então `can_trade` e
+    `best_trade` olham só os contadores dos símbolos, sem testar as
+    combinações de três cartas da mão.
+    """
+
+    def __init__(self, cards=()):
+        super().__init__(cards)
+        self._recount()
+
+    def __reduce__(self):
+        # copy/pickle padrão de subclasses de list repõe o __dict__ e depois
+        # chama extend, o que duplicaria os grupos
+        return type(self), (list(self),)
+
+    def _recount(self):
+        self._by_symbol = {}
+        for card in self:
+            self._add(card)
+
+    def _add(self, card):
+        bucket = self._by_symbol.get(card.symbol)
+        if bucket is None:
+            self._by_symbol[card.symbol] = [card]
+        else:
+            bucket.append(card)
+
+    def _discard(self, card):
+        bucket = self._by_symbol[card.symbol]
+        bucket.remove(card)
+        if not bucket:
+            del self._by_symbol[card.symbol]
+
+    def append(self, card):
+        super().append(card)
+        self._add(card)
+
+    def insert(self, index, card):
+        super().insert(index, card)
+        self._add(card)
+
+    def extend(self, cards):
+        cards = list(cards)
+        super().extend(cards)
+        for card in cards:
+            self._add(card)
+
+    def __iadd__(self, cards):
+        self.extend(cards)
+        return self
+
+    def remove(self, card):
+        super().remove(card)
+        self._discard(card)
+
+    def pop(self, index=-1):
+        card = super().pop(index)
+        self._discard(card)
+        return card
+
+    def clear(self):
+        super().clear()
+        self._by_symbol = {}
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._recount()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._recount()
+
+    def __imul__(self, times):
+        super().__imul__(times)
+        self._recount()
+        return self
+
+    def symbol_count(self, symbol):
+        """Quantas cartas da mão têm o símbolo."""
+        bucket = self._by_symbol.get(symbol)
+        return len(bucket) if bucket is not None else 0
+
+    @property
+    def jokers(self):
+        return self.symbol_count(JOKER)
+
+    def _symbol_counts(self):
+        return [len(bucket) for symbol, bucket in self._by_symbol.items()
+                if symbol != JOKER]
+
+    def can_trade(self):
+        """A mão tem alguma troca válida?"""
+        jokers = self.jokers
+        counts = self._symbol_counts()
+        return (len(counts) + jokers >= TRADE_SIZE
+                or max(counts, default=0) + jokers >= TRADE_SIZE)
+
+    def best_trade(self, owned=None):
+        """
+        Melhor troca da mão, ou None se não houver. Gasta o mínimo de
+        coringas e, entre as trocas que empatam, prefere cartas de
+        territórios do jogador (`owned(card)` diz se o território é dele).
+        """
+        if not self.can_trade():
+            return None
+        if owned is None:
+            def owned(card):
+                return False
+
+        def pick(bucket, count):
+            return sorted(bucket, key=lambda card: not owned(card))[:count]
+
+        jokers = self._by_symbol.get(JOKER, [])
+        buckets = [bucket for symbol, bucket in self._by_symbol.items()
+                   if symbol != JOKER]
+        options = []
+        # Três do mesmo símbolo (completados com coringas)
+        for bucket in buckets:
+            taken = pick(bucket, TRADE_SIZE)
+            missing = TRADE_SIZE - len(taken)
+            if missing <= len(jokers):
+                options.append(taken + jokers[:missing])
+        # Três símbolos diferentes: primeiro os que têm carta do jogador
+        different = sorted(buckets, key=lambda bucket: not any(
+            owned(card) for card in bucket))[:TRADE_SIZE]
+        missing = TRADE_SIZE - len(different)
+        if missing <= len(jokers):
+            options.append([pick(bucket, 1)[0] for bucket in different]
+                           + jokers[:missing])
+        return min(options, key=lambda cards: (
+            sum(card.symbol == JOKER for card in cards),
+            -sum(owned(card) for card in cards)))
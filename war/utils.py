@@ -1,14 +1,24 @@
-import random
+from .dice import DiceSource
 
+# Fonte de dados compartilhada pelas funções abaixo
+_dice = DiceSource()
 
-def roll_die():
+
+def roll_die(rng=None):
     """Rola um dado de 6 lados e retorna o resultado."""
-    return random.randint(1, 6)
+    if rng is not None:
+        return rng.randint(1, 6)
+    return _dice.roll_one()
 
 
-def roll_multiple_dice(quantity):
-    """Rola vários dados de 6 lados e retorna uma lista com os resultados."""
-    return [roll_die() for _ in range(quantity)]
+def roll_multiple_dice(quantity, rng=None):
+    """
+    Rola vários dados de 6 lados e retorna uma lista com os resultados.
+    Com `rng` (um GameRandom), os dados saem em lote de `rng.dice`.
+    """
+    if rng is not None:
+        return rng.dice(max(quantity, 0))
+    return _dice.roll(quantity)
 
 
 # Utilidades relacionadas aos continentes
@@ -29,18 +39,7 @@ def get_continent_bonus(continent_name):
 
 def player_owns_continent(player, continent_name, map_data):
     """Verifica se o player possui todos os territórios de um continente."""
-    continent_territories = None
-    for continent in map_data['continents']:
-        if continent['name'] == continent_name:
-            continent_territories = set(continent['territories'])
-            break
-
-    if not continent_territories:
-        return False
-
-    player_territory_names = {
-        territory.name for territory in player.territories}
-    return continent_territories.issubset(player_territory_names)
+    return player.owns_continent(continent_name, map_data)
 
 
 def get_continent_controller(continent_name, map_data, all_players):
@@ -1,12 +1,95 @@
 import json
+import os
 from pathlib import Path
+from .frozen import FrozenDict, FrozenList, freeze  # noqa: F401 (reexportados)
+from .mapfile import CompiledMap, load_or_compile
+
+DATA_DIR = Path(__file__).parent.parent / 'data'
+MAP_PATH = DATA_DIR / 'map.json'
+MISSIONS_PATH = DATA_DIR / 'missions.json'
+# Mapa compilado (python -m war.mapfile); refeito sozinho se o map.json mudar
+MAP_BINARY_PATH = DATA_DIR / 'map.bin'
+
+
+# Cache do processo: caminho -> (mtime_ns, tamanho, dados congelados)
+_cache = {}
+
+
+def load_json(path):
+    """
+    Lê um JSON uma vez por processo e devolve a estrutura congelada,
+    compartilhada por todos os chamadores. O arquivo é lido de novo só se o
+    mtime ou o tamanho mudarem.
+    """
+    path = str(path)
+    stat = os.stat(path)
+    cached = _cache.get(path)
+    if (cached is not None and cached[0] == stat.st_mtime_ns
+            and cached[1] == stat.st_size):
+        return cached[2]
+    with open(path, encoding='utf-8') as f:
+        data = freeze(json.load(f))
+    _cache[path] = (stat.st_mtime_ns, stat.st_size, data)
+    return data
 
 
 def load_map_data():
-    with open(Path(__file__).parent.parent / 'data' / 'map.json', encoding='utf-8') as f:
-        return json.load(f)
+    return load_json(MAP_PATH)
 
 
 def load_missions():
-    with open(Path(__file__).parent.parent / 'data' / 'missions.json', encoding='utf-8') as f:
-        return json.load(f)
+    return load_json(MISSIONS_PATH)
+
+
+_compiled_maps = {}
+# Último mapa fora do padrão compilado em memória: (map_data, mapa)
+_adhoc_map = None
+
+
+def load_compiled_map():
+    """Mapa compilado do processo, lido de data/map.bin."""
+    stat = os.stat(MAP_PATH)
+    compiled = _compiled_maps.get(MAP_PATH)
+    if (compiled is None
+            or compiled.source_stamp != (stat.st_mtime_ns, stat.st_size)):
+        compiled = load_or_compile(MAP_PATH, MAP_BINARY_PATH)
+        _compiled_maps[MAP_PATH] = compiled
+    return compiled
+
+
+def compiled_map(map_data):
+    """
+    Mapa compilado correspondente a `map_data`: o artefato do mapa padrão
+    ou, para outro dicionário, uma compilação em memória (validada, como a
+    do artefato; ValueError se o mapa for inválido), reaproveitada enquanto
+    o mesmo objeto for passado.
+    """
+    global _adhoc_map
+    if map_data is load_map_data():
+        return load_compiled_map()
+    if _adhoc_map is None or _adhoc_map[0] is not map_data:
+        _adhoc_map = (map_data,
+                      CompiledMap.from_map_data(map_data))
+    return _adhoc_map[1]
+
+
+def load_topology():
+    """Topologia compilada do mapa atual, compartilhada enquanto ele não mudar."""
+    return load_compiled_map().topology
+
+
+def preload():
+    """
+    Carrega mapa, missões e mapa compilado no cache. Chamado antes de criar
+    processos com fork, os filhos herdam tudo já pronto.
+    """
+    load_map_data()
+    load_missions()
+    load_compiled_map()
+
+
+def clear_cache():
+    global _adhoc_map
+    _cache.clear()
+    _compiled_maps.clear()
+    _adhoc_map = None
@@ -0,0 +1,261 @@
+"""
+Ambiente vetorizado: N partidas independentes avançando juntas.
+
+Todo o estado fica em arrays NumPy (jogos x territórios) e cada `step`
+processa todas as partidas com operações em lote, sem laço Python por
+jogo. As fases são as de `Game` (colocação, ataque, deslocamento), com as
+mesmas simplificações do TurnSimulator da busca: os exércitos recebidos vão
+para um território, cada ataque é uma rodada de dados com o máximo de
+exércitos e o deslocamento move as tropas livres por uma fronteira.
+Cartas e missões não entram; vence quem ficar com o mapa inteiro.
+
+Ações (um inteiro por jogo):
+    0 .. T-1        colocar os exércitos no território t
+    T .. T+E-1      atacar / deslocar pela aresta e (ordem CSR da topologia)
+    T+E             encerrar a fase
+
+Requer NumPy (extra "sim").
+"""
+from .enums import PHASE_PLACE_ARMIES, PHASE_ATTACK, PHASE_MOVE
+from .dice import MAX_ATTACK_DICE, MAX_DEFENSE_DICE
+from .state import NO_OWNER
+from .utils_data import load_topology
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional (extra "sim")
+    np = None
+
+
+class VecEnv:
+    """
+    `num_envs` partidas de `players` jogadores sobre a mesma topologia.
+
+    Observações, máscaras, recompensas e fins de partida são buffers
+    alocados uma vez e sobrescritos a cada passo, então a memória não cresce
+    com o número de passos. Partidas terminadas recomeçam sozinhas.
+    """
+
+    def __init__(self, num_envs, players=3, topology=None, seed=None,
+                 max_turns=500):
+        if np is None:
+            raise ImportError(
+                "NumPy é necessário para o VecEnv "
+                "(pip install war-board-game[sim])")
+        if players < 2:
+            raise ValueError("O VecEnv precisa de pelo menos 2 jogadores")
+        if topology is None:
+            topology = load_topology()
+        self.topology = topology
+        self.num_envs = num_envs
+        self.num_players = players
+        self.max_turns = max_turns
+        self.rng = np.random.default_rng(seed)
+
+        size = len(topology)
+        self.num_territories = size
+        self.edge_src = np.repeat(
+            np.arange(size, dtype=np.intp),
+            np.diff(np.frombuffer(topology.offsets, dtype=np.int32)))
+        self.edge_dst = np.frombuffer(topology.neighbors,
+                                      dtype=np.int32).astype(np.intp)
+        self.num_edges = len(self.edge_dst)
+        self.end_action = size + self.num_edges
+        self.num_actions = self.end_action + 1
+
+        self.owner = np.full((num_envs, size), NO_OWNER, dtype=np.int16)
+        self.troops = np.zeros((num_envs, size), dtype=np.int32)
+        self.owned_count = np.zeros((num_envs, players), dtype=np.int32)
+        self.player = np.zeros(num_envs, dtype=np.int16)
+        self.phase = np.zeros(num_envs, dtype=np.int8)
+        self.armies = np.zeros(num_envs, dtype=np.int32)
+        self.turns = np.zeros(num_envs, dtype=np.int32)
+
+        self.masks = np.zeros((num_envs, self.num_actions), dtype=bool)
+        self.rewards = np.zeros((num_envs, players), dtype=np.float32)
+        self.dones = np.zeros(num_envs, dtype=bool)
+        self.winners = np.full(num_envs, NO_OWNER, dtype=np.int16)
+        self._rows = np.arange(num_envs)
+
+    # Estado inicial
+    def reset(self):
+        """Recomeça todas as partidas; retorna (observações, máscaras)."""
+        self._reset_rows(self._rows)
+        return self.observe(), self.action_masks()
+
+    def _reset_rows(self, rows):
+        if len(rows) == 0:
+            return
+        size, players = self.num_territories, self.num_players
+        # Como no Game: cartas de território embaralhadas e distribuídas em
+        # rodízio a partir do jogador seguinte ao entregador
+        order = self.rng.random((len(rows), size)).argsort(axis=1)
+        first = self.rng.integers(0, players, len(rows))
+        deal = (first[:, None] + np.arange(size)[None, :]) % players
+        owner = np.empty((len(rows), size), dtype=np.int16)
+        np.put_along_axis(owner, order, deal.astype(np.int16), axis=1)
+        self.owner[rows] = owner
+        self.troops[rows] = 1
+        self.owned_count[rows] = (
+            owner[:, :, None] == np.arange(players)[None, None, :]).sum(axis=1)
+        self.player[rows] = first
+        self.turns[rows] = 0
+        self._start_turn(rows)
+
+    def load_game(self, index, game, player=None, phase=PHASE_PLACE_ARMIES):
+        """
+        Copia o tabuleiro de um `Game` para a partida `index`; `player` é o
+        jogador da vez (padrão: o seguinte ao entregador).
+        """
+        state = game.state
+        if len(state.players) != self.num_players:
+            raise ValueError("O jogo tem outro número de jogadores")
+        if player is None:
+            player = game.players[game.start_game()]
+        self.owner[index] = np.frombuffer(state.owner, dtype=np.int16)
+        self.troops[index] = np.frombuffer(state.troops, dtype=np.int32)
+        self.owned_count[index] = np.frombuffer(state.owned_count,
+                                                dtype=np.int32)
+        self.player[index] = state.player_index(player)
+        self.turns[index] = 0
+        self.phase[index] = phase
+        self.armies[index] = 0
+        if phase == PHASE_PLACE_ARMIES:
+            self.armies[index] = max(self.owned_count[index,
+                                                      self.player[index]] // 2, 1)
+        self.action_masks()
+
+    # Observações
+    def observe(self):
+        """
+        Observação do ponto de vista do jogador da vez: {'owner': dono
+        relativo (0 = eu, 1 = próximo...), 'troops', 'phase', 'armies'}.
+        """
+        relative = (self.owner - self.player[:, None]) % self.num_players
+        relative[self.owner == NO_OWNER] = NO_OWNER
+        return {'owner': relative, 'troops': self.troops,
+                'phase': self.phase, 'armies': self.armies}
+
+    def action_masks(self):
+        """Máscara (jogos x ações) das ações permitidas na fase atual."""
+        masks = self.masks
+        masks[:] = False
+        mine = self.owner == self.player[:, None]
+        size = self.num_territories
+        placing = self.phase == PHASE_PLACE_ARMIES
+        masks[:, :size] = mine & placing[:, None]
+
+        can_leave = mine[:, self.edge_src] & (self.troops[:, self.edge_src] > 1)
+        target_mine = mine[:, self.edge_dst]
+        attacking = (self.phase == PHASE_ATTACK)[:, None]
+        moving = (self.phase == PHASE_MOVE)[:, None]
+        masks[:, size:self.end_action] = can_leave & (
+            (attacking & ~target_mine) | (moving & target_mine))
+        masks[:, self.end_action] = ~placing
+        return masks
+
+    # Passo
+    def step(self, actions):
+        """
+        Aplica uma ação por partida. Retorna (observações, máscaras,
+        recompensas por jogador, fins de partida). Vitória vale +1 para o
+        vencedor e -1 para os outros; partidas terminadas (ou que chegaram a
+        `max_turns`) recomeçam e `winners` guarda quem venceu.
+        """
+        actions = np.asarray(actions, dtype=np.intp)
+        if not self.masks[self._rows, actions].all():
+            raise ValueError("Ação não permitida em alguma partida")
+        size = self.num_territories
+        phase = self.phase.copy()
+        is_edge = (actions >= size) & (actions < self.end_action)
+        is_end = actions == self.end_action
+        edges = np.where(is_edge, actions - size, 0)
+
+        rows = np.flatnonzero(phase == PHASE_PLACE_ARMIES)
+        self.troops[rows, actions[rows]] += self.armies[rows]
+        self.armies[rows] = 0
+        self.phase[rows] = PHASE_ATTACK
+
+        rows = np.flatnonzero((phase == PHASE_ATTACK) & is_edge)
+        self._attack(rows, edges[rows])
+
+        rows = np.flatnonzero((phase == PHASE_MOVE) & is_edge)
+        source, target = self.edge_src[edges[rows]], self.edge_dst[edges[rows]]
+        moving = self.troops[rows, source] - 1
+        self.troops[rows, source] -= moving
+        self.troops[rows, target] += moving
+
+        self.phase[(phase == PHASE_ATTACK) & is_end] = PHASE_MOVE
+        self._next_turn(np.flatnonzero((phase == PHASE_MOVE)
+                                       & (is_edge | is_end)))
+
+        self._finish_games()
+        return self.observe(), self.action_masks(), self.rewards, self.dones
+
+    def _attack(self, rows, edges):
+        if len(rows) == 0:
+            return
+        source, target = self.edge_src[edges], self.edge_dst[edges]
+        attack_dice = np.minimum(self.troops[rows, source] - 1,
+                                 MAX_ATTACK_DICE)
+        defense_dice = np.minimum(self.troops[rows, target], MAX_DEFENSE_DICE)
+
+        # Todos os dados de uma vez; os não usados valem 0 e ficam no fim
+        rolls = self.rng.integers(
+            1, 7, (len(rows), MAX_ATTACK_DICE + MAX_DEFENSE_DICE))
+        attack = np.where(np.arange(MAX_ATTACK_DICE) < attack_dice[:, None],
+                          rolls[:, :MAX_ATTACK_DICE], 0)
+        defense = np.where(np.arange(MAX_DEFENSE_DICE) < defense_dice[:, None],
+                           rolls[:, MAX_ATTACK_DICE:], 0)
+        attack = -np.sort(-attack, axis=1)[:, :MAX_DEFENSE_DICE]
+        defense = -np.sort(-defense, axis=1)
+        pairs = np.arange(MAX_DEFENSE_DICE) < np.minimum(
+            attack_dice, defense_dice)[:, None]
+        wins = attack > defense  # empate favorece a defesa
+        defender_losses = (pairs & wins).sum(axis=1)
+        attacker_losses = (pairs & ~wins).sum(axis=1)
+        self.troops[rows, source] -= attacker_losses
+        self.troops[rows, target] -= defender_losses
+
+        conquered = self.troops[rows, target] <= 0
+        rows, source, target = rows[conquered], source[conquered], target[conquered]
+        survivors = (attack_dice - attacker_losses)[conquered]
+        old_owner = self.owner[rows, target]
+        new_owner = self.player[rows]
+        self.owner[rows, target] = new_owner
+        np.add.at(self.owned_count, (rows, old_owner), -1)
+        np.add.at(self.owned_count, (rows, new_owner), 1)
+        self.troops[rows, source] -= survivors
+        self.troops[rows, target] = survivors
+
+    def _next_turn(self, rows):
+        if len(rows) == 0:
+            return
+        player = self.player[rows].astype(np.intp)
+        chosen = np.full(len(rows), -1, dtype=np.intp)
+        for offset in range(1, self.num_players + 1):
+            candidate = (player + offset) % self.num_players
+            alive = (self.owned_count[rows, candidate] > 0) & (chosen < 0)
+            chosen[alive] = candidate[alive]
+        self.player[rows] = np.where(chosen < 0, player, chosen)
+        self.turns[rows] += 1
+        self._start_turn(rows)
+
+    def _start_turn(self, rows):
+        # Mesma regra de Game.calculate_armies_to_receive
+        self.phase[rows] = PHASE_PLACE_ARMIES
+        self.armies[rows] = np.maximum(
+            self.owned_count[rows, self.player[rows]] // 2, 1)
+
+    def _finish_games(self):
+        won = self.owned_count.max(axis=1) == self.num_territories
+        self.dones[:] = won | (self.turns >= self.max_turns)
+        self.rewards[:] = 0
+        self.winners[:] = NO_OWNER
+        rows = np.flatnonzero(won)
+        if len(rows):
+            winners = self.owned_count[rows].argmax(axis=1)
+            self.winners[rows] = winners
+            self.rewards[rows] = -1
+            self.rewards[rows, winners] = 1
+        self._reset_rows(np.flatnonzero(self.dones))
@@ -0,0 +1,84 @@
+"""
+Chaves de Zobrist para o hash incremental de posições.
+
+O hash de uma posição é o XOR de uma chave aleatória de 64 bits por
+(território, dono), por (território, faixa de tropas), pelo jogador e fase
+do turno e, opcionalmente, por carta na mão de cada jogador. Mudar um
+território troca só as suas chaves, então atualizar o hash custa O(1).
+"""
+from array import array
+from functools import lru_cache
+from .rng import GameRandom
+
+# Semente fixa: as mesmas chaves em todos os jogos e processos, para que
+# hashes de partidas diferentes possam ser comparados
+ZOBRIST_SEED = 0x5741520
+
+MAX_PLAYERS = 8
+PHASE_COUNT = 5  # fases de war.enums (0 = fora de turno)
+JOKER_COUNT = 2
+
+# Limite inferior de cada faixa de tropas. Até 4 as faixas são exatas (é o
+# que muda a quantidade de dados no combate), depois ficam mais largas
+TROOP_BUCKET_LIMITS = (1, 2, 3, 4, 5, 7, 10, 15, 20, 30, 50)
+TROOP_BUCKETS = len(TROOP_BUCKET_LIMITS) + 1
+
+_BUCKET_OF = array('b', [0]) * (TROOP_BUCKET_LIMITS[-1] + 1)
+for _troops in range(len(_BUCKET_OF)):
+    _BUCKET_OF[_troops] = sum(1 for limit in TROOP_BUCKET_LIMITS
+                              if _troops >= limit)
+
+
+def troop_bucket(troops):
+    """Faixa de uma quantidade de tropas."""
+    if troops >= len(_BUCKET_OF):
+        return TROOP_BUCKETS - 1
+    return _BUCKET_OF[troops] if troops > 0 else 0
+
+
+class ZobristKeys:
+    """Tabelas de chaves de um mapa com `territory_count` territórios."""
+
+    def __init__(self, territory_count, max_players=MAX_PLAYERS,
+                 card_count=None, seed=ZOBRIST_SEED):
+        rng = GameRandom(seed)
+        if card_count is None:
+            card_count = territory_count + JOKER_COUNT
+
+        def keys(count):
+            return array('Q', [rng.getrandbits(64) for _ in range(count)])
+
+        self.territory_count = territory_count
+        self.max_players = max_players
+        self.card_count = card_count
+        # Dono NO_OWNER (-1) usa a coluna 0
+        self.owner = keys(territory_count * (max_players + 1))
+        self.troops = keys(territory_count * TROOP_BUCKETS)
+        self.turn = keys(max_players * PHASE_COUNT)
+        self.cards = keys(max_players * card_count)
+
+    def owner_key(self, territory_id, owner):
+        return self.owner[territory_id * (self.max_players + 1) + owner + 1]
+
+    def troop_key(self, territory_id, troops):
+        return self.troops[territory_id * TROOP_BUCKETS + troop_bucket(troops)]
+
+    def turn_key(self, player_index, phase):
+        return self.turn[player_index * PHASE_COUNT + phase]
+
+    def card_key(self, player_index, card_index):
+        return self.cards[player_index * self.card_count + card_index]
+
+    def board_hash(self, owners, troops):
+        """Hash completo do tabuleiro (O(territórios); use na inicialização)."""
+        value = 0
+        for territory_id, owner in enumerate(owners):
+            value ^= self.owner_key(territory_id, owner)
+            value ^= self.troop_key(territory_id, troops[territory_id])
+        return value
+
+
+@lru_cache(maxsize=None)
+def zobrist_keys(territory_count):
+    """Chaves compartilhadas por todos os jogos de um mesmo mapa."""
+    return ZobristKeys(territory_count)